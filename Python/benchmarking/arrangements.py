@@ -0,0 +1,114 @@
+from time import perf_counter
+from typing import Callable, Dict
+import numpy as np
+from tdw.controller import Controller
+from tdw.librarian import ModelLibrarian, SceneLibrarian
+from tdw.cardinal_direction import CardinalDirection
+from tdw.ordinal_direction import OrdinalDirection
+from tdw.add_ons.proc_gen_kitchen import ProcGenKitchen
+from tdw.proc_gen.arrangements.arrangement import Arrangement
+from tdw.proc_gen.arrangements.cabinetry.cabinetry import CABINETRY
+from tdw.proc_gen.arrangements.cabinetry.cabinetry_type import CabinetryType
+from tdw.proc_gen.arrangements.basket import Basket
+from tdw.proc_gen.arrangements.cup_and_coaster import CupAndCoaster
+from tdw.proc_gen.arrangements.dishwasher import Dishwasher
+from tdw.proc_gen.arrangements.kitchen_counter import KitchenCounter
+from tdw.proc_gen.arrangements.kitchen_counter_top import KitchenCounterTop
+from tdw.proc_gen.arrangements.kitchen_table import KitchenTable
+from tdw.proc_gen.arrangements.microwave import Microwave
+from tdw.proc_gen.arrangements.painting import Painting
+from tdw.proc_gen.arrangements.plate import Plate
+from tdw.proc_gen.arrangements.radiator import Radiator
+from tdw.proc_gen.arrangements.refrigerator import Refrigerator
+from tdw.proc_gen.arrangements.shelf import Shelf
+from tdw.proc_gen.arrangements.side_table import SideTable
+from tdw.proc_gen.arrangements.sink import Sink
+from tdw.proc_gen.arrangements.stack_of_plates import StackOfPlates
+from tdw.proc_gen.arrangements.stool import Stool
+from tdw.proc_gen.arrangements.stove import Stove
+from tdw.proc_gen.arrangements.suitcase import Suitcase
+from tdw.proc_gen.arrangements.table_setting import TableSetting
+from tdw.proc_gen.arrangements.void import Void
+from tdw.proc_gen.arrangements.wall_cabinet import WallCabinet
+
+
+"""
+Procedural generation benchmarks. This doesn't require a build.
+
+Generate the commands for each `Arrangement` subclass and for entire `ProcGenKitchen` scenes.
+Each arrangement is generated with the same random seeds, so the results can be compared between versions of TDW.
+
+This will output the average time in milliseconds per arrangement.
+"""
+
+
+def benchmark(create: Callable[[np.random.RandomState], Arrangement], num_trials: int) -> float:
+    """
+    :param create: A function that creates an arrangement from a random number generator.
+    :param num_trials: The number of trials.
+
+    :return: The average time in milliseconds to create the arrangement and get its commands.
+    """
+
+    t = 0
+    for seed in range(num_trials):
+        rng = np.random.RandomState(seed)
+        t0 = perf_counter()
+        create(rng).get_commands()
+        t += perf_counter() - t0
+    return t / num_trials * 1000
+
+
+if __name__ == "__main__":
+    # `models_full.json` is only available with valid S3 credentials.
+    # It's used to derive the physics values of models without default physics values.
+    if "models_full.json" not in Controller.MODEL_LIBRARIANS:
+        try:
+            Controller.MODEL_LIBRARIANS["models_full.json"] = ModelLibrarian("models_full.json")
+        except FileNotFoundError:
+            Controller.MODEL_LIBRARIANS["models_full.json"] = ModelLibrarian("models_core.json")
+    if "scenes.json" not in Controller.SCENE_LIBRARIANS:
+        Controller.SCENE_LIBRARIANS["scenes.json"] = SceneLibrarian()
+    room = Controller.SCENE_LIBRARIANS["scenes.json"].get_record("mm_kitchen_2a").rooms[0]
+    region = room.main_region
+    cabinetry = CABINETRY[CabinetryType.beech_honey]
+    on_wall = {"corner": OrdinalDirection.northwest,
+               "wall": CardinalDirection.north,
+               "distance": Arrangement.DEFAULT_CELL_SIZE,
+               "region": region}
+    on_counter = {"x": region.center[0], "y": 0.9, "z": region.center[2]}
+    arrangements: Dict[str, Callable[[np.random.RandomState], Arrangement]] = {
+        "Basket": lambda r: Basket(rng=r, **on_wall),
+        "CupAndCoaster": lambda r: CupAndCoaster(position=on_counter, rng=r),
+        "Dishwasher": lambda r: Dishwasher(rng=r, **on_wall),
+        "KitchenCounter": lambda r: KitchenCounter(cabinetry=cabinetry, rng=r, **on_wall),
+        "KitchenCounterTop": lambda r: KitchenCounterTop(cabinetry=cabinetry, rng=r, **on_wall),
+        "KitchenTable": lambda r: KitchenTable(room=room, used_walls=CardinalDirection.north, rng=r),
+        "Microwave": lambda r: Microwave(wall=CardinalDirection.north, position=on_counter, rng=r),
+        "Painting": lambda r: Painting(rng=r, **on_wall),
+        "Plate": lambda r: Plate(position=on_counter, rng=r),
+        "Radiator": lambda r: Radiator(rng=r, **on_wall),
+        "Refrigerator": lambda r: Refrigerator(rng=r, **on_wall),
+        "Shelf": lambda r: Shelf(rng=r, **on_wall),
+        "SideTable": lambda r: SideTable(rng=r, **on_wall),
+        "Sink": lambda r: Sink(cabinetry=cabinetry, rng=r, **on_wall),
+        "StackOfPlates": lambda r: StackOfPlates(position=on_counter, rng=r),
+        "Stool": lambda r: Stool(rng=r, **on_wall),
+        "Stove": lambda r: Stove(rng=r, **on_wall),
+        "Suitcase": lambda r: Suitcase(rng=r, **on_wall),
+        "TableSetting": lambda r: TableSetting(position=on_counter, rng=r),
+        "Void": lambda r: Void(**on_wall),
+        "WallCabinet": lambda r: WallCabinet(cabinetry=cabinetry, rng=r, **on_wall)}
+    output = "| Arrangement | Time (ms) |\n| --- | --- |\n"
+    for name in arrangements:
+        output += f"| {name} | {round(benchmark(create=arrangements[name], num_trials=50), 3)} |\n"
+    # Generate entire kitchens.
+    t = 0
+    num_kitchens = 20
+    for seed in range(num_kitchens):
+        proc_gen_kitchen = ProcGenKitchen()
+        t0 = perf_counter()
+        proc_gen_kitchen.create(rng=seed)
+        t += perf_counter() - t0
+    output += f"| ProcGenKitchen | {round(t / num_kitchens * 1000, 3)} |\n"
+    print(output)
@@ -1,5 +1,5 @@
 from copy import copy
-from typing import List, Dict, Union, Optional
+from typing import List, Dict, Union, Optional, Tuple
 import numpy as np
 from tdw.add_ons.add_on import AddOn
 from tdw.tdw_utils import TDWUtils
@@ -7,6 +7,7 @@ from tdw.output_data import OutputData, SegmentationColors, Bounds, StaticRigidb
 from tdw.physics_audio.impact_material import ImpactMaterial
 from tdw.physics_audio.scrape_model import ScrapeModel, DEFAULT_SCRAPE_MODELS
 from tdw.physics_audio.clatter_object import ClatterObject, DEFAULT_OBJECTS
+from tdw.physics_audio.audio_value_index import AudioValueIndex
 from tdw.librarian import MaterialLibrarian, ModelRecord
 
 
@@ -109,6 +110,8 @@ class Clatter(AddOn):
         self._dsp_buffer_size: int = dsp_buffer_size
         self._roll_substitute: str = roll_substitute
         self._initialized_clatter: bool = False
+        # Derived audio values per scene. This isn't cleared in `reset()`.
+        self._derived_audio_values: Dict[tuple, Dict[int, Optional[Tuple[float, ImpactMaterial, float]]]] = dict()
 
     def get_initialization_commands(self) -> List[dict]:
         return [{"$type": "send_segmentation_colors"},
@@ -201,37 +204,25 @@ class Clatter(AddOn):
                     self._objects[object_id].scrape_model = scrape_models[object_id]
                 else:
                     need_to_derive.append(object_id)
-            current_values = self._objects.values()
+            # Derive audio values from comparable objects. Reuse the values if this is a repeated scene.
+            known = {k: (v.amp, v.impact_material, v.resonance) for k, v in self._objects.items()}
+            scene_key = AudioValueIndex.get_scene_key(categories=categories, masses=object_masses, known=known)
+            if scene_key not in self._derived_audio_values:
+                if len(self._derived_audio_values) >= AudioValueIndex.MAX_NUM_CACHED_SCENES:
+                    del self._derived_audio_values[next(iter(self._derived_audio_values))]
+                index = AudioValueIndex(categories=categories, masses=object_masses, known=known)
+                self._derived_audio_values[scene_key] = {object_id: index.get_values(object_id=object_id)
+                                                         for object_id in need_to_derive}
+            derived_values = self._derived_audio_values[scene_key]
             derived_data: Dict[int, ClatterObject] = dict()
             for object_id in need_to_derive:
-                # Fallback option: comparable objects in the same category.
-                objects_in_same_category = [o for o in categories if categories[o] == categories[object_id]]
-                if len(objects_in_same_category) > 0:
-                    amps: List[float] = [a.amp for a in current_values]
-                    materials: List[ImpactMaterial] = [a.impact_material for a in current_values]
-                    resonances: List[float] = [a.resonance for a in current_values]
-                # Fallback option: Find objects with similar volume.
-                else:
-                    amps: List[float] = list()
-                    materials: List[ImpactMaterial] = list()
-                    resonances: List[float] = list()
-                    for m_id in object_masses:
-                        if m_id == object_id or m_id not in self._objects:
-                            continue
-                        if np.abs(object_masses[m_id] / object_masses[object_id]) < 1.5:
-                            amps.append(self._objects[m_id].amp)
-                            materials.append(self._objects[m_id].impact_material)
-                            resonances.append(self._objects[m_id].resonance)
                 # Fallback option: Use default values.
-                if len(amps) == 0:
+                if derived_values[object_id] is None:
                     amp: float = self._default_object.amp
                     material: ImpactMaterial = self._default_object.impact_material
                     resonance: float = self._default_object.resonance
-                # Get averages or maximums of each value.
                 else:
-                    amp: float = round(sum(amps) / len(amps), 3)
-                    material: ImpactMaterial = max(set(materials), key=materials.count)
-                    resonance: float = round(sum(resonances) / len(resonances), 3)
+                    amp, material, resonance = derived_values[object_id]
                 derived_data[object_id] = ClatterObject(impact_material=material,
                                                         size=Clatter.get_size(model=extents[object_id]),
                                                         amp=amp,
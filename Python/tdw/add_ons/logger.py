@@ -1,8 +1,8 @@
 from pathlib import Path
 from typing import List
-from json import dumps
 from tdw.output_data import OutputData, LogMessage
 from tdw.add_ons.add_on import AddOn
+from tdw.pre_serialized_command import PreSerializedCommand
 from tdw.type_aliases import PATH
 
 
@@ -64,7 +64,7 @@ class Logger(AddOn):
     def before_send(self, commands: List[dict]) -> None:
         # Log the commands.
         with self._path.open("at", encoding="utf-8") as f:
-            f.write(dumps(commands) + "\n")
+            f.write(PreSerializedCommand.serialize(commands).decode("utf-8") + "\n")
 
     def reset(self, path: PATH, overwrite: bool = True) -> None:
         """
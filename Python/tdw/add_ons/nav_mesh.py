@@ -1,5 +1,6 @@
+from hashlib import sha256
 from typing import List, Dict
-from tdw.tdw_utils import TDWUtils
+import numpy as np
 from tdw.add_ons.add_on import AddOn
 from tdw.output_data import OutputData, StaticRigidbodies, Bounds, StaticRobot
 
@@ -11,7 +12,16 @@ class NavMesh(AddOn):
     Each NavMeshObstacle will be set according to the position, size, and kinematic state of the object.
 
     This add-on requires 2 `communicate(commands)` calls to initialize.
+
+    Obstacles are classified with numpy array operations over all of the objects at once. The resulting commands are cached, so if the scene's objects and the add-on's parameters are the same as in a previous episode, the classification is skipped.
+    """
+
+    """:class_var
+    The maximum number of scenes for which obstacle commands are cached. The least recently used scene is evicted first.
     """
+    MAX_NUM_CACHED_SCENES: int = 8
+    # Cached obstacle commands, ordered from least to most recently used. Key = A hash of the output data and the parameters. Value = A list of commands.
+    _OBSTACLE_COMMANDS: Dict[str, List[dict]] = dict()
 
     def __init__(self, exclude_objects: List[int] = None, max_y: float = 0.1, exclude_area: float = 0.05,
                  small_area: float = 1, small_area_scale: float = 1, large_area_scale: float = 1.25,
@@ -51,56 +61,89 @@ class NavMesh(AddOn):
         if self._made_nav_mesh_obstacles:
             return
         self._made_nav_mesh_obstacles = True
-        areas: Dict[int, float] = dict()
-        kinematics: Dict[int, bool] = dict()
-        boxes: Dict[int, bool] = dict()
+        bounds_ids = np.zeros(shape=0, dtype=np.int32)
+        bounds_positions = np.zeros(shape=(0, 7, 3), dtype=np.float32)
+        kinematic_ids = np.zeros(shape=0, dtype=np.int32)
+        kinematics = np.zeros(shape=0, dtype=bool)
         robots: List[int] = list()
         for i in range(len(resp) - 1):
             r_id = OutputData.get_data_type_id(resp[i])
             # Use bounds data to sort objects by position and area.
             if r_id == "boun":
                 bounds = Bounds(resp[i])
-                for j in range(bounds.get_num()):
-                    bottom = bounds.get_bottom(j)[1]
-                    object_id = bounds.get_id(j)
-                    # Objects below the floor, objects that are too high up, or excluded objects.
-                    if bottom <= -0.1 or bottom > self._max_y or object_id in self._exclude_objects:
-                        continue
-                    # Get the area.
-                    extents = TDWUtils.get_bounds_extents(bounds, j)
-                    area = extents[0] * extents[2]
-                    # Ignore small objects.
-                    if area < self._exclude_area:
-                        continue
-                    # Remember the area.
-                    areas[object_id] = area
-                    # Get the roundness
-                    if extents[0] < extents[2]:
-                        roundness = extents[0] / extents[2]
-                    else:
-                        roundness = extents[2] / extents[0]
-                    boxes[object_id] = roundness < self._roundness_threshold
+                bounds_ids = bounds.get_ids()
+                bounds_positions = bounds.get_bounds_positions()
             # Use static rigidbodies data to sort objects by kinematic state.
             elif r_id == "srig":
                 static_rigidbodies = StaticRigidbodies(resp[i])
-                for j in range(static_rigidbodies.get_num()):
-                    kinematics[static_rigidbodies.get_id(j)] = static_rigidbodies.get_kinematic(j)
+                kinematic_ids = static_rigidbodies.get_ids()
+                kinematics = static_rigidbodies.get_kinematics().astype(bool)
             # Ignore all robots.
             elif r_id == "srob":
                 robots.append(StaticRobot(resp[i]).get_id())
-        for object_id in areas:
-            if object_id not in kinematics:
-                continue
-            # Make the obstacle. For smaller objects, make the obstacle half-scale.
-            self.commands.append({"$type": "make_nav_mesh_obstacle",
-                                  "id": object_id,
-                                  "carve_type": "all",
-                                  "scale": self._small_area_scale if areas[object_id] < self._small_area and not kinematics[object_id] else self._large_area_scale,
-                                  "shape": "box" if boxes[object_id] else "capsule"})
+        # Use cached commands if the objects and parameters haven't changed.
+        h = sha256()
+        for a in [bounds_ids, bounds_positions, kinematic_ids, kinematics,
+                  np.array(self._exclude_objects, dtype=np.int64),
+                  np.array([self._max_y, self._small_area, self._small_area_scale, self._large_area_scale,
+                            self._exclude_area, self._roundness_threshold])]:
+            h.update(np.ascontiguousarray(a).tobytes())
+        key = h.hexdigest()
+        if key in NavMesh._OBSTACLE_COMMANDS:
+            # Mark the scene as the most recently used.
+            NavMesh._OBSTACLE_COMMANDS[key] = NavMesh._OBSTACLE_COMMANDS.pop(key)
+        else:
+            if len(NavMesh._OBSTACLE_COMMANDS) >= NavMesh.MAX_NUM_CACHED_SCENES:
+                del NavMesh._OBSTACLE_COMMANDS[next(iter(NavMesh._OBSTACLE_COMMANDS))]
+            NavMesh._OBSTACLE_COMMANDS[key] = self._get_obstacle_commands(bounds_ids=bounds_ids,
+                                                                          bounds_positions=bounds_positions,
+                                                                          kinematic_ids=kinematic_ids,
+                                                                          kinematics=kinematics)
+        self.commands.extend([{k: v for k, v in command.items()} for command in NavMesh._OBSTACLE_COMMANDS[key]])
         # Bake the NavMesh.
         self.commands.append({"$type": "bake_nav_mesh",
                               "ignore": robots})
 
+    def _get_obstacle_commands(self, bounds_ids: np.ndarray, bounds_positions: np.ndarray, kinematic_ids: np.ndarray,
+                               kinematics: np.ndarray) -> List[dict]:
+        """
+        :param bounds_ids: The object IDs in the bounds output data.
+        :param bounds_positions: The bounds positions of each object. See: `Bounds.get_bounds_positions()`.
+        :param kinematic_ids: The object IDs in the static rigidbodies output data.
+        :param kinematics: The kinematic state of each object in the static rigidbodies output data.
+
+        :return: A list of `make_nav_mesh_obstacle` commands.
+        """
+
+        bottoms = bounds_positions[:, 5, 1]
+        # Get the width (left to right) and length (front to back) of each object.
+        widths = np.linalg.norm(bounds_positions[:, 3] - bounds_positions[:, 2], axis=1)
+        lengths = np.linalg.norm(bounds_positions[:, 0] - bounds_positions[:, 1], axis=1)
+        areas = widths * lengths
+        # Ignore objects below the floor, objects that are too high up, excluded objects, small objects, and objects without rigidbodies.
+        mask = (bottoms > -0.1) & (bottoms <= self._max_y) & np.logical_not(np.isin(bounds_ids, self._exclude_objects)) & \
+               (areas >= self._exclude_area) & np.isin(bounds_ids, kinematic_ids)
+        indices = np.nonzero(mask)[0]
+        if len(indices) == 0:
+            return []
+        # Get the kinematic state of each object.
+        sorter = np.argsort(kinematic_ids)
+        is_kinematic = kinematics[sorter[np.searchsorted(kinematic_ids, bounds_ids[indices], sorter=sorter)]]
+        # Get the roundness of each object.
+        w = widths[indices]
+        l = lengths[indices]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            roundness = np.where(w < l, w / l, l / w)
+        boxes = roundness < self._roundness_threshold
+        # For smaller objects, make the obstacle half-scale.
+        scales = np.where((areas[indices] < self._small_area) & np.logical_not(is_kinematic),
+                          self._small_area_scale, self._large_area_scale)
+        return [{"$type": "make_nav_mesh_obstacle",
+                 "id": int(object_id),
+                 "carve_type": "all",
+                 "scale": float(scale),
+                 "shape": "box" if box else "capsule"} for object_id, scale, box in zip(bounds_ids[indices], scales, boxes)]
+
     def reset(self, exclude_objects: List[int] = None) -> None:
         """
         Call this to reset the add-on.
@@ -1,7 +1,7 @@
-from typing import Dict, List
+from typing import Dict, List, Optional, Union, Set
 import numpy as np
 from tdw.output_data import OutputData, Transforms, Rigidbodies, Bounds, SegmentationColors, Categories, \
-    StaticRigidbodies
+    StaticRigidbodies, Collision
 from tdw.add_ons.add_on import AddOn
 from tdw.object_data.object_static import ObjectStatic
 from tdw.object_data.transform import Transform
@@ -56,6 +56,20 @@ class ObjectManager(AddOn):
     - This add-on will record data for *all* objects in the scene. If you only need data for specific objects, you should use low-level TDW commands.
     - By default, this add-on will record [transform data](../object_data/transform.md) but not [rigidbody data](../object_data/rigidbody.md) or [bounds data](../object_data/bound.md). You can set which data the add-on will record in the constructor, but be aware that this can slow down the simulation.
 
+    ## Arrays
+
+    If `arrays=True` in the constructor, dynamic data is copied every frame into preallocated numpy arrays (`self.positions`, `self.rotations`, `self.velocities`, `self.bounds_positions`, etc.) in which each row is an object (see `self.object_ids` and `self.rows`). This is much faster than creating a `Transform`, `Rigidbody`, and `Bound` per object per frame. `self.transforms`, `self.rigidbodies`, and `self.bounds` are still available but are only created when they are accessed.
+
+    ## History
+
+    If `history` is greater than 0 in the constructor, the add-on also records the positions, rotations, velocities, angular velocities, and sleep states of the last `history` frames in fixed-capacity ring buffers (this implies `arrays=True`). The buffers are allocated once in the constructor with room for `max_objects` objects, so they use `history * max_objects * 53` bytes regardless of how long the simulation runs. Use `get_history()` to get the raw data, or `get_finite_difference_velocities()`, `get_finite_difference_accelerations()`, `get_displacements()`, and `get_at_rest()` to query every object at once.
+
+    ## Adaptive mode
+
+    If `adaptive=True` in the constructor, the add-on requests per-frame transform and rigidbody data only for objects that are awake. Sleeping objects and kinematic objects are refreshed once every `refresh_interval` frames; in between, their data is the data from the most recent frame on which they were awake or refreshed. An object is re-subscribed as soon as a command that targets it (any command with an `"id"` parameter) is sent, or when it is in a collision with an awake object. The add-on doesn't request collision data itself; to wake objects on collision, add a [`CollisionManager`](collision_manager.md) or send `send_collisions`. Adaptive mode always requests rigidbody data because it needs each object's sleep state.
+
+    Transform and rigidbody subscriptions are global in the build: a `send_transforms` or `send_rigidbodies` command replaces any previous request, including requests from other add-ons. For this reason, adaptive mode checks the commands sent on every frame for requests made by other add-ons or by the controller. If another add-on requests transforms or rigidbodies for every object per frame (for example, a [`Drone`](drone.md), a [`Vehicle`](vehicle.md), a [`Replicant`](replicant.md), or [`PyImpact`](py_impact.md)), adaptive mode is disabled until `reset()` is called and the add-on always requests data for every object. If another add-on requests data only for some objects (with an `"ids"` parameter), those objects are always included in the add-on's requests.
+
     ## Example usage
 
     ```python
@@ -98,17 +112,27 @@ class ObjectManager(AddOn):
     c.communicate({"$type": "terminate"})
     ```
     """
-    def __init__(self, transforms: bool = True, rigidbodies: bool = False, bounds: bool = False):
+    # The shape of each float array in the history per object.
+    _HISTORY_SHAPES: Dict[str, tuple] = {"positions": (3,), "rotations": (4,), "velocities": (3,),
+                                         "angular_velocities": (3,)}
+
+    def __init__(self, transforms: bool = True, rigidbodies: bool = False, bounds: bool = False, arrays: bool = False,
+                 history: int = 0, max_objects: int = 1000, adaptive: bool = False, refresh_interval: int = 30):
         """
         :param transforms: If True, record the [transform data](../object_data/transform.md) of each object in the scene.
         :param rigidbodies: If True, record the [rigidbody data](../object_data/rigidbody.md) of each rigidbody object in the scene.
         :param bounds: If True, record the [bounds data](../object_data/bound.md) of each object in the scene.
+        :param arrays: If True, store dynamic data in numpy arrays. See above.
+        :param history: The number of frames of dynamic data to record. If 0, no history is recorded. See above.
+        :param max_objects: If `history` is greater than 0, the maximum number of objects in the history. If there are more objects than this in the scene, an exception is raised.
+        :param adaptive: If True, only request per-frame data for objects that are awake. See above.
+        :param refresh_interval: If `adaptive=True`, request data for every object once per this many frames.
         """
 
         super().__init__()
         self._cached_static_data: bool = False
         self._send_transforms: str = "always" if transforms else "never"
-        self._send_rigidbodies: str = "always" if rigidbodies else "never"
+        self._send_rigidbodies: str = "always" if rigidbodies or adaptive else "never"
         self._send_bounds: str = "always" if bounds else "once"
         """:field
         [The static object data.](../object_data/object_static.md) Key = The ID of the object.
@@ -118,29 +142,160 @@ class ObjectManager(AddOn):
         The segmentation color per category as use in the _category image pass. Key = The category. Value = The color as an `[r, g, b]` numpy array.
         """
         self.categories: Dict[str, np.ndarray] = dict()
+        self._transforms: Dict[int, Transform] = dict()
+        self._rigidbodies: Dict[int, Rigidbody] = dict()
+        self._bounds: Dict[int, Bound] = dict()
+        self._arrays: bool = arrays or history > 0
+        """:field
+        If `arrays=True` in the constructor, the ID of the object in each row of the numpy arrays.
+        """
+        self.object_ids: np.ndarray = np.zeros(shape=0, dtype=np.int32)
+        """:field
+        If `arrays=True` in the constructor, the row of each object in the numpy arrays. Key = The object ID. Value = The row.
+        """
+        self.rows: Dict[int, int] = dict()
+        """:field
+        If `arrays=True` in the constructor, the position of each object as a numpy array with shape `(n, 3)`.
+        """
+        self.positions: np.ndarray = np.zeros(shape=(0, 3), dtype=np.float32)
+        """:field
+        If `arrays=True` in the constructor, the rotation of each object as a numpy array of quaternions with shape `(n, 4)`.
+        """
+        self.rotations: np.ndarray = np.zeros(shape=(0, 4), dtype=np.float32)
         """:field
-        The [transform data](../object_data/transform.md) for each object on the scene on this frame. Key = The object ID. If `transforms=False` in the constructor, this dictionary will be empty.
+        If `arrays=True` in the constructor, the forward directional vector of each object as a numpy array with shape `(n, 3)`.
         """
-        self.transforms: Dict[int, Transform] = dict()
+        self.forwards: np.ndarray = np.zeros(shape=(0, 3), dtype=np.float32)
         """:field
-        The [rigidbody data](../object_data/rigidbody.md) for each rigidbody object on the scene on this frame. Key = The object ID. If `rigidbodies=False` in the constructor, this dictionary will be empty.
+        If `arrays=True` in the constructor, the velocity of each object as a numpy array with shape `(n, 3)`.
         """
-        self.rigidbodies: Dict[int, Rigidbody] = dict()
+        self.velocities: np.ndarray = np.zeros(shape=(0, 3), dtype=np.float32)
         """:field
-        The [bounds data](../object_data/bound.md) for each object on the scene on this frame. Key = The object ID. If `bounds=False` in the constructor, this dictionary will be empty.
+        If `arrays=True` in the constructor, the angular velocity of each object as a numpy array with shape `(n, 3)`.
         """
-        self.bounds: Dict[int, Bound] = dict()
+        self.angular_velocities: np.ndarray = np.zeros(shape=(0, 3), dtype=np.float32)
+        """:field
+        If `arrays=True` in the constructor, the sleep state of each object as a boolean numpy array with shape `(n,)`.
+        """
+        self.sleeping: np.ndarray = np.zeros(shape=0, dtype=bool)
+        """:field
+        If `arrays=True` in the constructor, the bounds of each object as a numpy array with shape `(n, 7, 3)`. The second axis is ordered: front, back, right, left, top, bottom, center.
+        """
+        self.bounds_positions: np.ndarray = np.zeros(shape=(0, 7, 3), dtype=np.float32)
+        # Preallocated array buffers. The public arrays are views of these buffers.
+        self._buffers: Dict[str, np.ndarray] = dict()
+        # Key = An output data ID ("tran", "rigi", or "boun"). Value = The object IDs in the output data on the most recent frame it was received.
+        self._output_data_ids: Dict[str, np.ndarray] = dict()
+        # Key = An output data ID. Value = The row of each object in the output data, or None if the rows are in the same order as the output data.
+        self._output_data_rows: Dict[str, Optional[np.ndarray]] = dict()
+        # The output data IDs received on this frame.
+        self._received: List[str] = list()
+        # If True, `self.transforms`, `self.rigidbodies`, or `self.bounds` need to be recreated from the arrays.
+        self._transforms_dirty: bool = False
+        self._rigidbodies_dirty: bool = False
+        self._bounds_dirty: bool = False
+        self._history_length: int = history
+        self._max_objects: int = max_objects
+        """:field
+        If `history` is greater than 0 in the constructor, the total number of frames that have been recorded since the add-on was initialized or reset. This can be greater than the length of the history.
+        """
+        self.frame_count: int = 0
+        # The history ring buffers. Key = The name of an array field. Value = A numpy array with shape `(history, max_objects, ...)`.
+        self._history: Dict[str, np.ndarray] = dict()
+        if self._history_length > 0:
+            for k, shape in ObjectManager._HISTORY_SHAPES.items():
+                self._history[k] = np.full(shape=(self._history_length, self._max_objects) + shape, fill_value=np.nan,
+                                           dtype=np.float32)
+            self._history["sleeping"] = np.zeros(shape=(self._history_length, self._max_objects), dtype=bool)
+        self._adaptive: bool = adaptive
+        self._refresh_interval: int = refresh_interval
+        # The IDs of the objects whose data will be in the next response. If None, the data is for every object.
+        self._subscribed: Optional[Set[int]] = None
+        # The number of frames since data for every object was last requested.
+        self._frames_since_refresh: int = 0
+        # The most recent sleep state of each rigidbody object. Key = The object ID.
+        self._sleep_states: Dict[int, bool] = dict()
+        # The IDs of objects that were woken by a collision.
+        self._woken: Set[int] = set()
+        # If True, another add-on or the controller requested transforms or rigidbodies for every object per frame.
+        self._shared: bool = False
+        # The IDs of objects that another add-on or the controller requested transforms or rigidbodies for.
+        self._required_ids: Set[int] = set()
+        # The `send_transforms` and `send_rigidbodies` commands that this add-on sent since the last `before_send()` call.
+        self._requests: List[dict] = list()
+
+    @property
+    def transforms(self) -> Dict[int, Transform]:
+        """
+        :return: The [transform data](../object_data/transform.md) for each object on the scene on this frame. Key = The object ID. If `transforms=False` in the constructor, this dictionary will be empty.
+        """
+
+        if self._transforms_dirty:
+            self._transforms_dirty = False
+            self._transforms.clear()
+            if "tran" in self._received:
+                for object_id, row in zip(self._output_data_ids["tran"], self._get_rows("tran")):
+                    self._transforms[int(object_id)] = Transform(position=np.copy(self.positions[row]),
+                                                                 rotation=np.copy(self.rotations[row]),
+                                                                 forward=np.copy(self.forwards[row]))
+        return self._transforms
+
+    @transforms.setter
+    def transforms(self, value: Dict[int, Transform]) -> None:
+        self._transforms = value
+
+    @property
+    def rigidbodies(self) -> Dict[int, Rigidbody]:
+        """
+        :return: The [rigidbody data](../object_data/rigidbody.md) for each rigidbody object on the scene on this frame. Key = The object ID. If `rigidbodies=False` in the constructor, this dictionary will be empty.
+        """
+
+        if self._rigidbodies_dirty:
+            self._rigidbodies_dirty = False
+            self._rigidbodies.clear()
+            if "rigi" in self._received:
+                for object_id, row in zip(self._output_data_ids["rigi"], self._get_rows("rigi")):
+                    self._rigidbodies[int(object_id)] = Rigidbody(velocity=np.copy(self.velocities[row]),
+                                                                  angular_velocity=np.copy(self.angular_velocities[row]),
+                                                                  sleeping=bool(self.sleeping[row]))
+        return self._rigidbodies
+
+    @rigidbodies.setter
+    def rigidbodies(self, value: Dict[int, Rigidbody]) -> None:
+        self._rigidbodies = value
+
+    @property
+    def bounds(self) -> Dict[int, Bound]:
+        """
+        :return: The [bounds data](../object_data/bound.md) for each object on the scene on this frame. Key = The object ID. If `bounds=False` in the constructor, this dictionary will be empty.
+        """
+
+        if self._bounds_dirty:
+            self._bounds_dirty = False
+            self._bounds.clear()
+            if "boun" in self._received:
+                for object_id, row in zip(self._output_data_ids["boun"], self._get_rows("boun")):
+                    b = np.copy(self.bounds_positions[row])
+                    self._bounds[int(object_id)] = Bound(front=b[0], back=b[1], left=b[3], right=b[2], top=b[4],
+                                                         bottom=b[5], center=b[6])
+        return self._bounds
+
+    @bounds.setter
+    def bounds(self, value: Dict[int, Bound]) -> None:
+        self._bounds = value
 
     def get_initialization_commands(self) -> List[dict]:
-        return [{"$type": "send_segmentation_colors"},
-                {"$type": "send_categories"},
-                {"$type": "send_static_rigidbodies"},
-                {"$type": "send_rigidbodies",
-                 "frequency": self._send_rigidbodies},
-                {"$type": "send_bounds",
-                 "frequency": self._send_bounds},
-                {"$type": "send_transforms",
-                 "frequency": self._send_transforms}]
+        commands = [{"$type": "send_segmentation_colors"},
+                    {"$type": "send_categories"},
+                    {"$type": "send_static_rigidbodies"},
+                    {"$type": "send_rigidbodies",
+                     "frequency": self._send_rigidbodies},
+                    {"$type": "send_bounds",
+                     "frequency": self._send_bounds},
+                    {"$type": "send_transforms",
+                     "frequency": self._send_transforms}]
+        self._requests.extend([commands[3], commands[5]])
+        return commands
 
     def on_send(self, resp: List[bytes]) -> None:
         # Cache static data.
@@ -193,33 +348,74 @@ class ObjectManager(AddOn):
                                                               size=sizes[object_id],
                                                               category=categories[object_id])
         # Set dynamic data.
-        self.transforms.clear()
-        self.rigidbodies.clear()
-        self.bounds.clear()
-        for i in range(len(resp) - 1):
-            r_id = OutputData.get_data_type_id(resp[i])
-            if r_id == "tran":
-                tran = Transforms(resp[i])
-                for j in range(tran.get_num()):
-                    self.transforms[tran.get_id(j)] = Transform(position=tran.get_position(j),
-                                                                rotation=tran.get_rotation(j),
-                                                                forward=tran.get_forward(j))
-            elif r_id == "rigi":
-                rigi = Rigidbodies(resp[i])
-                for j in range(rigi.get_num()):
-                    self.rigidbodies[rigi.get_id(j)] = Rigidbody(velocity=rigi.get_velocity(j),
-                                                                 angular_velocity=rigi.get_angular_velocity(j),
-                                                                 sleeping=rigi.get_sleeping(j))
-            elif r_id == "boun":
-                boun = Bounds(resp[i])
-                for j in range(boun.get_num()):
-                    self.bounds[boun.get_id(j)] = Bound(front=boun.get_front(j),
-                                                        back=boun.get_back(j),
-                                                        left=boun.get_left(j),
-                                                        right=boun.get_right(j),
-                                                        top=boun.get_top(j),
-                                                        bottom=boun.get_bottom(j),
-                                                        center=boun.get_center(j))
+        # In adaptive mode, the transforms and rigidbodies on this frame might be for only some of the objects.
+        full = self._subscribed is None
+        if self._arrays:
+            self._set_arrays(resp=resp, full=full)
+        else:
+            if full:
+                self.transforms.clear()
+                self.rigidbodies.clear()
+            self.bounds.clear()
+            for i in range(len(resp) - 1):
+                r_id = OutputData.get_data_type_id(resp[i])
+                if r_id == "tran":
+                    tran = Transforms(resp[i])
+                    for j in range(tran.get_num()):
+                        self.transforms[tran.get_id(j)] = Transform(position=tran.get_position(j),
+                                                                    rotation=tran.get_rotation(j),
+                                                                    forward=tran.get_forward(j))
+                elif r_id == "rigi":
+                    rigi = Rigidbodies(resp[i])
+                    for j in range(rigi.get_num()):
+                        self.rigidbodies[rigi.get_id(j)] = Rigidbody(velocity=rigi.get_velocity(j),
+                                                                     angular_velocity=rigi.get_angular_velocity(j),
+                                                                     sleeping=rigi.get_sleeping(j))
+                    if self._adaptive:
+                        self._set_sleep_states(rigi=rigi, full=full)
+                elif r_id == "boun":
+                    boun = Bounds(resp[i])
+                    for j in range(boun.get_num()):
+                        self.bounds[boun.get_id(j)] = Bound(front=boun.get_front(j),
+                                                            back=boun.get_back(j),
+                                                            left=boun.get_left(j),
+                                                            right=boun.get_right(j),
+                                                            top=boun.get_top(j),
+                                                            bottom=boun.get_bottom(j),
+                                                            center=boun.get_center(j))
+        if self._adaptive:
+            self._set_subscription(resp=resp)
+
+    def before_send(self, commands: List[dict]) -> None:
+        if not self._adaptive:
+            return
+        # If another add-on requested transforms or rigidbodies, re-send this add-on's request after it so that neither request replaces the other.
+        resubscribe = self._set_other_requests(commands=commands)
+        object_ids = self._subscribed
+        if self._shared:
+            resubscribe = resubscribe or object_ids is not None
+            object_ids = None
+        elif self._subscribed is not None and self._cached_static_data:
+            # Subscribe to objects that are targeted by a command.
+            woken: Set[int] = set()
+            refresh = False
+            for command in commands:
+                if "id" not in command or command["$type"].startswith("send_") or not isinstance(command["id"], int):
+                    continue
+                object_id = command["id"]
+                # This might be a new object.
+                if object_id not in self._sleep_states:
+                    refresh = True
+                elif object_id not in self._subscribed:
+                    woken.add(object_id)
+            if refresh:
+                object_ids = None
+                resubscribe = True
+            elif len(woken) > 0:
+                object_ids = self._subscribed | woken
+                resubscribe = True
+        if resubscribe:
+            commands.extend(self._get_subscription_commands(object_ids=object_ids))
 
     def reset(self) -> None:
         """
@@ -229,4 +425,346 @@ class ObjectManager(AddOn):
         self._cached_static_data = False
         self.objects_static.clear()
         self.categories.clear()
+        self._output_data_ids.clear()
+        self._output_data_rows.clear()
+        self._received.clear()
+        self._set_rows(object_ids=np.zeros(shape=0, dtype=np.int32))
+        self.frame_count = 0
+        self._subscribed = None
+        self._frames_since_refresh = 0
+        self._sleep_states.clear()
+        self._woken.clear()
+        self._shared = False
+        self._required_ids.clear()
+        self._requests.clear()
         self.initialized = False
+
+    def get_history(self, field: str, frames: int = None) -> np.ndarray:
+        """
+        :param field: The name of the array: `"positions"`, `"rotations"`, `"velocities"`, `"angular_velocities"`, or `"sleeping"`.
+        :param frames: The number of most recent frames. If None, get every frame in the history.
+
+        :return: The recorded data as a numpy array with shape `(frames, n, ...)` in chronological order (the last element is the current frame). Each column is an object (see `self.object_ids`). If an object wasn't in the scene on a frame, its data is NaN (or False).
+        """
+
+        if self._history_length == 0:
+            raise Exception("History isn't enabled. Set `history` in the ObjectManager constructor.")
+        if field not in self._history:
+            raise Exception(f"Invalid history field: {field}")
+        available = min(self.frame_count, self._history_length)
+        frames = available if frames is None else min(frames, available)
+        slots = np.arange(self.frame_count - frames, self.frame_count) % self._history_length
+        return self._history[field][slots, :len(self.object_ids)]
+
+    def get_finite_difference_velocities(self, dt: float, frames: int = 1) -> np.ndarray:
+        """
+        :param dt: The time elapsed per frame in seconds. This is the physics time step multiplied by the number of physics steps per `communicate()` call.
+        :param frames: The number of frames between the two positions.
+
+        :return: The velocity of each object, derived from its current position and its position `frames` frames ago, as a numpy array with shape `(n, 3)`. If there aren't enough frames in the history, this is NaN.
+        """
+
+        positions = self._get_history_frames(field="positions", frames=[frames, 0])
+        return (positions[1] - positions[0]) / (frames * dt)
+
+    def get_finite_difference_accelerations(self, dt: float, frames: int = 1) -> np.ndarray:
+        """
+        :param dt: The time elapsed per frame in seconds.
+        :param frames: The number of frames between each of the three positions.
+
+        :return: The acceleration of each object, derived from a central difference of its current position and its positions `frames` and `2 * frames` frames ago, as a numpy array with shape `(n, 3)`. If there aren't enough frames in the history, this is NaN.
+        """
+
+        positions = self._get_history_frames(field="positions", frames=[frames * 2, frames, 0])
+        return (positions[2] - 2 * positions[1] + positions[0]) / ((frames * dt) ** 2)
+
+    def get_displacements(self, frame: int) -> np.ndarray:
+        """
+        :param frame: A frame number (see `self.frame_count`). This must still be in the history.
+
+        :return: The displacement of each object since `frame` as a numpy array with shape `(n, 3)`.
+        """
+
+        if frame < self.frame_count - self._history_length or frame >= self.frame_count:
+            raise Exception(f"Frame {frame} isn't in the history.")
+        positions = self._get_history_frames(field="positions", frames=[self.frame_count - 1 - frame, 0])
+        return positions[1] - positions[0]
+
+    def get_at_rest(self, frames: int, position_tolerance: float = 0.001, rotation_tolerance: float = 0.1) -> np.ndarray:
+        """
+        :param frames: The number of most recent frames.
+        :param position_tolerance: If an object's position on every frame is within this distance in meters from its current position, it hasn't moved.
+        :param rotation_tolerance: If an object's rotation on every frame is within this angle in degrees from its current rotation, it hasn't rotated.
+
+        :return: A boolean numpy array with shape `(n,)`. True if the object hasn't moved or rotated in the last `frames` frames. If there are fewer than `frames` frames in the history, every element is False.
+        """
+
+        if min(self.frame_count, self._history_length) < frames:
+            return np.zeros(shape=len(self.object_ids), dtype=bool)
+        positions = self.get_history(field="positions", frames=frames)
+        rotations = self.get_history(field="rotations", frames=frames)
+        distances = np.linalg.norm(positions - positions[-1], axis=2)
+        dots = np.clip(np.abs(np.sum(rotations * rotations[-1], axis=2)), 0, 1)
+        angles = np.degrees(2 * np.arccos(dots))
+        return np.all(distances <= position_tolerance, axis=0) & np.all(angles <= rotation_tolerance, axis=0)
+
+    def _set_arrays(self, resp: List[bytes], full: bool) -> None:
+        """
+        Copy dynamic output data into the numpy arrays.
+
+        :param resp: The response from the build.
+        :param full: If False, the transforms and rigidbodies are only for some of the objects (see adaptive mode).
+        """
+
+        output_data: Dict[str, Union[Transforms, Rigidbodies, Bounds]] = dict()
+        for i in range(len(resp) - 1):
+            r_id = OutputData.get_data_type_id(resp[i])
+            if r_id == "tran":
+                output_data[r_id] = Transforms(resp[i])
+            elif r_id == "rigi":
+                output_data[r_id] = Rigidbodies(resp[i])
+                if self._adaptive:
+                    self._set_sleep_states(rigi=output_data[r_id], full=full)
+            elif r_id == "boun":
+                output_data[r_id] = Bounds(resp[i])
+        # Partial output data only updates the rows of the objects in it.
+        partial: List[str] = [r_id for r_id in ["tran", "rigi"] if not full and r_id in output_data and r_id in self._output_data_ids]
+        if full:
+            self._received = list(output_data.keys())
+        else:
+            self._received = list(set(self._received) | set(output_data.keys()))
+        # Rebuild the rows only if objects were added or removed.
+        if any([r_id not in self._output_data_ids or not np.array_equal(self._output_data_ids[r_id], output_data[r_id].get_ids())
+                for r_id in output_data if r_id not in partial]):
+            # The data of objects that aren't in the partial output data will be lost, so request a refresh.
+            if len(partial) > 0:
+                self._frames_since_refresh = self._refresh_interval
+            ids = np.concatenate([output_data[r_id].get_ids() for r_id in output_data]) if len(output_data) > 0 else np.zeros(shape=0, dtype=np.int32)
+            # Get the unique IDs in the order that they first appear.
+            first = np.unique(ids, return_index=True)[1]
+            self._set_rows(object_ids=ids[np.sort(first)])
+            self._output_data_ids.clear()
+            self._output_data_rows.clear()
+            sorter = np.argsort(self.object_ids)
+            for r_id in output_data:
+                r_ids = np.copy(output_data[r_id].get_ids())
+                rows = sorter[np.searchsorted(self.object_ids, r_ids, sorter=sorter)]
+                self._output_data_ids[r_id] = r_ids
+                # If the rows are in the same order as the output data, the arrays can be copied without indexing.
+                self._output_data_rows[r_id] = None if np.array_equal(rows, np.arange(len(rows))) else rows
+        # Get the rows of partial output data. Ignore objects that don't have rows.
+        rows: Dict[str, Optional[np.ndarray]] = dict()
+        valid: Dict[str, Union[np.ndarray, slice]] = dict()
+        for r_id in output_data:
+            if r_id in partial:
+                r_rows = np.array([self.rows.get(int(object_id), -1) for object_id in output_data[r_id].get_ids()], dtype=int)
+                valid[r_id] = r_rows >= 0
+                rows[r_id] = r_rows[valid[r_id]]
+            else:
+                valid[r_id] = slice(None)
+                rows[r_id] = self._output_data_rows[r_id]
+        # Copy the data.
+        if "tran" in output_data:
+            tran: Transforms = output_data["tran"]
+            ObjectManager._copy(self.positions, rows["tran"], tran.get_positions()[valid["tran"]])
+            ObjectManager._copy(self.rotations, rows["tran"], tran.get_rotations()[valid["tran"]])
+            ObjectManager._copy(self.forwards, rows["tran"], tran.get_forwards()[valid["tran"]])
+        if "rigi" in output_data:
+            rigi: Rigidbodies = output_data["rigi"]
+            ObjectManager._copy(self.velocities, rows["rigi"], rigi.get_velocities()[valid["rigi"]])
+            ObjectManager._copy(self.angular_velocities, rows["rigi"], rigi.get_angular_velocities()[valid["rigi"]])
+            ObjectManager._copy(self.sleeping, rows["rigi"], rigi.get_sleepings()[valid["rigi"]])
+        if "boun" in output_data:
+            boun: Bounds = output_data["boun"]
+            ObjectManager._copy(self.bounds_positions, self._output_data_rows["boun"], boun.get_bounds_positions())
+        self._transforms_dirty = True
+        self._rigidbodies_dirty = True
+        self._bounds_dirty = True
+        # Record the history.
+        if self._history_length > 0:
+            slot = self.frame_count % self._history_length
+            num = len(self.object_ids)
+            for k in self._history:
+                self._history[k][slot, :num] = getattr(self, k)
+            self.frame_count += 1
+
+    def _set_rows(self, object_ids: np.ndarray) -> None:
+        """
+        Set the object in each row. Grow the buffers if needed. The data in the arrays is reset to NaN (or False).
+
+        :param object_ids: The object ID of each row.
+        """
+
+        num = len(object_ids)
+        shapes = {"positions": (3,), "rotations": (4,), "forwards": (3,), "velocities": (3,),
+                  "angular_velocities": (3,), "bounds_positions": (7, 3)}
+        capacity = self._buffers["positions"].shape[0] if "positions" in self._buffers else 0
+        if num > capacity or "positions" not in self._buffers:
+            capacity = max(num, capacity * 2)
+            for k in shapes:
+                self._buffers[k] = np.zeros(shape=(capacity,) + shapes[k], dtype=np.float32)
+            self._buffers["sleeping"] = np.zeros(shape=capacity, dtype=bool)
+        for k in shapes:
+            self._buffers[k][:num] = np.nan
+        self._buffers["sleeping"][:num] = False
+        # Move each object's history to its new row.
+        if self._history_length > 0:
+            if num > self._max_objects:
+                raise Exception(f"There are {num} objects in the scene but the history only has room for "
+                                f"{self._max_objects}. Set `max_objects` in the ObjectManager constructor.")
+            old_rows = np.array([self.rows.get(int(object_id), -1) for object_id in object_ids], dtype=int)
+            found = old_rows >= 0
+            for k in self._history:
+                history = np.copy(self._history[k][:, old_rows[found]])
+                self._history[k][:, :num] = False if k == "sleeping" else np.nan
+                self._history[k][:, np.nonzero(found)[0]] = history
+        self.object_ids = np.copy(object_ids)
+        self.rows = {int(object_id): i for i, object_id in enumerate(self.object_ids)}
+        self.positions = self._buffers["positions"][:num]
+        self.rotations = self._buffers["rotations"][:num]
+        self.forwards = self._buffers["forwards"][:num]
+        self.velocities = self._buffers["velocities"][:num]
+        self.angular_velocities = self._buffers["angular_velocities"][:num]
+        self.sleeping = self._buffers["sleeping"][:num]
+        self.bounds_positions = self._buffers["bounds_positions"][:num]
+
+    def _set_sleep_states(self, rigi: Rigidbodies, full: bool) -> None:
+        """
+        Update the sleep state of each object in the rigidbody output data.
+
+        :param rigi: The rigidbody output data.
+        :param full: If True, the output data is for every object, so forget objects that aren't in it.
+        """
+
+        if full:
+            self._sleep_states.clear()
+
+        for object_id, sleeping in zip(rigi.get_ids(), rigi.get_sleepings()):
+            self._sleep_states[int(object_id)] = bool(sleeping)
+
+    def _set_subscription(self, resp: List[bytes]) -> None:
+        """
+        Request data for every object that is awake on the next frame, or for every object if it's time to refresh.
+
+        :param resp: The response from the build.
+        """
+
+        # Wake objects that are in a collision with an awake object.
+        for i in range(len(resp) - 1):
+            if OutputData.get_data_type_id(resp[i]) == "coll":
+                collision = Collision(resp[i])
+                collider_id = collision.get_collider_id()
+                collidee_id = collision.get_collidee_id()
+                if not self._sleep_states.get(collider_id, True) or not self._sleep_states.get(collidee_id, True):
+                    self._woken.add(collider_id)
+                    self._woken.add(collidee_id)
+        self._frames_since_refresh += 1
+        if self._shared or self._frames_since_refresh >= self._refresh_interval:
+            object_ids = None
+        else:
+            object_ids = {object_id for object_id, sleeping in self._sleep_states.items() if not sleeping and
+                          not (object_id in self.objects_static and self.objects_static[object_id].kinematic)}
+            object_ids.update([object_id for object_id in self._woken if object_id in self._sleep_states])
+        self._woken.clear()
+        if object_ids != self._subscribed:
+            self.commands.extend(self._get_subscription_commands(object_ids=object_ids))
+
+    def _get_subscription_commands(self, object_ids: Optional[Set[int]]) -> List[dict]:
+        """
+        :param object_ids: The IDs of the objects. If None, request data for every object. Objects requested by other add-ons are always included.
+
+        :return: Commands to request transforms and rigidbodies for the objects per frame.
+        """
+
+        self._subscribed = object_ids
+        if object_ids is None:
+            self._frames_since_refresh = 0
+            commands = [{"$type": "send_transforms",
+                         "frequency": self._send_transforms},
+                        {"$type": "send_rigidbodies",
+                         "frequency": self._send_rigidbodies}]
+        else:
+            ids = sorted(object_ids | self._required_ids)
+            # An empty list of IDs means every object.
+            if len(ids) == 0:
+                commands = [{"$type": "send_transforms",
+                             "frequency": "never"},
+                            {"$type": "send_rigidbodies",
+                             "frequency": "never"}]
+            else:
+                commands = [{"$type": "send_transforms",
+                             "ids": ids,
+                             "frequency": self._send_transforms},
+                            {"$type": "send_rigidbodies",
+                             "ids": ids,
+                             "frequency": self._send_rigidbodies}]
+        self._requests.extend(commands)
+        return commands
+
+    def _set_other_requests(self, commands: List[dict]) -> bool:
+        """
+        Check for `send_transforms` and `send_rigidbodies` commands that weren't sent by this add-on.
+
+        :param commands: The commands that are about to be sent.
+
+        :return: True if another add-on or the controller requested transforms or rigidbodies.
+        """
+
+        other = False
+        for command in commands:
+            if command["$type"] != "send_transforms" and command["$type"] != "send_rigidbodies":
+                continue
+            # Compare by identity because another add-on might send an identical command.
+            if any(command is request for request in self._requests):
+                continue
+            other = True
+            if command.get("frequency", "once") == "never":
+                continue
+            if "ids" in command:
+                self._required_ids.update(command["ids"])
+            elif command.get("frequency", "once") == "always":
+                self._shared = True
+        self._requests.clear()
+        return other
+
+    def _get_history_frames(self, field: str, frames: List[int]) -> np.ndarray:
+        """
+        :param field: The name of the array.
+        :param frames: A list of frame offsets. 0 is the current frame, 1 is the previous frame, etc.
+
+        :return: The data on each frame as a numpy array with shape `(len(frames), n, ...)`. If a frame isn't in the history, its data is NaN.
+        """
+
+        if self._history_length == 0:
+            raise Exception("History isn't enabled. Set `history` in the ObjectManager constructor.")
+        data = np.full(shape=(len(frames), len(self.object_ids)) + self._history[field].shape[2:], fill_value=np.nan,
+                       dtype=np.float32)
+        for i, offset in enumerate(frames):
+            if offset < min(self.frame_count, self._history_length):
+                data[i] = self._history[field][(self.frame_count - 1 - offset) % self._history_length, :len(self.object_ids)]
+        return data
+
+    def _get_rows(self, r_id: str) -> np.ndarray:
+        """
+        :param r_id: The output data ID.
+
+        :return: The row of each object in the output data.
+        """
+
+        rows = self._output_data_rows[r_id]
+        return np.arange(len(self._output_data_ids[r_id])) if rows is None else rows
+
+    @staticmethod
+    def _copy(destination: np.ndarray, rows: Optional[np.ndarray], source: np.ndarray) -> None:
+        """
+        Copy output data into an array in place.
+
+        :param destination: The array.
+        :param rows: The row of each element of `source`. If None, the rows are in the same order as `source`.
+        :param source: The output data array.
+        """
+
+        if rows is None:
+            destination[:source.shape[0]] = source
+        else:
+            destination[rows] = source
@@ -1,8 +1,13 @@
-from typing import List, Optional
+from hashlib import sha256
+from pathlib import Path
+from typing import List, Dict, Optional, Union
 import numpy as np
-from tdw.output_data import OutputData
+from tdw.version import __version__
+from tdw.output_data import OutputData, Bounds
 from tdw.output_data import OccupancyMap as Occ
 from tdw.add_ons.add_on import AddOn
+from tdw.grid_path_planner import GridPathPlanner
+from tdw.type_aliases import PATH
 
 
 class OccupancyMap(AddOn):
@@ -17,15 +22,28 @@ class OccupancyMap(AddOn):
     | 1     | The cell is occupied by at least one object or occupied by an environment object (such as a wall). |
     | 2    | The cell is out of bounds (there is no floor).               |
     | 3    | The cell is free, but it's in an isolated island. |
+
+    The static occupancy of a scene never changes for a given scene, layout, and set of parameters. If `cache_directory` is set and `generate()` is called with a `scene` name, occupancy maps are cached on disk and cache hits don't require the build to raycast the scene.
+
+    Objects that move can be set as `dynamic_objects` in `generate()`. They are ignored when the static occupancy map is generated and are instead overlaid onto it every frame using their bounds.
     """
 
-    def __init__(self):
+    def __init__(self, cache_directory: PATH = None):
         """
-        (no parameters)
+        :param cache_directory: If not None, cache occupancy maps in this directory. See: `generate()`.
         """
 
         super().__init__()
         """:field
+        If not None, occupancy maps are cached in this directory.
+        """
+        if cache_directory is None:
+            self.cache_directory: Optional[Path] = None
+        elif isinstance(cache_directory, str):
+            self.cache_directory = Path(cache_directory)
+        else:
+            self.cache_directory = cache_directory
+        """:field
         A 2D numpy array of the occupancy map. Each value is an occupancy value. For example, if `self.occupancy_map[0][1] == 0`, then that position is free. This array is `None` until you call `generate()` followed by `controller.communicate(commands)`.
         """
         self.occupancy_map: Optional[np.ndarray] = None
@@ -34,34 +52,100 @@ class OccupancyMap(AddOn):
         """
         self.positions: Optional[np.ndarray] = None
         self._cell_size: float = 0
+        # The occupancy map without dynamic objects.
+        self._static_occupancy_map: Optional[np.ndarray] = None
+        # If not None, write the next occupancy map to this path.
+        self._cache_path: Optional[Path] = None
+        # The IDs of dynamic objects.
+        self._dynamic_objects: List[int] = list()
+        # The (x_min, x_max, z_min, z_max) bounds of each dynamic object. Key = The object ID.
+        self._dynamic_bounds: Dict[int, np.ndarray] = dict()
+        # The occupancy map that `self._free_positions` was derived from.
+        self._free_positions_map: Optional[np.ndarray] = None
+        # The worldspace (x, z) positions of the free cells.
+        self._free_positions: np.ndarray = np.zeros(shape=(0, 2))
         self.initialized = True
 
     def get_initialization_commands(self) -> List[dict]:
         return []
 
     def on_send(self, resp: List[bytes]) -> None:
+        overlay = False
         # Update the occupancy map.
         for i in range(len(resp) - 1):
             r_id = OutputData.get_data_type_id(resp[i])
             if r_id == "occu":
                 occupancy_map = Occ(resp[i])
-                self.occupancy_map = occupancy_map.get_map()
+                self._static_occupancy_map = occupancy_map.get_map()
                 self.positions = occupancy_map.get_positions()
-
-    def generate(self, ignore_objects: List[int] = None, cell_size: float = 0.5, raycast_y: float = 2.7, once: bool = True) -> None:
+                self.occupancy_map = self._static_occupancy_map
+                # Cache the occupancy map.
+                if self._cache_path is not None:
+                    if not self._cache_path.parent.exists():
+                        self._cache_path.parent.mkdir(parents=True)
+                    np.savez_compressed(str(self._cache_path.resolve()),
+                                        occupancy_map=self._static_occupancy_map,
+                                        positions=self.positions)
+                    self._cache_path = None
+                overlay = True
+            # Update the bounds of the dynamic objects.
+            elif r_id == "boun" and len(self._dynamic_objects) > 0:
+                bounds = Bounds(resp[i])
+                dynamic_objects = set(self._dynamic_objects)
+                for j in range(bounds.get_num()):
+                    object_id = bounds.get_id(j)
+                    if object_id not in dynamic_objects:
+                        continue
+                    points = np.array([bounds.get_left(j), bounds.get_right(j), bounds.get_front(j), bounds.get_back(j)])
+                    rectangle = np.array([points[:, 0].min(), points[:, 0].max(), points[:, 2].min(), points[:, 2].max()])
+                    # Only update the occupancy map if an object moved.
+                    if object_id not in self._dynamic_bounds or not np.array_equal(self._dynamic_bounds[object_id], rectangle):
+                        self._dynamic_bounds[object_id] = rectangle
+                        overlay = True
+        if overlay and len(self._dynamic_bounds) > 0 and self._static_occupancy_map is not None:
+            self._overlay_dynamic_objects()
+
+    def generate(self, ignore_objects: List[int] = None, cell_size: float = 0.5, raycast_y: float = 2.7, once: bool = True,
+                 scene: str = None, layout: int = None, dynamic_objects: List[int] = None) -> None:
         """
         Generate an occupancy map. Call this, followed by `controller.communicate(commands)` to generate the map.
 
+        If `self.cache_directory` isn't None, `scene` isn't None, and `once == True`, the occupancy map is cached. The cache key is `scene`, `layout`, `cell_size`, `raycast_y`, `ignore_objects`, and `dynamic_objects`. If the occupancy map is already cached, `self.occupancy_map` and `self.positions` are set immediately and no command is sent to the build.
+
         :param ignore_objects: If not None, ignore these objects when determining if a cell is free or non-free.
         :param cell_size: The cell size in meters.
         :param raycast_y: Raycast for objects from this height in meters.
         :param once: If True, generate an occupancy map only on this `communicate(commands)` call. If False, regenerate the occupancy map on every `communicate(commands)` call using the parameters provided here until the scene is unloaded or this function is called again.
+        :param scene: The name of the scene. This is used only for caching.
+        :param layout: The scene layout, for example a [`Floorplan`](floorplan.md) layout index. This is used only for caching.
+        :param dynamic_objects: If not None, these objects are ignored when generating the static occupancy map. Instead, on every `communicate(commands)` call, the cells within their bounds are marked as occupied. This requests bounds data for every object per frame; the request isn't filtered or stopped because other add-ons might need the same data.
         """
 
         self._cell_size = cell_size
+        self._static_occupancy_map = None
+        self._cache_path = None
+        self._dynamic_objects = [] if dynamic_objects is None else dynamic_objects
+        self._dynamic_bounds.clear()
+        ignore = ([] if ignore_objects is None else ignore_objects) + self._dynamic_objects
+        # Don't filter the bounds by object ID because `send_bounds` would replace other add-ons' requests for bounds data.
+        if len(self._dynamic_objects) > 0:
+            self.commands.append({"$type": "send_bounds",
+                                  "frequency": "always"})
+        if self.cache_directory is not None and scene is not None and once:
+            h = sha256()
+            h.update(f"{__version__};{scene};{layout};{cell_size};{raycast_y};{sorted(ignore)}".encode("utf-8"))
+            path = self.cache_directory.joinpath(h.hexdigest() + ".npz")
+            # Load the cached occupancy map.
+            if path.exists():
+                data = np.load(str(path.resolve()))
+                self._static_occupancy_map = data["occupancy_map"]
+                self.occupancy_map = self._static_occupancy_map
+                self.positions = data["positions"]
+                return
+            self._cache_path = path
         self.commands.append({"$type": "send_occupancy_map",
                               "cell_size": cell_size,
-                              "ignore_objects": [] if ignore_objects is None else ignore_objects,
+                              "ignore_objects": ignore,
                               "raycast_y": raycast_y,
                               "frequency": "once" if once else "always"})
 
@@ -84,6 +168,75 @@ class OccupancyMap(AddOn):
                                   "color": {"r": 0, "g": 0, "b": 1, "a": 1},
                                   "shape": "square"})
 
+    def get_path_planner(self, clearance: float = 0) -> GridPathPlanner:
+        """
+        Get a [`GridPathPlanner`](../grid_path_planner.md) for the current occupancy map. Planners are cached, so this is fast if the occupancy map hasn't changed.
+
+        :param clearance: The minimum distance in meters between a traversable cell and a non-free cell.
+
+        :return: A `GridPathPlanner`.
+        """
+
+        if self.occupancy_map is None:
+            raise Exception("The occupancy map hasn't been generated and initialized (see documentation).")
+        return GridPathPlanner.get(occupancy_map=self.occupancy_map, positions=self.positions, clearance=clearance)
+
+    def get_random_positions(self, num: int, min_separation: float = 0,
+                             rng: Union[int, np.random.RandomState] = None) -> np.ndarray:
+        """
+        Sample random free positions from the occupancy map without sending any commands to the build.
+
+        :param num: The number of positions.
+        :param min_separation: The minimum distance in meters between any two positions.
+        :param rng: Either a random seed or an `numpy.random.RandomState` object. If None, a new random number generator is created.
+
+        :return: The positions as a numpy array with shape `(num, 3)` where y is 0.
+        """
+
+        if self.occupancy_map is None:
+            raise Exception("The occupancy map hasn't been generated and initialized (see documentation).")
+        if rng is None:
+            rng = np.random.RandomState()
+        elif isinstance(rng, int):
+            rng = np.random.RandomState(rng)
+        # Cache the free positions until the occupancy map changes.
+        if self._free_positions_map is not self.occupancy_map:
+            self._free_positions_map = self.occupancy_map
+            self._free_positions = self.positions[self.occupancy_map == 0]
+        candidates = self._free_positions[rng.permutation(self._free_positions.shape[0])]
+        if min_separation <= 0:
+            if candidates.shape[0] < num:
+                raise Exception(f"There are only {candidates.shape[0]} free positions.")
+            positions = candidates[:num]
+        else:
+            # Accept each candidate if it isn't too close to a previously accepted candidate.
+            positions = np.zeros(shape=(num, 2))
+            count = 0
+            for candidate in candidates:
+                if count > 0 and np.min(np.linalg.norm(positions[:count] - candidate, axis=1)) < min_separation:
+                    continue
+                positions[count] = candidate
+                count += 1
+                if count == num:
+                    break
+            if count < num:
+                raise Exception(f"Couldn't find {num} free positions separated by at least {min_separation} meters.")
+        return np.column_stack((positions[:, 0], np.zeros(num), positions[:, 1]))
+
+    def _overlay_dynamic_objects(self) -> None:
+        """
+        Set `self.occupancy_map` to the static occupancy map plus the bounds of each dynamic object.
+        """
+
+        self.occupancy_map = np.copy(self._static_occupancy_map)
+        xs = self.positions[:, :, 0]
+        zs = self.positions[:, :, 1]
+        occupied = np.zeros(shape=self.occupancy_map.shape, dtype=bool)
+        for x_min, x_max, z_min, z_max in self._dynamic_bounds.values():
+            occupied |= (xs >= x_min) & (xs <= x_max) & (zs >= z_min) & (zs <= z_max)
+        # Don't mark cells that are out of bounds.
+        self.occupancy_map[occupied & (self.occupancy_map != 2)] = 1
+
     def hide(self) -> None:
         """
         Remove all positions markers (the blue squares created by `self.show()`).
@@ -0,0 +1,219 @@
+from typing import List, Dict, Optional
+from tdw.output_data import OutputData
+from tdw.add_ons.add_on import AddOn
+
+
+class OutputDataAuditor(AddOn):
+    """
+    Find output data that the build sends but that nothing reads.
+
+    Output data such as `Bounds`, `Collision` (with `"stay": True`), and `Images` is often the most expensive part of a frame, and it's easy to request it every frame and then never use it. This add-on records the number of bytes of each type of output data received per frame. It also records the number of times that *any* code (an add-on, or your own controller) constructed an output data object such as `Bounds(resp[i])` of that type. This is done by wrapping `OutputData.__init__` while the auditor is active.
+
+    Output data that is received but never constructed is "paid for but unused". `get_report()` lists each type of output data, sorted by the total number of bytes received, along with the most recent command that requested it.
+
+    ```python
+    from tdw.controller import Controller
+    from tdw.add_ons.object_manager import ObjectManager
+    from tdw.add_ons.output_data_auditor import OutputDataAuditor
+
+    c = Controller()
+    auditor = OutputDataAuditor()
+    c.add_ons.extend([auditor, ObjectManager()])
+    c.communicate([{"$type": "load_scene"}, {"$type": "send_bounds", "frequency": "always"}])
+    for i in range(100):
+        c.communicate([])
+    print(auditor.get_report())
+    auditor.close()
+    c.communicate({"$type": "terminate"})
+    ```
+    """
+
+    """:class_var
+    The ID of the output data requested by each command. Key = The name of the command. Value = The output data ID.
+    """
+    COMMANDS: Dict[str, str] = {"send_albedo_colors": "acol",
+                                "send_audio_sources": "audi",
+                                "send_avatar_segmentation_colors": "avsc",
+                                "send_avatar_transform_matrices": "atrm",
+                                "send_avatars": "avki",
+                                "send_bounds": "boun",
+                                "send_boxcast": "rayc",
+                                "send_camera_matrices": "cama",
+                                "send_categories": "cate",
+                                "send_collider_intersections": "obci",
+                                "send_collisions": "coll",
+                                "send_containment": "cont",
+                                "send_drones": "dron",
+                                "send_dynamic_composite_objects": "dcom",
+                                "send_dynamic_empty_objects": "dyem",
+                                "send_dynamic_robots": "drob",
+                                "send_euler_angles": "eule",
+                                "send_field_of_view": "fofv",
+                                "send_flex_particles": "flex",
+                                "send_framerate": "fram",
+                                "send_id_pass_grayscale": "idgs",
+                                "send_id_pass_segmentation_colors": "ipsc",
+                                "send_image_sensors": "imse",
+                                "send_images": "imag",
+                                "send_is_on_nav_mesh": "isnm",
+                                "send_keyboard": "keyb",
+                                "send_lights": "ligh",
+                                "send_local_transforms": "ltra",
+                                "send_log_messages": "logm",
+                                "send_magnebots": "magn",
+                                "send_meshes": "mesh",
+                                "send_mouse": "mous",
+                                "send_mouse_raycast": "rayc",
+                                "send_nav_mesh_path": "path",
+                                "send_obi_particles": "obip",
+                                "send_occlusion": "occl",
+                                "send_occupancy_map": "occu",
+                                "send_oculus_touch_buttons": "octb",
+                                "send_overlap_box": "over",
+                                "send_overlap_capsule": "over",
+                                "send_overlap_sphere": "over",
+                                "send_raycast": "rayc",
+                                "send_replicant_segmentation_colors": "rseg",
+                                "send_replicants": "repl",
+                                "send_rigidbodies": "rigi",
+                                "send_robot_joint_velocities": "rojv",
+                                "send_scene_regions": "sreg",
+                                "send_screen_positions": "scre",
+                                "send_segmentation_colors": "segm",
+                                "send_spherecast": "rayc",
+                                "send_static_composite_objects": "scom",
+                                "send_static_empty_objects": "stem",
+                                "send_static_oculus_touch": "soct",
+                                "send_static_rigidbodies": "srig",
+                                "send_static_robots": "srob",
+                                "send_substructure": "subs",
+                                "send_transform_matrices": "trma",
+                                "send_transforms": "tran",
+                                "send_version": "vers",
+                                "send_volumes": "volu",
+                                "send_vr_rig": "vrri",
+                                "send_wheelchair_replicants": "repl"}
+    # The total number of output data objects constructed per output data ID while any auditor is active.
+    _CONSTRUCTED: Dict[str, int] = dict()
+    # The original `OutputData.__init__` function. This is None if `OutputData.__init__` isn't wrapped.
+    _ORIGINAL_INIT = None
+    # The number of active auditors.
+    _NUM_ACTIVE: int = 0
+
+    def __init__(self):
+        """
+        (no parameters)
+        """
+
+        super().__init__()
+        self.initialized = True
+        """:field
+        The number of frames that have been audited.
+        """
+        self.num_frames: int = 0
+        """:field
+        The number of frames on which each type of output data was received. Key = The output data ID.
+        """
+        self.frames_received: Dict[str, int] = dict()
+        """:field
+        The total number of bytes of each type of output data received. Key = The output data ID.
+        """
+        self.bytes_received: Dict[str, int] = dict()
+        """:field
+        The most recent command that requested each type of output data. Key = The output data ID.
+        """
+        self.requests: Dict[str, dict] = dict()
+        # The number of constructed output data objects when this auditor started.
+        self._constructed_start: Dict[str, int] = dict(OutputDataAuditor._CONSTRUCTED)
+        self._active: bool = True
+        OutputDataAuditor._NUM_ACTIVE += 1
+        OutputDataAuditor._hook()
+
+    def get_initialization_commands(self) -> List[dict]:
+        return []
+
+    def before_send(self, commands: List[dict]) -> None:
+        for command in commands:
+            if command["$type"] in OutputDataAuditor.COMMANDS:
+                self.requests[OutputDataAuditor.COMMANDS[command["$type"]]] = dict(command)
+
+    def on_send(self, resp: List[bytes]) -> None:
+        if not self._active:
+            return
+        self.num_frames += 1
+        for i in range(len(resp) - 1):
+            r_id = OutputData.get_data_type_id(resp[i])
+            if r_id not in self.bytes_received:
+                self.frames_received[r_id] = 0
+                self.bytes_received[r_id] = 0
+            self.frames_received[r_id] += 1
+            self.bytes_received[r_id] += len(resp[i])
+
+    def get_num_constructed(self, r_id: str) -> int:
+        """
+        :param r_id: The output data ID.
+
+        :return: The number of times that an output data object of this type was constructed since this auditor was created.
+        """
+
+        return OutputDataAuditor._CONSTRUCTED.get(r_id, 0) - self._constructed_start.get(r_id, 0)
+
+    def get_unused(self) -> List[str]:
+        """
+        :return: The IDs of output data that was received but never constructed, sorted by the total number of bytes received.
+        """
+
+        return [r_id for r_id in self._get_sorted_ids() if self.get_num_constructed(r_id) == 0]
+
+    def get_report(self) -> str:
+        """
+        :return: A report of the output data received per frame, and which output data was never used.
+        """
+
+        lines: List[str] = [f"Frames: {self.num_frames}",
+                            "ID\tFrames\tBytes\tBytes per frame\tConstructed\tUnused\tCommand"]
+        for r_id in self._get_sorted_ids():
+            num_constructed = self.get_num_constructed(r_id)
+            request: Optional[dict] = self.requests[r_id] if r_id in self.requests else None
+            lines.append(f"{r_id}\t{self.frames_received[r_id]}\t{self.bytes_received[r_id]}\t"
+                         f"{round(self.bytes_received[r_id] / self.frames_received[r_id])}\t{num_constructed}\t"
+                         f"{num_constructed == 0}\t{request}")
+        return "\n".join(lines)
+
+    def close(self) -> None:
+        """
+        Stop auditing. If no other auditors are active, restore the original `OutputData.__init__` function.
+        """
+
+        if not self._active:
+            return
+        self._active = False
+        OutputDataAuditor._NUM_ACTIVE -= 1
+        if OutputDataAuditor._NUM_ACTIVE == 0 and OutputDataAuditor._ORIGINAL_INIT is not None:
+            OutputData.__init__ = OutputDataAuditor._ORIGINAL_INIT
+            OutputDataAuditor._ORIGINAL_INIT = None
+
+    def _get_sorted_ids(self) -> List[str]:
+        """
+        :return: The IDs of the received output data, sorted by the total number of bytes received (largest first).
+        """
+
+        return sorted(self.bytes_received.keys(), key=lambda r_id: self.bytes_received[r_id], reverse=True)
+
+    @staticmethod
+    def _hook() -> None:
+        """
+        Wrap `OutputData.__init__` to count the number of output data objects constructed per output data ID.
+        """
+
+        if OutputDataAuditor._ORIGINAL_INIT is not None:
+            return
+        original = OutputData.__init__
+        OutputDataAuditor._ORIGINAL_INIT = original
+
+        def __init__(self, b):
+            r_id = OutputData.get_data_type_id(b)
+            OutputDataAuditor._CONSTRUCTED[r_id] = OutputDataAuditor._CONSTRUCTED.get(r_id, 0) + 1
+            original(self, b)
+
+        OutputData.__init__ = __init__
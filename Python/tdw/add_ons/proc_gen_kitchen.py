@@ -1,5 +1,6 @@
 from json import loads
 from pathlib import Path
+from multiprocessing import Pool
 from pkg_resources import resource_filename
 from typing import List, Dict, Union, Tuple, Callable, Optional
 import numpy as np
@@ -13,6 +14,7 @@ from tdw.scene_data.room import Room
 from tdw.scene_data.interior_region import InteriorRegion
 from tdw.proc_gen.arrangements.arrangement import Arrangement
 from tdw.proc_gen.arrangements.arrangement_along_wall import ArrangementAlongWall
+from tdw.proc_gen.arrangements.footprint_index import FootprintIndex
 from tdw.proc_gen.arrangements.basket import Basket
 from tdw.proc_gen.arrangements.dishwasher import Dishwasher
 from tdw.proc_gen.arrangements.kitchen_counter import KitchenCounter
@@ -30,6 +32,9 @@ from tdw.proc_gen.arrangements.kitchen_counter_top import KitchenCounterTop
 from tdw.proc_gen.arrangements.cabinetry.cabinetry_type import CabinetryType
 from tdw.proc_gen.arrangements.cabinetry.cabinetry import Cabinetry, CABINETRY
 from tdw.proc_gen.arrangements.kitchen_table import KitchenTable
+from tdw.proc_gen.generated_kitchen import GeneratedKitchen
+from tdw.proc_gen.kitchen_cache import KitchenCache
+from tdw.type_aliases import PATH
 
 
 class ProcGenKitchen(AddOn):
@@ -158,9 +163,9 @@ class ProcGenKitchen(AddOn):
     """
     SCENE_NAMES: List[str] = ['mm_craftroom_2a', 'mm_craftroom_2b', 'mm_craftroom_3a', 'mm_craftroom_3b', 'mm_kitchen_2a', 'mm_kitchen_2b', 'mm_kitchen_3a', 'mm_kitchen_3b']
 
-    def __init__(self):
+    def __init__(self, cache: KitchenCache = None):
         """
-        (no parameters)
+        :param cache: An optional [`KitchenCache`](../proc_gen/kitchen_cache.md). If not None, and if `create()` is called with an integer random seed, the kitchen is read from the cache if possible, and otherwise generated and added to the cache.
         """
 
         super().__init__()
@@ -180,6 +185,14 @@ class ProcGenKitchen(AddOn):
         The [`Cabinetry`](../proc_gen/arrangements/cabinetry/cabinetry.md). This is set randomly by `self.create()`.
         """
         self.cabinetry: Cabinetry = CABINETRY[CabinetryType.oak_white]
+        """:field
+        The [`KitchenCache`](../proc_gen/kitchen_cache.md). Can be None.
+        """
+        self.cache: Optional[KitchenCache] = cache
+        """:field
+        A [`FootprintIndex`](../proc_gen/arrangements/footprint_index.md) of the objects in the kitchen. This gets set by `self.create()` and `self.load()`. Secondary arrangements use it to avoid placing objects too close to existing objects.
+        """
+        self.footprints: FootprintIndex = FootprintIndex()
         self._allow_microwave: bool = True
         self._allow_radiator: bool = True
         self.initialized = True
@@ -192,7 +205,34 @@ class ProcGenKitchen(AddOn):
         :param scene: Can be a string (the name of a scene), a [`SceneRecord`](../librarian/scene_librarian.md), a list of scene names and/or `SceneRecord` (one will chosen randomly), a [`Room`](../scene_data/room.md), or None. If this is a `Room`, then `ProcGenKitchen` will assume that the scene has already been loaded, and `self.scene_record` will be set to `None`. If `scene=None`, a random scene from `ProcGenKitchen.SCENE_NAMES` will be selected.
         :param room_index: The index of the room in `self.scene_record.rooms` (assuming `self.scene_record is not None`; see above).
         :param cabinetry_type: A [`CabinetryType`](../proc_gen/arrangements/cabinetry/cabinetry_type.md) value that sets which kitchen cabinets, wall cabinets, and sinks to add to the scene. If None, a `CabinetryType` is chosen randomly.
-        :param rng: The random number generator. Can be `int` (a random seed), `np.random.RandomState`, or None (a new random seed will be selected randomly).
+        :param rng: The random number generator. Can be `int` (a random seed), `np.random.RandomState`, or None (a new random seed will be selected randomly). If this is an `int`, every command, including object IDs and container shape IDs, only depends on the seed, `scene`, `room_index`, and `cabinetry_type`, so the kitchen is the same whether it is generated or read from the cache; and if `self.cache` isn't None, the kitchen may be read from the cache.
+        """
+
+        if self.cache is None or not isinstance(rng, int):
+            self._create(scene=scene, room_index=room_index, cabinetry_type=cabinetry_type, rng=rng)
+            return
+        kitchen = self.cache.get(scene=scene, room_index=room_index, cabinetry_type=cabinetry_type, seed=rng)
+        if kitchen is not None:
+            self.load(kitchen)
+            return
+        num_commands = len(self.commands)
+        self._create(scene=scene, room_index=room_index, cabinetry_type=cabinetry_type, rng=rng)
+        self.cache.put(scene=scene, room_index=room_index, cabinetry_type=cabinetry_type,
+                       kitchen=GeneratedKitchen(seed=rng,
+                                                scene_name=self.scene_record.name if self.scene_record is not None else None,
+                                                room_index=room_index,
+                                                cabinetry_type=self.cabinetry.name,
+                                                commands=self.commands[num_commands:]))
+
+    def _create(self, scene: Union[str, SceneRecord, Room, List[Union[str, SceneRecord]]], room_index: int,
+                cabinetry_type: Optional[CabinetryType], rng: Union[int, np.random.RandomState, None]) -> None:
+        """
+        Procedurally generate a kitchen. See `create()`.
+
+        :param scene: The scene. See the `scene` parameter in `create()`.
+        :param room_index: The index of the room in `SceneRecord.rooms`.
+        :param cabinetry_type: The cabinetry type. If None, a `CabinetryType` is chosen randomly.
+        :param rng: The random number generator. See the `rng` parameter in `create()`.
         """
 
         # Get the random number generator.
@@ -204,6 +244,23 @@ class ProcGenKitchen(AddOn):
             self.rng = rng
         else:
             raise Exception(rng)
+        # If the random seed is an integer, derive the object IDs from it too so that the kitchen only depends on the seed.
+        Arrangement.set_id_seed(seed=rng if isinstance(rng, int) else None)
+        try:
+            self._create_kitchen(scene=scene, room_index=room_index, cabinetry_type=cabinetry_type)
+        finally:
+            Arrangement.set_id_seed(seed=None)
+
+    def _create_kitchen(self, scene: Union[str, SceneRecord, Room, List[Union[str, SceneRecord]]], room_index: int,
+                        cabinetry_type: Optional[CabinetryType]) -> None:
+        """
+        Procedurally generate a kitchen with `self.rng`. See `create()`.
+
+        :param scene: The scene. See the `scene` parameter in `create()`.
+        :param room_index: The index of the room in `SceneRecord.rooms`.
+        :param cabinetry_type: The cabinetry type. If None, a `CabinetryType` is chosen randomly.
+        """
+
         create_scene = True
         # Create the librarian if it doesn't already exist.
         if "scenes.json" not in Controller.SCENE_LIBRARIANS:
@@ -247,6 +304,7 @@ class ProcGenKitchen(AddOn):
         # Reset arrangement globals.
         self._allow_microwave = True
         self._allow_radiator = True
+        self.footprints.clear()
         # Set the cabinetry.
         if cabinetry_type is not None:
             self.cabinetry = CABINETRY[cabinetry_type]
@@ -285,34 +343,159 @@ class ProcGenKitchen(AddOn):
         triangle = triangles[self.rng.randint(0, len(triangles))]
         triangle_commands, used_walls = triangle()
         commands.extend(triangle_commands)
+        self.footprints.add_commands(triangle_commands)
         # Add a kitchen table.
-        kitchen_table = KitchenTable(room=self.room, used_walls=sum(used_walls), rng=self.rng)
-        commands.extend(kitchen_table.get_commands())
+        kitchen_table_commands = KitchenTable(room=self.room, used_walls=sum(used_walls), rng=self.rng).get_commands()
+        commands.extend(kitchen_table_commands)
+        self.footprints.add_commands(kitchen_table_commands)
         # Add secondary arrangements in the room.
-        commands.extend(self._get_secondary_lateral_arrangements(used_walls=used_walls,
-                                                                 region=self.room.main_region,
-                                                                 possible_categories=ProcGenKitchen.SECONDARY_ARRANGEMENTS["main"],
-                                                                 tall_category_replacement="void",
-                                                                 current_commands=commands))
+        secondary_commands = self._get_secondary_lateral_arrangements(used_walls=used_walls,
+                                                                      region=self.room.main_region,
+                                                                      possible_categories=ProcGenKitchen.SECONDARY_ARRANGEMENTS["main"],
+                                                                      tall_category_replacement="void")
+        commands.extend(secondary_commands)
+        self.footprints.add_commands(secondary_commands)
         # Add secondary arrangements in any alcoves.
         for alcove in self.room.alcoves:
-            commands.extend(self._get_secondary_lateral_arrangements(used_walls=[],
-                                                                     region=alcove,
-                                                                     possible_categories=ProcGenKitchen.SECONDARY_ARRANGEMENTS["alcove"],
-                                                                     tall_category_replacement="basket",
-                                                                     current_commands=commands))
+            secondary_commands = self._get_secondary_lateral_arrangements(used_walls=[],
+                                                                          region=alcove,
+                                                                          possible_categories=ProcGenKitchen.SECONDARY_ARRANGEMENTS["alcove"],
+                                                                          tall_category_replacement="basket")
+            commands.extend(secondary_commands)
+            self.footprints.add_commands(secondary_commands)
         # Allow objects to stop moving.
         commands.append({"$type": "step_physics",
                          "frames": 50})
         # Set the commands.
         self.commands.extend(commands)
 
+    def load(self, kitchen: GeneratedKitchen) -> None:
+        """
+        Load a kitchen that was generated ahead of time, for example by `ProcGenKitchen.generate_batch()`. The kitchen will be created on the next `controller.communicate()` call.
+
+        This sets `self.scene_record`, `self.room`, `self.cabinetry`, and `self.footprints` but doesn't run the procedural generation pipeline.
+
+        :param kitchen: The [`GeneratedKitchen`](../proc_gen/generated_kitchen.md).
+        """
+
+        if kitchen.scene_name is not None:
+            if "scenes.json" not in Controller.SCENE_LIBRARIANS:
+                Controller.SCENE_LIBRARIANS["scenes.json"] = SceneLibrarian()
+            self.scene_record = Controller.SCENE_LIBRARIANS["scenes.json"].get_record(kitchen.scene_name)
+            self.room = self.scene_record.rooms[kitchen.room_index]
+        else:
+            self.scene_record = None
+            self.room = None
+        self.cabinetry = CABINETRY[kitchen.cabinetry_type]
+        self.footprints.clear()
+        self.footprints.add_commands(kitchen.commands)
+        self.commands.extend(kitchen.commands)
+
+    @staticmethod
+    def generate_batch(scenes: Union[str, SceneRecord, Room, List[Union[str, SceneRecord]]], seeds: List[int],
+                       room_index: int = 0, cabinetry_type: CabinetryType = None,
+                       workers: int = None, cache: KitchenCache = None) -> List[GeneratedKitchen]:
+        """
+        Procedurally generate many kitchens in parallel. This doesn't require a build.
+
+        Each kitchen is generated in a worker process with `create(scene=scenes, room_index=room_index, cabinetry_type=cabinetry_type, rng=seed)`, so its commands, including object IDs and container shape IDs, are the same as if `create()` were called in this process or in any other Python process. To create a kitchen, call `proc_gen_kitchen.load(kitchen)`.
+
+        :param scenes: The scene(s). See the `scene` parameter in `create()`. If this is a list, a scene is randomly selected per seed.
+        :param seeds: The random seeds. One kitchen will be generated per seed.
+        :param room_index: The index of the room in `SceneRecord.rooms`.
+        :param cabinetry_type: A [`CabinetryType`](../proc_gen/arrangements/cabinetry/cabinetry_type.md) value. If None, a `CabinetryType` is chosen randomly per seed.
+        :param workers: The number of worker processes. If None, this is the number of CPUs.
+        :param cache: An optional [`KitchenCache`](../proc_gen/kitchen_cache.md). If not None, kitchens are read from the cache if possible. Only the kitchens that aren't in the cache are generated, and then they are added to the cache.
+
+        :return: A list of [`GeneratedKitchen`](../proc_gen/generated_kitchen.md), one per seed.
+        """
+
+        kitchens: List[Optional[GeneratedKitchen]] = [None for _ in seeds]
+        if cache is not None:
+            for i, seed in enumerate(seeds):
+                kitchens[i] = cache.get(scene=scenes, room_index=room_index, cabinetry_type=cabinetry_type, seed=seed)
+        # Generate the kitchens that aren't in the cache.
+        misses = [i for i in range(len(seeds)) if kitchens[i] is None]
+        if len(misses) == 0:
+            return kitchens
+        args = [(scenes, room_index, cabinetry_type, seeds[i], None) for i in misses]
+        if workers == 1:
+            generated = [ProcGenKitchen._generate(*a) for a in args]
+        else:
+            with Pool(processes=workers) as pool:
+                generated = pool.starmap(ProcGenKitchen._generate, args)
+        for i, kitchen in zip(misses, generated):
+            kitchens[i] = kitchen
+            if cache is not None:
+                cache.put(scene=scenes, room_index=room_index, cabinetry_type=cabinetry_type, kitchen=kitchen)
+        return kitchens
+
+    @staticmethod
+    def write_batch(scenes: Union[str, SceneRecord, Room, List[Union[str, SceneRecord]]], seeds: List[int],
+                    output_directory: PATH, room_index: int = 0, cabinetry_type: CabinetryType = None,
+                    workers: int = None) -> List[Path]:
+        """
+        Procedurally generate many kitchens in parallel and write them to disk. This doesn't require a build. Each kitchen is written by its worker process, so the command lists are never sent back to this process.
+
+        To read a kitchen, call `GeneratedKitchen.read(path)`.
+
+        :param scenes: The scene(s). See the `scene` parameter in `create()`. If this is a list, a scene is randomly selected per seed.
+        :param seeds: The random seeds. One kitchen will be generated per seed.
+        :param output_directory: The output directory. Each kitchen is written to `<seed>.json`.
+        :param room_index: The index of the room in `SceneRecord.rooms`.
+        :param cabinetry_type: A [`CabinetryType`](../proc_gen/arrangements/cabinetry/cabinetry_type.md) value. If None, a `CabinetryType` is chosen randomly per seed.
+        :param workers: The number of worker processes. If None, this is the number of CPUs.
+
+        :return: The paths to the .json files, one per seed.
+        """
+
+        if isinstance(output_directory, str):
+            output_directory = Path(output_directory)
+        if not output_directory.exists():
+            output_directory.mkdir(parents=True)
+        paths = [output_directory.joinpath(f"{seed}.json") for seed in seeds]
+        args = [(scenes, room_index, cabinetry_type, seed, path) for seed, path in zip(seeds, paths)]
+        if workers == 1:
+            for a in args:
+                ProcGenKitchen._generate(*a)
+        else:
+            with Pool(processes=workers) as pool:
+                pool.starmap(ProcGenKitchen._generate, args)
+        return paths
+
     def get_initialization_commands(self) -> List[dict]:
         return []
 
     def on_send(self, resp: List[bytes]) -> None:
         pass
 
+    @staticmethod
+    def _generate(scene: Union[str, SceneRecord, Room, List[Union[str, SceneRecord]]], room_index: int,
+                  cabinetry_type: Optional[CabinetryType], seed: int, path: Optional[Path]) -> Optional[GeneratedKitchen]:
+        """
+        Generate a kitchen. This is called by worker processes.
+
+        :param scene: The scene. See the `scene` parameter in `create()`.
+        :param room_index: The index of the room in `SceneRecord.rooms`.
+        :param cabinetry_type: The cabinetry type. If None, a `CabinetryType` is chosen randomly.
+        :param seed: The random seed.
+        :param path: If not None, write the kitchen to this path and return None.
+
+        :return: The `GeneratedKitchen`, or None if `path` isn't None.
+        """
+
+        proc_gen_kitchen = ProcGenKitchen()
+        proc_gen_kitchen.create(scene=scene, room_index=room_index, cabinetry_type=cabinetry_type, rng=seed)
+        kitchen = GeneratedKitchen(seed=seed,
+                                   scene_name=proc_gen_kitchen.scene_record.name if proc_gen_kitchen.scene_record is not None else None,
+                                   room_index=room_index,
+                                   cabinetry_type=proc_gen_kitchen.cabinetry.name,
+                                   commands=proc_gen_kitchen.commands)
+        if path is None:
+            return kitchen
+        kitchen.write(path=path)
+        return None
+
     def _get_room(self, scene: Union[str, SceneRecord, Room, List[Union[str, SceneRecord]]], room_index: int) -> Room:
         """
         :param scene: The scene. Can be `str` (the name of the scene), `SceneRecord`, `Room`, or `List[Union[str, SceneRecord]]` (a list of scene names or records, in which case a scene will be randomly selected). The scene must at least one room; see `SceneRecord.rooms`.
@@ -351,7 +534,7 @@ class ProcGenKitchen(AddOn):
 
     def _get_lateral_arrangement(self, categories: List[str], corner: OrdinalDirection, wall: CardinalDirection,
                                  region: InteriorRegion, length: float = None, distance: float = 0,
-                                 check_object_position: bool = False, current_commands: List[dict] = None) -> List[dict]:
+                                 check_object_position: bool = False) -> List[dict]:
         """
         Generate a lateral arrangement of Arrangements along a wall.
 
@@ -361,8 +544,7 @@ class ProcGenKitchen(AddOn):
         :param region: The region that the arrangement is in.
         :param length: The length of the arrangement. If None, this is the length of the wall.
         :param distance: The starting distance from the corner.
-        :param check_object_position: If True, check for objects added on this frame and avoid placing objects too close.
-        :param current_commands: A list of commands added so far for this frame.
+        :param check_object_position: If True, check for objects in `self.footprints` and avoid placing objects too close.
 
         :return: A list of commands to generate a lateral arrangement.
         """
@@ -370,7 +552,6 @@ class ProcGenKitchen(AddOn):
         commands = []
         for category in categories:
             if check_object_position:
-                occupied = False
                 # Get the approximate position of the object.
                 if wall == CardinalDirection.north:
                     z = region.z_max - Arrangement.DEFAULT_CELL_SIZE / 2
@@ -417,25 +598,8 @@ class ProcGenKitchen(AddOn):
                     x += distance
                 else:
                     raise Exception(direction)
-                # Check if anything is nearby.
-                p = np.array([x, z])
-                if current_commands is not None:
-                    for command in current_commands:
-                        if command["$type"] != "add_object":
-                            continue
-                        if command["position"]["y"] > 0:
-                            continue
-                        else:
-                            if "counter_top" in command["name"]:
-                                model_library = "models_special.json"
-                            else:
-                                model_library = "models_core.json"
-                            extents = TDWUtils.get_bounds_extents(bounds=Controller.MODEL_LIBRARIANS[model_library].get_record(command["name"]).bounds)
-                            extent = (extents[0] if extents[0] > extents[2] else extents[2]) * 1.25
-                        if np.linalg.norm(p - np.array([command["position"]["x"], command["position"]["z"]])) < extent:
-                            occupied = True
-                            break
-                if occupied:
+                # Check if anything on the floor is nearby.
+                if self.footprints.is_near(x=x, z=z, scale=1.25, max_y=0):
                     category = "void"
             params = {"corner": corner,
                       "wall": wall,
@@ -692,14 +856,12 @@ class ProcGenKitchen(AddOn):
         return commands, walls
 
     def _get_secondary_lateral_arrangements(self, used_walls: List[CardinalDirection], region: InteriorRegion,
-                                            possible_categories: Dict[str, int], tall_category_replacement: str,
-                                            current_commands: List[dict]) -> List[dict]:
+                                            possible_categories: Dict[str, int], tall_category_replacement: str) -> List[dict]:
         """
         :param used_walls: A list of walls used in the primary arrangement (work triangle).
         :param region: The region.
         :param possible_categories: All possible categories for this arrangement.
         :param tall_category_replacement: If we need to replace tall objects, replace them with models from this category.
-        :param current_commands: The current list of commands. Used to check proximity.
 
         :return: A list of commands to add a secondary lateral arrangements on available walls.
         """
@@ -723,8 +885,7 @@ class ProcGenKitchen(AddOn):
                                                           length=region.get_length(wall) - Arrangement.DEFAULT_CELL_SIZE,
                                                           distance=Arrangement.DEFAULT_CELL_SIZE * 2,
                                                           region=region,
-                                                          check_object_position=True,
-                                                          current_commands=current_commands))
+                                                          check_object_position=True))
         return commands
 
     def _adjust_lateral_arrangement_categories(self, categories: List[str], wall: CardinalDirection,
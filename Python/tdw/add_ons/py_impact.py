@@ -23,6 +23,8 @@ from tdw.physics_audio.collision_audio_type import CollisionAudioType
 from tdw.physics_audio.collision_audio_event import CollisionAudioEvent
 from tdw.physics_audio.scrape_model import ScrapeModel, DEFAULT_SCRAPE_MODELS
 from tdw.physics_audio.scrape_material import ScrapeMaterial
+from tdw.physics_audio.voice_budget import VoiceBudget
+from tdw.physics_audio.audio_value_index import AudioValueIndex
 from tdw.object_data.rigidbody import Rigidbody
 from tdw.audio_constants import SAMPLE_RATE, CHANNELS, SAMPLE_WIDTH
 from tdw.add_ons.collision_manager import CollisionManager
@@ -147,7 +149,8 @@ class PyImpact(CollisionManager):
                  static_audio_data_overrides: Dict[int, ObjectAudioStatic] = None,
                  resonance_audio: bool = False, floor: AudioMaterial = AudioMaterial.wood_medium,
                  rng: np.random.RandomState = None, auto: bool = True, scrape: bool = True,
-                 scrape_objects: Dict[int, ScrapeModel] = None, min_time_between_impact_events: float = 0.25):
+                 scrape_objects: Dict[int, ScrapeModel] = None, min_time_between_impact_events: float = 0.25,
+                 voice_budget: VoiceBudget = None):
         """
         :param initial_amp: The initial amplitude, i.e. the "master volume". Must be > 0 and < 1.
         :param prevent_distortion: If True, clamp amp values to <= 0.99
@@ -160,6 +163,7 @@ class PyImpact(CollisionManager):
         :param scrape: If True, initialize certain objects as scrape surfaces: Change their visual material(s) and enable them for scrape audio. See: `tdw.physics_audio.scrape_model.DEFAULT_SCRAPE_MODELS`
         :param scrape_objects: If `scrape == True` and this is not None, this dictionary can be used to manually set scrape surfaces. Key = Object ID. Value = [`ScrapeModel`](../physics_audio/scrape_model.md).
         :param min_time_between_impact_events: The minimum time in seconds between two impact events that involve the same primary object.
+        :param voice_budget: If not None, this [`VoiceBudget`](../physics_audio/voice_budget.md) limits the number of concurrent sounds. Collision events that don't fit into the budget are dropped before audio is synthesized.
         """
 
         super().__init__()
@@ -243,10 +247,15 @@ class PyImpact(CollisionManager):
         Collision events on this frame. Key = Object ID. Value = [`CollisionAudioEvent`](../physics_audio/collision_audio_event.md).
         """
         self.collision_events: Dict[int, CollisionAudioEvent] = dict()
+        # The contact area of the most significant collision event of each primary object on the previous frame. Key = The primary object ID.
+        # This is keyed by object, not by (collider, collidee) pair, so that collisions are classified as impacts, scrapes, or rolls the same way as in previous versions of PyImpact.
+        self._previous_areas: Dict[int, float] = dict()
 
         self._cached_audio_info: bool = False
         # A dictionary of audio data. Key = Object ID; Value = `ObjectAudioStatic`.
         self._static_audio_data: Dict[int, ObjectAudioStatic] = dict()
+        # Derived audio values per scene. This isn't cleared in `reset()`.
+        self._derived_audio_values: Dict[tuple, Dict[int, Optional[Tuple[float, AudioMaterial, float]]]] = dict()
 
         # Summed scrape masters. Key = primary ID, secondary ID.
         self._scrape_summed_masters: Dict[Tuple[int, int], AudioSegment] = dict()
@@ -262,6 +271,10 @@ class PyImpact(CollisionManager):
         # Ongoing impact audio events. Key = Audio source ID. Value = Time of event.
         self._impact_events: Dict[int, float] = dict()
         self._min_time_between_impact_events: float = min_time_between_impact_events
+        """:field
+        If not None, this [`VoiceBudget`](../physics_audio/voice_budget.md) limits the number of concurrent sounds.
+        """
+        self.voice_budget: Optional[VoiceBudget] = voice_budget
 
     def get_initialization_commands(self) -> List[dict]:
         return [{"$type": "send_bounds"},
@@ -296,9 +309,17 @@ class PyImpact(CollisionManager):
                 # The audio source might not be in this dictionary (for example if this was a scrape event).
                 if audio_source_id in self._impact_events:
                     del self._impact_events[audio_source_id]
+                if self.voice_budget is not None:
+                    self.voice_budget.remove_voice(audio_source_id)
         # Get collision events.
         self._get_collision_types(resp=resp)
-        for object_id in self.collision_events:
+        # Drop events that don't fit into the voice budget.
+        if self.voice_budget is None:
+            object_ids = list(self.collision_events.keys())
+        else:
+            now = self._get_time()
+            object_ids = self.voice_budget.get_scheduled(events=self.collision_events, time=now)
+        for object_id in object_ids:
             command = None
             # Generate an impact sound.
             if self.collision_events[object_id].collision_type == CollisionAudioType.impact:
@@ -361,6 +382,10 @@ class PyImpact(CollisionManager):
             # Append impact sound commands.
             if command is not None:
                 self.commands.append(command)
+                if self.voice_budget is not None:
+                    # `num_frames` is the length of the 16-bit audio data in bytes.
+                    self.voice_budget.add_voice(object_id=object_id,
+                                                end_time=now + command["num_frames"] / (SAMPLE_RATE * SAMPLE_WIDTH))
 
     def _get_floor_material_name(self) -> str:
         """
@@ -375,13 +400,13 @@ class PyImpact(CollisionManager):
         """
         Get all collision types on this frame. Update previous area data.
 
+        The contact areas of every collision are calculated at once with `CollisionAudioEvent.get_contact_areas()`. The previous area data is a table of the most significant collision per primary object, not per pair of objects, because the classification of collisions depends on it.
+
         :param resp: The response from the build.
         """
 
         # Collision events per object on this frame. We'll only care about the most significant one.
         collision_events_per_object: Dict[int, List[CollisionAudioEvent]] = dict()
-        # Get the previous areas.
-        previous_areas: Dict[int, float] = {k: v.area for k, v in self.collision_events.items()}
         # Clear the collision events.
         self.collision_events.clear()
         rigidbody_data: Dict[int, Rigidbody] = dict()
@@ -401,32 +426,37 @@ class PyImpact(CollisionManager):
                     rigidbody_data[robot_joint_velocities.get_joint_id(j)] = Rigidbody(velocity=robot_joint_velocities.get_joint_velocity(j),
                                                                                        angular_velocity=robot_joint_velocities.get_joint_angular_velocity(j),
                                                                                        sleeping=robot_joint_velocities.get_joint_sleeping(j))
+        # Ignore collisions that include excluded objects.
+        obj_collision_ids = [object_ids for object_ids in self.obj_collisions
+                             if object_ids.int1 not in self._excluded_objects and
+                             object_ids.int2 not in self._excluded_objects]
+        env_collision_ids = [object_id for object_id in self.env_collisions if object_id not in self._excluded_objects]
+        # Calculate the contact areas of every collision at once.
+        areas = CollisionAudioEvent.get_contact_areas([self.obj_collisions[object_ids] for object_ids in obj_collision_ids] +
+                                                      [self.env_collisions[object_id] for object_id in env_collision_ids])
         # Get collision data.
-        for object_ids in self.obj_collisions:
+        for i, object_ids in enumerate(obj_collision_ids):
             collider_id = object_ids.int1
             collidee_id = object_ids.int2
-            # Ignore this collision.
-            if collider_id in self._excluded_objects or collidee_id in self._excluded_objects:
-                continue
             event = CollisionAudioEvent(collision=self.obj_collisions[object_ids],
                                         object_0_static=self._static_audio_data[collider_id],
                                         object_0_dynamic=rigidbody_data[collider_id],
                                         object_1_static=self._static_audio_data[collidee_id],
                                         object_1_dynamic=rigidbody_data[collidee_id],
-                                        previous_areas=previous_areas)
+                                        previous_areas=self._previous_areas,
+                                        area=float(areas[i]))
             # End an ongoing scrape, if any.
             if event.collision_type != CollisionAudioType.scrape:
                 self._end_scrape((event.primary_id, event.secondary_id))
             if event.primary_id not in collision_events_per_object:
                 collision_events_per_object[event.primary_id] = list()
             collision_events_per_object[event.primary_id].append(event)
-        for object_id in self.env_collisions:
-            if object_id in self._excluded_objects:
-                continue
+        for i, object_id in enumerate(env_collision_ids):
             event = CollisionAudioEvent(collision=self.env_collisions[object_id],
                                         object_0_static=self._static_audio_data[object_id],
                                         object_0_dynamic=rigidbody_data[object_id],
-                                        previous_areas=previous_areas)
+                                        previous_areas=self._previous_areas,
+                                        area=float(areas[len(obj_collision_ids) + i]))
             # End an ongoing scrape, if any.
             if event.collision_type != CollisionAudioType.scrape:
                 self._end_scrape((event.primary_id, event.secondary_id))
@@ -440,6 +470,10 @@ class PyImpact(CollisionManager):
             if len(events) > 0:
                 event: CollisionAudioEvent = max(events, key=lambda x: x.magnitude)
                 self.collision_events[event.primary_id] = event
+        # Update the previous areas for the next frame.
+        self._previous_areas.clear()
+        for primary_id in self.collision_events:
+            self._previous_areas[primary_id] = self.collision_events[primary_id].area
 
     def _get_object_modes(self, material: Union[str, AudioMaterial]) -> Modes:
         """
@@ -600,10 +634,10 @@ class PyImpact(CollisionManager):
                                       secondary_mass=secondary_mass, primary_resonance=primary_resonance, secondary_resonance=secondary_resonance)
         if sound is not None:
             if primary_id not in self._impact_events:
-                self._impact_events[primary_id] = time()
+                self._impact_events[primary_id] = self._get_time()
                 return self._get_audio_command(audio_source_id=primary_id, contact_points=contact_points, sound=sound)
             # Don't play too many impact events to avoid a droning effect.
-            elif time() - self._impact_events[primary_id] < self._min_time_between_impact_events:
+            elif self._get_time() - self._impact_events[primary_id] < self._min_time_between_impact_events:
                 return None
             else:
                 return self._get_audio_command(audio_source_id=primary_id, contact_points=contact_points, sound=sound)
@@ -888,7 +922,7 @@ class PyImpact(CollisionManager):
         # Scrape data is handled differently than impact data, so we'll create a dummy object first.
         sound = Base64Sound(np.array([0]))
         # Set the audio data.
-        sound.wav_str = base64.b64encode(unity_chunk.raw_data).decode()
+        sound.wav_bytes = base64.b64encode(unity_chunk.raw_data)
         sound.length = len(unity_chunk.raw_data)
         sound.bytes = unity_chunk.raw_data
         return sound
@@ -979,6 +1013,7 @@ class PyImpact(CollisionManager):
         self.object_modes.clear()
         # Clear collision data.
         self.collision_events.clear()
+        self._previous_areas.clear()
         # Clear scrape data.
         self._scrape_summed_masters.clear()
         self._scrape_start_velocities.clear()
@@ -987,6 +1022,9 @@ class PyImpact(CollisionManager):
         self._excluded_objects.clear()
         # Clear impact count.
         self._impact_events.clear()
+        # Clear ongoing voices.
+        if self.voice_budget is not None:
+            self.voice_budget.reset()
         # Clear ongoing commands.
         self.commands.clear()
         # Stop all ongoing audio.
@@ -1112,37 +1150,25 @@ class PyImpact(CollisionManager):
                 self._static_audio_data[object_id].object_id = object_id
             else:
                 need_to_derive.append(object_id)
-        current_values = self._static_audio_data.values()
+        # Derive audio values from comparable objects. Reuse the values if this is a repeated scene.
+        known = {k: (v.amp, v.material, v.resonance) for k, v in self._static_audio_data.items()}
+        scene_key = AudioValueIndex.get_scene_key(categories=categories, masses=object_masses, known=known)
+        if scene_key not in self._derived_audio_values:
+            if len(self._derived_audio_values) >= AudioValueIndex.MAX_NUM_CACHED_SCENES:
+                del self._derived_audio_values[next(iter(self._derived_audio_values))]
+            index = AudioValueIndex(categories=categories, masses=object_masses, known=known)
+            self._derived_audio_values[scene_key] = {object_id: index.get_values(object_id=object_id)
+                                                     for object_id in need_to_derive}
+        derived_values = self._derived_audio_values[scene_key]
         derived_data: Dict[int, ObjectAudioStatic] = dict()
         for object_id in need_to_derive:
-            # Fallback option: comparable objects in the same category.
-            objects_in_same_category = [o for o in categories if categories[o] == categories[object_id]]
-            if len(objects_in_same_category) > 0:
-                amps: List[float] = [a.amp for a in current_values]
-                materials: List[AudioMaterial] = [a.material for a in current_values]
-                resonances: List[float] = [a.resonance for a in current_values]
-            # Fallback option: Find objects with similar volume.
-            else:
-                amps: List[float] = list()
-                materials: List[AudioMaterial] = list()
-                resonances: List[float] = list()
-                for m_id in object_masses:
-                    if m_id == object_id or m_id not in self._static_audio_data:
-                        continue
-                    if np.abs(object_masses[m_id] / object_masses[object_id]) < 1.5:
-                        amps.append(self._static_audio_data[m_id].amp)
-                        materials.append(self._static_audio_data[m_id].material)
-                        resonances.append(self._static_audio_data[m_id].resonance)
             # Fallback option: Use default values.
-            if len(amps) == 0:
+            if derived_values[object_id] is None:
                 amp: float = PyImpact.DEFAULT_AMP
                 material: AudioMaterial = PyImpact.DEFAULT_MATERIAL
                 resonance: float = PyImpact.DEFAULT_RESONANCE
-            # Get averages or maximums of each value.
             else:
-                amp: float = round(sum(amps) / len(amps), 3)
-                material: AudioMaterial = max(set(materials), key=materials.count)
-                resonance: float = round(sum(resonances) / len(resonances), 3)
+                amp, material, resonance = derived_values[object_id]
             derived_data[object_id] = ObjectAudioStatic(name=names[object_id],
                                                         mass=object_masses[object_id],
                                                         material=material,
@@ -1213,20 +1239,23 @@ class PyImpact(CollisionManager):
         if scrape_key in self._scrape_previous_indices:
             del self._scrape_previous_indices[scrape_key]
 
+    def _get_time(self) -> float:
+        """
+        :return: The current time in seconds. This is used to space out successive impact events.
+        """
+
+        return time()
+
     def _get_audio_command(self, audio_source_id: int, contact_points: np.ndarray, sound: Base64Sound) -> dict:
         """
         :param audio_source_id: The audio source ID.
         :param contact_points: The collision contact points.
         :param sound: The Base64Sound object.
 
-        :return: A command to play audio data.
+        :return: A command to play audio data. The audio data is pre-serialized; see: [`PreSerializedCommand`](../pre_serialized_command.md).
         """
 
         point = np.mean(contact_points, axis=0)
-        return {"$type": "play_audio_data" if not self.resonance_audio else "play_point_source_data",
-                "id": audio_source_id,
-                "position": {"x": float(point[0]), "y": float(point[1]), "z": float(point[2])},
-                "num_frames": sound.length,
-                "num_channels": CHANNELS,
-                "frame_rate": SAMPLE_RATE,
-                "wav_data": sound.wav_str}
+        return sound.get_command(command_type="play_audio_data" if not self.resonance_audio else "play_point_source_data",
+                                 audio_source_id=audio_source_id,
+                                 position={"x": float(point[0]), "y": float(point[1]), "z": float(point[2])})
@@ -15,6 +15,7 @@ from tdw.replicant.action_status import ActionStatus
 from tdw.replicant.replicant_dynamic import ReplicantDynamic
 from tdw.replicant.replicant_static import ReplicantStatic
 from tdw.replicant.actions.action import Action
+from tdw.replicant.actions.action_summary import ActionSummary
 from tdw.replicant.actions.do_nothing import DoNothing
 from tdw.replicant.actions.look_at import LookAt
 from tdw.replicant.actions.reset_head import ResetHead
@@ -31,7 +32,7 @@ class ReplicantBase(AddOn, ABC):
 
     def __init__(self, replicant_id: int = 0, position: POSITION = None, rotation: ROTATION = None,
                  image_frequency: ImageFrequency = ImageFrequency.once, name: str = "replicant_0",
-                 target_framerate: int = 100):
+                 target_framerate: int = 100, copy_previous_action: bool = False):
         """
         :param replicant_id: The ID of the Replicant.
         :param position: The position of the Replicant as an x, y, z dictionary or numpy array. If None, defaults to `{"x": 0, "y": 0, "z": 0}`.
@@ -39,6 +40,7 @@ class ReplicantBase(AddOn, ABC):
         :param image_frequency: An [`ImageFrequency`](../replicant/image_frequency.md) value that sets how often images are captured.
         :param name: The name of the Replicant model.
         :param target_framerate: The target framerate. It's possible to set a higher target framerate, but doing so can lead to a loss of precision in agent movement.
+        :param copy_previous_action: If True, keep a deep copy of the previous action in `self.previous_action`. This is useful for debugging but it's slow; collision detection only needs an [`ActionSummary`](../replicant/actions/action_summary.md) of the previous action.
         """
 
         super().__init__()
@@ -68,7 +70,15 @@ class ReplicantBase(AddOn, ABC):
         """
         self.collision_detection: CollisionDetection = CollisionDetection()
         # This is used for collision detection. If the previous action is the "same" as this one, this action fails.
-        self._previous_action: Optional[Action] = None
+        self._previous_action: Optional[ActionSummary] = None
+        """:field
+        If True, keep a deep copy of the previous action in `self.previous_action`.
+        """
+        self.copy_previous_action: bool = copy_previous_action
+        """:field
+        A deep copy of the previous [action](../replicant/actions/action.md). This is None unless `self.copy_previous_action == True`.
+        """
+        self.previous_action: Optional[Action] = None
         # This is used when saving images.
         self._frame_count: int = 0
         # Initialize the Replicant metadata library.
@@ -177,8 +187,11 @@ class ReplicantBase(AddOn, ABC):
             if self.action.status != ActionStatus.ongoing:
                 # Mark the action as done.
                 self.action.done = True
-                # Remember the previous action.
-                self._previous_action = deepcopy(self.action)
+                # Remember a summary of the previous action.
+                self._previous_action = self.action.get_summary()
+                # Copying the whole action is slow, so only do it if requested.
+                if self.copy_previous_action:
+                    self.previous_action = deepcopy(self.action)
 
     @abstractmethod
     def reach_for(self, target: Union[TARGET, List[TARGET]], arm: Union[Arm, List[Arm]], absolute: bool = True,
@@ -330,6 +343,7 @@ class ReplicantBase(AddOn, ABC):
         self.initialized = False
         self.action = None
         self._previous_action = None
+        self.previous_action = None
         self._frame_count: int = 0
         self.collision_detection = CollisionDetection()
         self.__set_initial_position_and_rotation(position=position, rotation=rotation)
@@ -1,8 +1,11 @@
-from typing import List, Dict, Union
+from typing import List, Dict, Union, Tuple, Optional
+from multiprocessing import Pool
 import numpy as np
+from scipy.spatial import cKDTree
 from overrides import final
 from ikpy.link import OriginLink, URDFLink, Link
 from tdw.ikpy.chain import Chain
+from tdw.ikpy.numeric_chain import NumericChain
 from tdw.type_aliases import POSITION
 from tdw.tdw_utils import TDWUtils
 from tdw.quaternion_utils import QuaternionUtils
@@ -16,6 +19,11 @@ class RobotArm(Robot):
     This class includes an inverse kinematic (IK) solver that allows the robot to reach for a target position.
     """
 
+    """:class_var
+    The maximum number of IK solutions cached by `reach_candidates()`. If the cache is full, the oldest solutions are discarded.
+    """
+    MAX_NUM_CACHED_IK_SOLUTIONS: int = 10000
+
     def __init__(self, name: str, robot_id: int = 0, position: Dict[str, float] = None, rotation: Dict[str, float] = None,
                  source: Union[RobotLibrarian, RobotRecord] = None):
         """
@@ -42,6 +50,13 @@ class RobotArm(Robot):
                                   bounds=link["bounds"]))
         # Set robot arm IK chain.
         self._chain: Chain = Chain(name=name, links=links)
+        # A numeric version of the IK chain. This is used to solve IK for many targets.
+        self._numeric_chain: NumericChain = NumericChain(chain=self._chain)
+        # Previously solved IK targets relative to the robot and their solutions, oldest first. These are used to warm-start IK.
+        self._ik_cache_targets: np.ndarray = np.zeros(shape=(0, 3))
+        self._ik_cache_solutions: np.ndarray = np.zeros(shape=(0, len(links)))
+        # A KD tree of `self._ik_cache_targets`. This is rebuilt when it's needed and the cache has changed.
+        self._ik_cache_tree: Optional[cKDTree] = None
 
     def reach_for(self, target: POSITION) -> None:
         """
@@ -59,6 +74,74 @@ class RobotArm(Robot):
             targets[self.static.joint_ids_by_name[joint_name]] = angle
         self.set_joint_targets(targets=targets)
 
+    def reach_candidates(self, targets: np.ndarray, processes: int = 1, tolerance: float = 0.001,
+                         max_iter: int = None) -> Tuple[List[Dict[int, float]], np.ndarray]:
+        """
+        Solve IK for many candidate target positions without moving the robot, for example to find reachable grasp positions.
+
+        Each target is warm-started from the solution of the nearest previously solved target. Solutions within `tolerance` of their targets are cached so that subsequent calls to this function can warm-start from them; see `RobotArm.MAX_NUM_CACHED_IK_SOLUTIONS`. The cache is cleared by `reset()`.
+
+        To reach for a solution, call `set_joint_targets(solution)`.
+
+        :param targets: The target positions in worldspace. Shape: `(N, 3)`
+        :param processes: The number of worker processes. If 1, IK is solved in this process.
+        :param tolerance: If the distance between the end of the arm and a target is greater than this, IK is solved again from the current joint angles.
+        :param max_iter: The maximum number of optimizer iterations per target. If None, use the optimizer's default.
+
+        :return: Tuple: A list of IK solutions per target, and the distance in meters between the end of the arm and each target. Each solution is a dictionary of joint targets in degrees. Key = The ID of the joint.
+        """
+
+        initial_angles = self._get_initial_ik_angles()
+        relative_targets = np.array([self._absolute_to_relative(target=target) for target in targets]).reshape(-1, 3)
+        # Warm-start from the nearest cached solution.
+        warm_starts = None
+        if self._ik_cache_targets.shape[0] > 0:
+            if self._ik_cache_tree is None:
+                self._ik_cache_tree = cKDTree(self._ik_cache_targets)
+            indices = self._ik_cache_tree.query(relative_targets, k=1)[1]
+            warm_starts = self._ik_cache_solutions[indices]
+        if processes <= 1:
+            angles, errors = self._numeric_chain.inverse_kinematics_batch(target_positions=relative_targets,
+                                                                          initial_position=initial_angles,
+                                                                          warm_starts=warm_starts,
+                                                                          tolerance=tolerance,
+                                                                          max_iter=max_iter)
+        else:
+            chunks = np.array_split(np.arange(relative_targets.shape[0]), processes)
+            args = [(relative_targets[chunk], initial_angles, None if warm_starts is None else warm_starts[chunk],
+                     tolerance, max_iter) for chunk in chunks if chunk.shape[0] > 0]
+            with Pool(processes=processes) as pool:
+                results = pool.starmap(self._numeric_chain.inverse_kinematics_batch, args)
+            angles = np.concatenate([result[0] for result in results])
+            errors = np.concatenate([result[1] for result in results])
+        # Cache the solutions that converged. Discard the oldest solutions if the cache is full.
+        converged = errors <= tolerance
+        if np.any(converged):
+            self._ik_cache_targets = np.concatenate((self._ik_cache_targets,
+                                                     relative_targets[converged]))[-RobotArm.MAX_NUM_CACHED_IK_SOLUTIONS:]
+            self._ik_cache_solutions = np.concatenate((self._ik_cache_solutions,
+                                                       angles[converged]))[-RobotArm.MAX_NUM_CACHED_IK_SOLUTIONS:]
+            self._ik_cache_tree = None
+        # Convert the IK solutions to degrees. Remove the origin link.
+        solutions: List[Dict[int, float]] = list()
+        joint_ids = [self.static.joint_ids_by_name[joint_name] for joint_name in self._joint_order]
+        for solution in np.rad2deg(angles[:, 1:]):
+            solutions.append({joint_id: float(angle) for joint_id, angle in zip(joint_ids, solution)})
+        return solutions, errors
+
+    def reset(self, position: Dict[str, float] = None, rotation: Dict[str, float] = None) -> None:
+        """
+        Reset the robot. This clears the IK solutions cached by `reach_candidates()`.
+
+        :param position: The position of the robot.
+        :param rotation: The rotation of the robot.
+        """
+
+        super().reset(position=position, rotation=rotation)
+        self._ik_cache_targets = np.zeros(shape=(0, 3))
+        self._ik_cache_solutions = np.zeros(shape=(0, self._ik_cache_solutions.shape[1]))
+        self._ik_cache_tree = None
+
     def set_joint_targets(self, targets: Dict[int, Union[float, Dict[str, float]]]) -> None:
         """
         Set target angles or positions for a dictionary of joints.
@@ -94,11 +177,7 @@ class RobotArm(Robot):
         :return: A list of angles of an IK solution in radians.
         """
 
-        # Get the current angles of the joints.
-        initial_angles = [0]
-        for joint_name in self._joint_order:
-            initial_angles.append(self.dynamic.joints[self.static.joint_ids_by_name[joint_name]].angles[0])
-        initial_angles = np.radians(initial_angles)
+        initial_angles = self._get_initial_ik_angles()
         if isinstance(target, dict):
             target = TDWUtils.vector3_to_array(target)
         # Convert the worldspace position to a relative position.
@@ -106,6 +185,17 @@ class RobotArm(Robot):
         # Get the IK solution.
         return self._chain.inverse_kinematics(target_position=relative_target, initial_position=initial_angles)
 
+    @final
+    def _get_initial_ik_angles(self) -> np.ndarray:
+        """
+        :return: The current angles of the joints in radians, in the order of the IK chain. This includes the origin link.
+        """
+
+        initial_angles = [0]
+        for joint_name in self._joint_order:
+            initial_angles.append(self.dynamic.joints[self.static.joint_ids_by_name[joint_name]].angles[0])
+        return np.radians(initial_angles)
+
     @final
     def _absolute_to_relative(self, target: np.ndarray) -> np.ndarray:
         """
@@ -0,0 +1,291 @@
+from typing import List, Dict, Tuple, Set
+import numpy as np
+from tdw.output_data import OutputData, Bounds
+from tdw.add_ons.add_on import AddOn
+
+
+class SpatialIndex(AddOn):
+    """
+    A spatial index of the axis-aligned bounding boxes of every object in the scene. Use this add-on to find objects near a position, in a box, along a ray, or on top of another object without iterating through every object in Python.
+
+    Each object's bounding box is stored in a uniform hash grid. On every frame, only objects that have moved by more than `tolerance` are re-inserted into the grid. Every query accepts a numpy array of positions so that many queries can be answered at once.
+
+    ```python
+    import numpy as np
+    from tdw.controller import Controller
+    from tdw.add_ons.spatial_index import SpatialIndex
+
+    c = Controller()
+    spatial_index = SpatialIndex()
+    c.add_ons.append(spatial_index)
+    c.communicate(Controller.get_add_scene(scene_name="mm_kitchen_2a"))
+    # Get all objects within 1 meter of two positions.
+    object_ids = spatial_index.get_objects_in_radius(positions=np.array([[0, 0, 0], [1, 0, -1]]), radius=1)
+    c.communicate({"$type": "terminate"})
+    ```
+    """
+
+    def __init__(self, cell_size: float = 1, tolerance: float = 0.01):
+        """
+        :param cell_size: The size of each grid cell in meters.
+        :param tolerance: If an object's bounds have moved by less than this many meters, it isn't re-inserted into the grid.
+        """
+
+        super().__init__()
+        """:field
+        The size of each grid cell in meters.
+        """
+        self.cell_size: float = cell_size
+        """:field
+        If an object's bounds have moved by less than this many meters, it isn't re-inserted into the grid.
+        """
+        self.tolerance: float = tolerance
+        """:field
+        The ID of the object in each row of `self.mins` and `self.maxs`.
+        """
+        self.object_ids: np.ndarray = np.zeros(shape=0, dtype=np.int32)
+        """:field
+        The minimum (x, y, z) of each object's axis-aligned bounding box as a numpy array with shape `(n, 3)`.
+        """
+        self.mins: np.ndarray = np.zeros(shape=(0, 3))
+        """:field
+        The maximum (x, y, z) of each object's axis-aligned bounding box as a numpy array with shape `(n, 3)`.
+        """
+        self.maxs: np.ndarray = np.zeros(shape=(0, 3))
+        # Key = An object ID. Value = The row.
+        self._rows: Dict[int, int] = dict()
+        # The bounding boxes as they were when each object was inserted into the grid.
+        self._indexed_mins: np.ndarray = np.zeros(shape=(0, 3))
+        self._indexed_maxs: np.ndarray = np.zeros(shape=(0, 3))
+        # Key = A grid cell. Value = The rows of the objects whose bounding boxes overlap the cell.
+        self._cells: Dict[Tuple[int, int, int], Set[int]] = dict()
+        # The grid cells of each row.
+        self._row_cells: List[List[Tuple[int, int, int]]] = list()
+
+    def get_initialization_commands(self) -> List[dict]:
+        return [{"$type": "send_bounds",
+                 "frequency": "always"}]
+
+    def on_send(self, resp: List[bytes]) -> None:
+        bounds = None
+        for i in range(len(resp) - 1):
+            r_id = OutputData.get_data_type_id(resp[i])
+            if r_id == "boun":
+                bounds = Bounds(resp[i])
+                break
+        if bounds is None:
+            return
+        ids = bounds.get_ids()
+        # The bounds points are the centers of the faces of a rotated box, ordered: front, back, right, left, top, bottom, center.
+        # The half-extent of the axis-aligned box is the sum of the absolute half-axes of the rotated box.
+        points = bounds.get_bounds_positions().astype(np.float64)
+        half_extents = (np.abs(points[:, 0] - points[:, 1]) + np.abs(points[:, 2] - points[:, 3]) +
+                        np.abs(points[:, 4] - points[:, 5])) / 2
+        mins = points[:, 6] - half_extents
+        maxs = points[:, 6] + half_extents
+        # Rebuild the grid if objects were added or removed.
+        if not np.array_equal(ids, self.object_ids):
+            self.object_ids = np.copy(ids)
+            self._rows = {int(object_id): i for i, object_id in enumerate(self.object_ids)}
+            self.mins = mins
+            self.maxs = maxs
+            self._indexed_mins = np.copy(mins)
+            self._indexed_maxs = np.copy(maxs)
+            self._cells.clear()
+            self._row_cells = [list() for _ in range(len(self.object_ids))]
+            for row in range(len(self.object_ids)):
+                self._insert(row)
+            return
+        self.mins = mins
+        self.maxs = maxs
+        # Only update objects that moved beyond the tolerance. This includes objects that were teleported while asleep or kinematic.
+        moved = np.any((np.abs(mins - self._indexed_mins) > self.tolerance) |
+                       (np.abs(maxs - self._indexed_maxs) > self.tolerance), axis=1)
+        for row in np.nonzero(moved)[0]:
+            self._remove(row)
+            self._indexed_mins[row] = mins[row]
+            self._indexed_maxs[row] = maxs[row]
+            self._insert(row)
+
+    def get_objects_in_box(self, mins: np.ndarray, maxs: np.ndarray) -> List[np.ndarray]:
+        """
+        :param mins: The minimum (x, y, z) of each query box as a numpy array with shape `(m, 3)`.
+        :param maxs: The maximum (x, y, z) of each query box as a numpy array with shape `(m, 3)`.
+
+        :return: A list of numpy arrays of object IDs, one per query box. Each array contains the IDs of the objects whose bounding boxes overlap the box.
+        """
+
+        mins = np.asarray(mins, dtype=np.float64).reshape(-1, 3)
+        maxs = np.asarray(maxs, dtype=np.float64).reshape(-1, 3)
+        results: List[np.ndarray] = list()
+        for box_min, box_max in zip(mins, maxs):
+            rows = self._get_candidates(box_min=box_min, box_max=box_max)
+            overlap = np.all((self.mins[rows] <= box_max) & (self.maxs[rows] >= box_min), axis=1)
+            results.append(self.object_ids[rows[overlap]])
+        return results
+
+    def get_objects_in_radius(self, positions: np.ndarray, radius: float) -> List[np.ndarray]:
+        """
+        :param positions: The query positions as a numpy array with shape `(m, 3)`.
+        :param radius: The radius in meters.
+
+        :return: A list of numpy arrays of object IDs, one per position. Each array contains the IDs of the objects whose bounding boxes are within `radius` of the position.
+        """
+
+        positions = np.asarray(positions, dtype=np.float64).reshape(-1, 3)
+        results: List[np.ndarray] = list()
+        for position in positions:
+            rows = self._get_candidates(box_min=position - radius, box_max=position + radius)
+            distances = SpatialIndex._get_distances(position=position, mins=self.mins[rows], maxs=self.maxs[rows])
+            results.append(self.object_ids[rows[distances <= radius]])
+        return results
+
+    def get_nearest(self, positions: np.ndarray, k: int = 1) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        :param positions: The query positions as a numpy array with shape `(m, 3)`.
+        :param k: The number of nearest objects per position.
+
+        :return: Tuple: The IDs of the `k` nearest objects to each position as a numpy array with shape `(m, k)` and the distances to their bounding boxes as a numpy array with shape `(m, k)`, sorted by distance. If there are fewer than `k` objects, the remaining IDs are -1 and the remaining distances are `inf`.
+        """
+
+        positions = np.asarray(positions, dtype=np.float64).reshape(-1, 3)
+        ids = np.full(shape=(positions.shape[0], k), fill_value=-1, dtype=int)
+        distances = np.full(shape=(positions.shape[0], k), fill_value=np.inf)
+        n = len(self.object_ids)
+        if n == 0:
+            return ids, distances
+        # Get the distance from every position to every bounding box.
+        d = np.linalg.norm(np.maximum(np.maximum(self.mins[np.newaxis] - positions[:, np.newaxis], 0),
+                                      positions[:, np.newaxis] - self.maxs[np.newaxis]), axis=2)
+        num = min(k, n)
+        nearest = np.argpartition(d, num - 1, axis=1)[:, :num]
+        nearest_distances = np.take_along_axis(d, nearest, axis=1)
+        order = np.argsort(nearest_distances, axis=1)
+        nearest = np.take_along_axis(nearest, order, axis=1)
+        ids[:, :num] = self.object_ids[nearest]
+        distances[:, :num] = np.take_along_axis(nearest_distances, order, axis=1)
+        return ids, distances
+
+    def raycast(self, origins: np.ndarray, directions: np.ndarray, max_distance: float = np.inf) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Cast rays against the objects' bounding boxes. This doesn't send any commands to the build.
+
+        :param origins: The origin of each ray as a numpy array with shape `(m, 3)`.
+        :param directions: The direction of each ray as a numpy array with shape `(m, 3)`. These will be normalized.
+        :param max_distance: The maximum distance of each ray.
+
+        :return: Tuple: The ID of the first object hit by each ray as a numpy array with shape `(m,)` (or -1 if nothing was hit), and the distance to the hit as a numpy array with shape `(m,)` (or `inf`).
+        """
+
+        origins = np.asarray(origins, dtype=np.float64).reshape(-1, 3)
+        directions = np.asarray(directions, dtype=np.float64).reshape(-1, 3)
+        directions = directions / np.linalg.norm(directions, axis=1)[:, np.newaxis]
+        ids = np.full(shape=origins.shape[0], fill_value=-1, dtype=int)
+        hits = np.full(shape=origins.shape[0], fill_value=np.inf)
+        if len(self.object_ids) == 0:
+            return ids, hits
+        # Slab test of every ray against every box.
+        with np.errstate(divide="ignore", invalid="ignore"):
+            inverse = 1.0 / directions
+            t0 = (self.mins[np.newaxis] - origins[:, np.newaxis]) * inverse[:, np.newaxis]
+            t1 = (self.maxs[np.newaxis] - origins[:, np.newaxis]) * inverse[:, np.newaxis]
+        # Rays parallel to a slab are either always inside it or never inside it.
+        parallel = directions[:, np.newaxis] == 0
+        inside = (origins[:, np.newaxis] >= self.mins[np.newaxis]) & (origins[:, np.newaxis] <= self.maxs[np.newaxis])
+        t_near = np.where(parallel, np.where(inside, -np.inf, np.inf), np.minimum(t0, t1)).max(axis=2)
+        t_far = np.where(parallel, np.where(inside, np.inf, -np.inf), np.maximum(t0, t1)).min(axis=2)
+        t_near = np.maximum(t_near, 0)
+        hit = (t_near <= t_far) & (t_near <= max_distance)
+        t_near[~hit] = np.inf
+        first = np.argmin(t_near, axis=1)
+        distances = t_near[np.arange(origins.shape[0]), first]
+        valid = np.isfinite(distances)
+        ids[valid] = self.object_ids[first[valid]]
+        hits[valid] = distances[valid]
+        return ids, hits
+
+    def get_objects_on(self, object_id: int, tolerance: float = 0.05) -> np.ndarray:
+        """
+        :param object_id: The ID of a supporting object, for example a table.
+        :param tolerance: The maximum vertical distance in meters between the top of the supporting object and the bottom of an object on top of it.
+
+        :return: The IDs of every object whose bounding box bottom is within `tolerance` of the top of the object and that overlaps the object on the (x, z) plane.
+        """
+
+        row = self._rows[object_id]
+        top = self.maxs[row][1]
+        box_min = np.array([self.mins[row][0], top - tolerance, self.mins[row][2]])
+        box_max = np.array([self.maxs[row][0], top + tolerance, self.maxs[row][2]])
+        rows = self._get_candidates(box_min=box_min, box_max=box_max)
+        on = (np.abs(self.mins[rows, 1] - top) <= tolerance) & \
+             np.all((self.mins[rows][:, [0, 2]] <= box_max[[0, 2]]) & (self.maxs[rows][:, [0, 2]] >= box_min[[0, 2]]), axis=1) & \
+             (rows != row)
+        return self.object_ids[rows[on]]
+
+    def _insert(self, row: int) -> None:
+        """
+        Insert an object into each grid cell that its indexed bounding box overlaps.
+
+        :param row: The row of the object.
+        """
+
+        c0 = np.floor(self._indexed_mins[row] / self.cell_size).astype(int)
+        c1 = np.floor(self._indexed_maxs[row] / self.cell_size).astype(int)
+        cells = self._row_cells[row]
+        for ix in range(c0[0], c1[0] + 1):
+            for iy in range(c0[1], c1[1] + 1):
+                for iz in range(c0[2], c1[2] + 1):
+                    cell = (ix, iy, iz)
+                    if cell not in self._cells:
+                        self._cells[cell] = set()
+                    self._cells[cell].add(row)
+                    cells.append(cell)
+
+    def _remove(self, row: int) -> None:
+        """
+        Remove an object from the grid.
+
+        :param row: The row of the object.
+        """
+
+        for cell in self._row_cells[row]:
+            self._cells[cell].discard(row)
+            if len(self._cells[cell]) == 0:
+                del self._cells[cell]
+        self._row_cells[row].clear()
+
+    def _get_candidates(self, box_min: np.ndarray, box_max: np.ndarray) -> np.ndarray:
+        """
+        :param box_min: The minimum (x, y, z) of the query box.
+        :param box_max: The maximum (x, y, z) of the query box.
+
+        :return: The rows of every object in a grid cell that overlaps the query box. The box is expanded by `self.tolerance` because the indexed bounding boxes may be out of date by up to that amount.
+        """
+
+        c0 = np.floor((box_min - self.tolerance) / self.cell_size).astype(int)
+        c1 = np.floor((box_max + self.tolerance) / self.cell_size).astype(int)
+        rows: Set[int] = set()
+        # If the query box covers more cells than there are occupied cells, iterate through the occupied cells instead.
+        if np.prod(c1 - c0 + 1) > len(self._cells):
+            for cell in self._cells:
+                if np.all(c0 <= cell) and np.all(np.array(cell) <= c1):
+                    rows.update(self._cells[cell])
+        else:
+            for ix in range(c0[0], c1[0] + 1):
+                for iy in range(c0[1], c1[1] + 1):
+                    for iz in range(c0[2], c1[2] + 1):
+                        if (ix, iy, iz) in self._cells:
+                            rows.update(self._cells[(ix, iy, iz)])
+        return np.array(sorted(rows), dtype=int)
+
+    @staticmethod
+    def _get_distances(position: np.ndarray, mins: np.ndarray, maxs: np.ndarray) -> np.ndarray:
+        """
+        :param position: A position.
+        :param mins: The minimums of bounding boxes as a numpy array with shape `(n, 3)`.
+        :param maxs: The maximums of bounding boxes as a numpy array with shape `(n, 3)`.
+
+        :return: The distance from the position to each bounding box. If the position is inside a box, the distance is 0.
+        """
+
+        return np.linalg.norm(np.maximum(np.maximum(mins - position, 0), position - maxs), axis=1)
@@ -23,7 +23,7 @@ class WheelchairReplicant(ReplicantBase):
 
     def __init__(self, replicant_id: int = 0, position: POSITION = None, rotation: ROTATION = None,
                  image_frequency: ImageFrequency = ImageFrequency.once, name: str = "man_casual",
-                 target_framerate: int = 100):
+                 target_framerate: int = 100, copy_previous_action: bool = False):
         """
         :param replicant_id: The ID of the Replicant.
         :param position: The position of the Replicant as an x, y, z dictionary or numpy array. If None, defaults to `{"x": 0, "y": 0, "z": 0}`.
@@ -31,10 +31,12 @@ class WheelchairReplicant(ReplicantBase):
         :param image_frequency: An [`ImageFrequency`](../replicant/image_frequency.md) value that sets how often images are captured.
         :param name: The name of the Replicant model.
         :param target_framerate: The target framerate. It's possible to set a higher target framerate, but doing so can lead to a loss of precision in agent movement.
+        :param copy_previous_action: If True, keep a deep copy of the previous action in `self.previous_action`. This is useful for debugging but it's slow; collision detection only needs an [`ActionSummary`](../replicant/actions/action_summary.md) of the previous action.
         """
 
         super().__init__(replicant_id=replicant_id, position=position, rotation=rotation,
-                         image_frequency=image_frequency, name=name, target_framerate=target_framerate)
+                         image_frequency=image_frequency, name=name, target_framerate=target_framerate,
+                         copy_previous_action=copy_previous_action)
 
     def turn_by(self, angle: float, wheel_values: WheelValues = None, reset_arms: bool = True,
                 reset_arms_duration: float = 0.25, scale_reset_arms_duration: bool = True, arrived_at: float = 1):
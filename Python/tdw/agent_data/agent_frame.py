@@ -0,0 +1,166 @@
+from typing import List, Dict, Optional, Tuple, Union
+from tdw.output_data import OutputData, Transforms, Rigidbodies, Images, CameraMatrices, Replicants, DynamicRobots, \
+    Drones, Collision, EnvironmentCollision
+
+
+class AgentFrame:
+    """
+    A shared decode of the agent output data in a response from the build.
+
+    In a scene with many agents, each agent add-on (Replicant, Robot, Drone, etc.) needs its own data from the same response. `AgentFrame.get(resp)` decodes each type of agent output data at most once per response and indexes it by agent ID, so the cost of parsing the response doesn't scale with the number of agents.
+
+    ```python
+    from tdw.agent_data.agent_frame import AgentFrame
+
+    frame = AgentFrame.get(resp)
+    replicant = frame.get_replicant(replicant_id=0)
+    if replicant is not None:
+        replicants, index = replicant
+        print(replicants.get_position(index))
+    ```
+    """
+
+    """:class_var
+    The output data type for each output data ID that can be decoded.
+    """
+    OUTPUT_DATA_TYPES: Dict[str, type] = {"tran": Transforms,
+                                          "rigi": Rigidbodies,
+                                          "imag": Images,
+                                          "cama": CameraMatrices,
+                                          "repl": Replicants,
+                                          "drob": DynamicRobots,
+                                          "dron": Drones,
+                                          "coll": Collision,
+                                          "enco": EnvironmentCollision}
+    # The most recently decoded frame.
+    _FRAME: Optional["AgentFrame"] = None
+
+    def __init__(self, resp: List[bytes]):
+        """
+        :param resp: The response from the build.
+        """
+
+        """:field
+        The response from the build.
+        """
+        self.resp: List[bytes] = resp
+        # Key = An output data ID. Value = A list of output data objects. These are created when they are first requested.
+        self._output_data: Dict[str, List[OutputData]] = dict()
+        # Key = An output data ID. Value = A dictionary. Key = An agent ID. Value = The output data and the agent's index in the output data.
+        self._agents: Dict[str, Dict[int, Tuple[OutputData, int]]] = dict()
+        # Key = An output data ID. Value = A dictionary. Key = An avatar ID. Value = A list of output data, in the order they appear in the response.
+        self._avatars: Dict[str, Dict[str, List[OutputData]]] = dict()
+
+    @staticmethod
+    def get(resp: List[bytes]) -> "AgentFrame":
+        """
+        :param resp: The response from the build.
+
+        :return: The `AgentFrame` of this response. If this response was already decoded, the cached `AgentFrame` is returned.
+        """
+
+        if AgentFrame._FRAME is None or AgentFrame._FRAME.resp is not resp:
+            AgentFrame._FRAME = AgentFrame(resp=resp)
+        return AgentFrame._FRAME
+
+    def get_output_data(self, r_id: str) -> List[OutputData]:
+        """
+        :param r_id: The output data ID. See `AgentFrame.OUTPUT_DATA_TYPES`.
+
+        :return: Every output data object of this type in the response.
+        """
+
+        if r_id not in self._output_data:
+            output_data_type = AgentFrame.OUTPUT_DATA_TYPES[r_id]
+            self._output_data[r_id] = [output_data_type(self.resp[i]) for i in range(len(self.resp) - 1)
+                                       if OutputData.get_data_type_id(self.resp[i]) == r_id]
+        return self._output_data[r_id]
+
+    def get_transform(self, object_id: int) -> Optional[Tuple[Transforms, int]]:
+        """
+        :param object_id: The ID of the object or agent.
+
+        :return: Tuple: The `Transforms` output data and the index of the object, or None if the object isn't in the output data.
+        """
+
+        return self._get_agent(r_id="tran", agent_id=object_id)
+
+    def get_rigidbody(self, object_id: int) -> Optional[Tuple[Rigidbodies, int]]:
+        """
+        :param object_id: The ID of the object or agent.
+
+        :return: Tuple: The `Rigidbodies` output data and the index of the object, or None if the object isn't in the output data.
+        """
+
+        return self._get_agent(r_id="rigi", agent_id=object_id)
+
+    def get_replicant(self, replicant_id: int) -> Optional[Tuple[Replicants, int]]:
+        """
+        :param replicant_id: The ID of the Replicant or WheelchairReplicant.
+
+        :return: Tuple: The `Replicants` output data and the index of the Replicant, or None if the Replicant isn't in the output data.
+        """
+
+        return self._get_agent(r_id="repl", agent_id=replicant_id)
+
+    def get_drone(self, drone_id: int) -> Optional[Tuple[Drones, int]]:
+        """
+        :param drone_id: The ID of the drone.
+
+        :return: Tuple: The `Drones` output data and the index of the drone, or None if the drone isn't in the output data.
+        """
+
+        return self._get_agent(r_id="dron", agent_id=drone_id)
+
+    def get_images(self, avatar_id: str) -> List[Images]:
+        """
+        :param avatar_id: The ID of the avatar.
+
+        :return: Every `Images` output data of the avatar, in the order they appear in the response. This is empty if there are no images.
+        """
+
+        return self._get_avatar(r_id="imag", avatar_id=avatar_id)
+
+    def get_camera_matrices(self, avatar_id: str) -> Optional[CameraMatrices]:
+        """
+        :param avatar_id: The ID of the avatar.
+
+        :return: The last `CameraMatrices` output data of the avatar in the response, or None if there are no camera matrices.
+        """
+
+        camera_matrices = self._get_avatar(r_id="cama", avatar_id=avatar_id)
+        return camera_matrices[-1] if len(camera_matrices) > 0 else None
+
+    def _get_agent(self, r_id: str, agent_id: int) -> Optional[Tuple[OutputData, int]]:
+        """
+        :param r_id: The output data ID. The output data must have a `get_ids()` function.
+        :param agent_id: The agent ID.
+
+        :return: Tuple: The output data and the index of the agent, or None if the agent isn't in the output data. If the agent appears more than once, this is the last occurrence.
+        """
+
+        if r_id not in self._agents:
+            agents: Dict[int, Tuple[OutputData, int]] = dict()
+            for output_data in self.get_output_data(r_id=r_id):
+                for j, object_id in enumerate(output_data.get_ids().tolist()):
+                    agents[object_id] = (output_data, j)
+            self._agents[r_id] = agents
+        return self._agents[r_id].get(agent_id)
+
+    def _get_avatar(self, r_id: str, avatar_id: str) -> List[Union[Images, CameraMatrices]]:
+        """
+        :param r_id: The output data ID. The output data must have a `get_avatar_id()` function.
+        :param avatar_id: The avatar ID.
+
+        :return: Every output data of the avatar, in the order they appear in the response. This is empty if the avatar isn't in the output data.
+        """
+
+        if r_id not in self._avatars:
+            avatars: Dict[str, List[OutputData]] = dict()
+            for output_data in self.get_output_data(r_id=r_id):
+                a_id = output_data.get_avatar_id()
+                if a_id not in avatars:
+                    avatars[a_id] = list()
+                avatars[a_id].append(output_data)
+            self._avatars[r_id] = avatars
+        return self._avatars[r_id].get(avatar_id, [])
@@ -14,17 +14,18 @@ class CollisionBase(ABC):
         :param collision: The collision output data.
         """
 
+        """:field
+        The contact point normals and positions as a numpy array of shape `(n, 2, 3)`. `contacts[:, 0]` are the normals and `contacts[:, 1]` are the positions.
+        """
+        self.contacts: np.ndarray = collision.get_contacts().astype(np.float64)
         """:field
         The contact point positions.
         """
-        self.points: List[np.ndarray] = list()
+        self.points: List[np.ndarray] = list(self.contacts[:, 1])
         """:field
         The contact point normals.
         """
-        self.normals: List[np.ndarray] = list()
-        for i in range(collision.get_num_contacts()):
-            self.points.append(np.array(collision.get_contact_point(i)))
-            self.normals.append(np.array(collision.get_contact_normal(i)))
+        self.normals: List[np.ndarray] = list(self.contacts[:, 0])
         """:field
         The state of the collision.
         """
@@ -1,5 +1,4 @@
 import zmq
-import json
 import os
 from subprocess import Popen
 from typing import List, Union, Tuple, Dict
@@ -12,6 +11,7 @@ from tdw.output_data import Version, QuitSignal
 from tdw.version import __version__
 from tdw.backend.update import Update
 from tdw.add_ons.add_on import AddOn
+from tdw.pre_serialized_command import PreSerializedCommand
 from tdw.physics_audio.object_audio_static import DEFAULT_OBJECT_AUDIO_STATIC_DATA
 from tdw.physics_audio.audio_material import AudioMaterial
 from tdw.physics_audio.audio_material_constants import STATIC_FRICTION, DYNAMIC_FRICTION, DENSITIES
@@ -129,7 +129,7 @@ class Controller:
             m.before_send(commands)
 
         # Serialize the message.
-        msg = [json.dumps(commands).encode('utf-8')]
+        msg = [PreSerializedCommand.serialize(commands)]
         # Send the commands.
         self.socket.send_multipart(msg)
         # Receive output data.
@@ -290,7 +290,8 @@ class Controller:
                 # Select the most common material and bounciness.
                 else:
                     materials: List[AudioMaterial] = [DEFAULT_OBJECT_AUDIO_STATIC_DATA[r.name].material for r in records]
-                    material: AudioMaterial = max(set(materials), key=materials.count)
+                    # Break ties by the order of the records so that the material doesn't depend on the hash seed.
+                    material: AudioMaterial = max(dict.fromkeys(materials), key=materials.count)
                     bouncinesses = [DEFAULT_OBJECT_AUDIO_STATIC_DATA[r.name].bounciness for r in records]
                     bounciness = round(sum(bouncinesses) / len(bouncinesses), 3)
                 # Derive the mass.
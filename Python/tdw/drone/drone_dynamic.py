@@ -1,6 +1,6 @@
 from typing import List
 import numpy as np
-from tdw.output_data import OutputData, Drones
+from tdw.agent_data.agent_frame import AgentFrame
 from tdw.agent_data.agent_dynamic import AgentDynamic
 
 
@@ -31,14 +31,11 @@ class DroneDynamic(AgentDynamic):
         self.motor_on: bool = False
 
         self.avatar_id = str(drone_id)
-        for i in range(len(resp) - 1):
-            r_id = OutputData.get_data_type_id(resp[i])
-            # Get the data for this drone.
-            if r_id == "dron":
-                drones = Drones(resp[i])
-                for j in range(drones.get_num()):
-                    if self._agent_id == drones.get_id(j):
-                        self.raycast_hit = drones.get_raycast_hit(j)
-                        if self.raycast_hit:
-                            self.raycast_point = drones.get_raycast(j)
-                        self.motor_on = drones.get_motor_on(j)
+        # Get the data for this drone.
+        drone = AgentFrame.get(resp).get_drone(drone_id=self._agent_id)
+        if drone is not None:
+            drones, j = drone
+            self.raycast_hit = drones.get_raycast_hit(j)
+            if self.raycast_hit:
+                self.raycast_point = drones.get_raycast(j)
+            self.motor_on = drones.get_motor_on(j)
@@ -0,0 +1,327 @@
+from hashlib import sha256
+from typing import Dict, List, Optional, Tuple, Union
+import numpy as np
+from scipy.ndimage import distance_transform_edt
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import dijkstra
+
+
+class GridPathPlanner:
+    """
+    Plan paths on an occupancy map without sending any commands to the build.
+
+    This is an alternative to `send_nav_mesh_path`, which requires one round trip to the build per path. The planner builds a graph of the free cells of an [`OccupancyMap`](add_ons/occupancy_map.md) and runs Dijkstra's algorithm from every origin at once, so that many paths can be planned in a single call.
+
+    Cells are connected to their 8 neighbors. Diagonal moves aren't allowed to cut the corner of a non-free cell. If `clearance` is greater than 0, cells that are closer than `clearance` to a non-free cell aren't traversable.
+
+    ```python
+    from tdw.controller import Controller
+    from tdw.add_ons.occupancy_map import OccupancyMap
+    from tdw.add_ons.replicant import Replicant
+    from tdw.replicant.action_status import ActionStatus
+
+    c = Controller()
+    occupancy_map = OccupancyMap()
+    replicant = Replicant()
+    c.add_ons.extend([occupancy_map, replicant])
+    c.communicate(Controller.get_add_scene(scene_name="mm_kitchen_2a"))
+    occupancy_map.generate(cell_size=0.25)
+    c.communicate([])
+    planner = occupancy_map.get_path_planner(clearance=0.25)
+    path = planner.get_path(origin=replicant.dynamic.transform.position, destination={"x": 1, "y": 0, "z": -1})
+    # The first waypoint is the origin.
+    for waypoint in path[1:]:
+        replicant.move_to(target=waypoint)
+        while replicant.action.status == ActionStatus.ongoing:
+            c.communicate([])
+    c.communicate({"$type": "terminate"})
+    ```
+
+    Planners can be expensive to build for large maps, so `GridPathPlanner.get()` caches them per occupancy map and clearance.
+    """
+
+    """:class_var
+    The maximum number of planners cached by `GridPathPlanner.get()`.
+    """
+    MAX_CACHED_PLANNERS: int = 16
+    """:class_var
+    The maximum number of shortest-path trees cached per planner. Each tree has one entry per cell.
+    """
+    MAX_CACHED_TREES: int = 256
+    # Cached planners. Key = A hash of the occupancy map, positions, and clearance.
+    _PLANNERS: Dict[str, "GridPathPlanner"] = dict()
+    # The neighbor offsets. Each pair of neighbors is only listed once because the graph is undirected.
+    _OFFSETS: List[Tuple[int, int]] = [(1, 0), (0, 1), (1, 1), (1, -1)]
+
+    def __init__(self, occupancy_map: np.ndarray, positions: np.ndarray, clearance: float = 0):
+        """
+        :param occupancy_map: The occupancy map. See: `OccupancyMap.occupancy_map`. Only cells with a value of 0 are free.
+        :param positions: The worldspace (x, z) position of each cell. See: `OccupancyMap.positions`.
+        :param clearance: The minimum distance in meters between a traversable cell and a non-free cell.
+        """
+
+        """:field
+        The occupancy map.
+        """
+        self.occupancy_map: np.ndarray = occupancy_map
+        """:field
+        The worldspace (x, z) position of each cell.
+        """
+        self.positions: np.ndarray = positions
+        """:field
+        The minimum distance in meters between a traversable cell and a non-free cell.
+        """
+        self.clearance: float = clearance
+        # Get the grid axes so that worldspace positions can be converted to cells.
+        self._origin: np.ndarray = positions[0][0].astype(np.float64)
+        width, length = occupancy_map.shape
+        axis_0 = positions[1][0] - positions[0][0] if width > 1 else None
+        axis_1 = positions[0][1] - positions[0][0] if length > 1 else None
+        if axis_0 is None and axis_1 is None:
+            cell_size = 1.0
+        else:
+            cell_size = float(np.linalg.norm(axis_0 if axis_0 is not None else axis_1))
+        if axis_0 is None:
+            axis_0 = np.array([axis_1[1], -axis_1[0]]) if axis_1 is not None else np.array([cell_size, 0])
+        if axis_1 is None:
+            axis_1 = np.array([-axis_0[1], axis_0[0]])
+        # This converts a worldspace offset from the origin into (fractional) cell indices.
+        self._to_cell: np.ndarray = np.linalg.inv(np.column_stack((axis_0, axis_1)).astype(np.float64))
+        """:field
+        The size of each cell in meters.
+        """
+        self.cell_size: float = cell_size
+        """:field
+        The distance in meters from each cell to the nearest non-free cell. Non-free cells have a distance of 0.
+        """
+        self.distances: np.ndarray = distance_transform_edt(occupancy_map == 0) * cell_size
+        """:field
+        A 2D boolean numpy array. True if the cell is traversable.
+        """
+        self.traversable: np.ndarray = (occupancy_map == 0) & (self.distances > clearance)
+        # For each cell, the nearest traversable cell. This is used to snap origins and destinations to the graph.
+        if np.any(self.traversable):
+            self._nearest_traversable: Optional[np.ndarray] = distance_transform_edt(~self.traversable,
+                                                                                     return_distances=False,
+                                                                                     return_indices=True)
+        else:
+            self._nearest_traversable = None
+        self._graph: csr_matrix = self._get_graph()
+        # Cached shortest-path trees. Key = The origin node. Value = Tuple: distances, predecessors.
+        self._trees: Dict[int, Tuple[np.ndarray, np.ndarray]] = dict()
+
+    @staticmethod
+    def get(occupancy_map: np.ndarray, positions: np.ndarray, clearance: float = 0) -> "GridPathPlanner":
+        """
+        Get a cached planner, or create one if there isn't a cached planner for this occupancy map and clearance.
+
+        :param occupancy_map: The occupancy map. See: `OccupancyMap.occupancy_map`.
+        :param positions: The worldspace (x, z) position of each cell. See: `OccupancyMap.positions`.
+        :param clearance: The minimum distance in meters between a traversable cell and a non-free cell.
+
+        :return: A `GridPathPlanner`.
+        """
+
+        h = sha256()
+        h.update(np.ascontiguousarray(occupancy_map).tobytes())
+        h.update(str(occupancy_map.shape).encode("utf-8"))
+        h.update(np.ascontiguousarray(positions, dtype=np.float64).tobytes())
+        h.update(str(clearance).encode("utf-8"))
+        key = h.hexdigest()
+        if key in GridPathPlanner._PLANNERS:
+            # Mark the planner as recently used.
+            planner = GridPathPlanner._PLANNERS.pop(key)
+        else:
+            planner = GridPathPlanner(occupancy_map=occupancy_map, positions=positions, clearance=clearance)
+            # Remove the least recently used planner.
+            if len(GridPathPlanner._PLANNERS) >= GridPathPlanner.MAX_CACHED_PLANNERS:
+                del GridPathPlanner._PLANNERS[next(iter(GridPathPlanner._PLANNERS))]
+        GridPathPlanner._PLANNERS[key] = planner
+        return planner
+
+    def get_cells(self, positions: np.ndarray) -> np.ndarray:
+        """
+        :param positions: A numpy array of worldspace positions with shape `(n, 2)` (x, z) or `(n, 3)` (x, y, z).
+
+        :return: A numpy array of the nearest cell of each position with shape `(n, 2)`. Positions outside of the occupancy map are clamped to its edges.
+        """
+
+        positions = np.asarray(positions, dtype=np.float64)
+        if positions.shape[1] == 3:
+            positions = positions[:, [0, 2]]
+        cells = np.rint((positions - self._origin) @ self._to_cell.T).astype(int)
+        return np.clip(cells, 0, np.array(self.occupancy_map.shape) - 1)
+
+    def get_paths(self, origins: np.ndarray, destinations: np.ndarray) -> List[List[Optional[np.ndarray]]]:
+        """
+        Plan a path from every origin to every destination.
+
+        Origins and destinations that aren't traversable are snapped to the nearest traversable cell.
+
+        :param origins: A numpy array of worldspace origins with shape `(n, 2)` (x, z) or `(n, 3)` (x, y, z).
+        :param destinations: A numpy array of worldspace destinations with shape `(m, 2)` or `(m, 3)`.
+
+        :return: A list of lists of paths. `paths[i][j]` is the path from origin `i` to destination `j`: a numpy array of worldspace waypoints with shape `(k, 3)` where y is 0, or None if there is no path. Waypoints are cell positions; intermediate waypoints are only included where the path changes direction. Each waypoint can be used as a target for `replicant.move_to(target)`.
+        """
+
+        origin_nodes = self._get_nodes(positions=origins)
+        destination_nodes = self._get_nodes(positions=destinations)
+        trees = self._get_trees(origin_nodes=origin_nodes)
+        paths: List[List[Optional[np.ndarray]]] = list()
+        for origin_node in origin_nodes:
+            if origin_node < 0:
+                paths.append([None for _ in destination_nodes])
+                continue
+            distances, predecessors = trees[int(origin_node)]
+            origin_paths: List[Optional[np.ndarray]] = list()
+            for destination_node in destination_nodes:
+                if destination_node < 0 or np.isinf(distances[destination_node]):
+                    origin_paths.append(None)
+                else:
+                    origin_paths.append(self._get_waypoints(predecessors=predecessors, destination_node=destination_node))
+            paths.append(origin_paths)
+        return paths
+
+    def get_path(self, origin: Union[np.ndarray, Dict[str, float]],
+                 destination: Union[np.ndarray, Dict[str, float]]) -> Optional[np.ndarray]:
+        """
+        Plan a single path. See: `get_paths()`.
+
+        :param origin: The worldspace origin as either a numpy array or an (x, y, z) dictionary.
+        :param destination: The worldspace destination as either a numpy array or an (x, y, z) dictionary.
+
+        :return: A numpy array of worldspace waypoints with shape `(k, 3)`, or None if there is no path.
+        """
+
+        return self.get_paths(origins=np.array([GridPathPlanner._get_xz(origin)]),
+                              destinations=np.array([GridPathPlanner._get_xz(destination)]))[0][0]
+
+    def get_path_lengths(self, origins: np.ndarray, destinations: np.ndarray) -> np.ndarray:
+        """
+        Get the length of the path from every origin to every destination. This is faster than `get_paths()` because the paths aren't converted to waypoints.
+
+        :param origins: A numpy array of worldspace origins with shape `(n, 2)` (x, z) or `(n, 3)` (x, y, z).
+        :param destinations: A numpy array of worldspace destinations with shape `(m, 2)` or `(m, 3)`.
+
+        :return: A numpy array of path lengths in meters with shape `(n, m)`. If there is no path, the length is `inf`.
+        """
+
+        origin_nodes = self._get_nodes(positions=origins)
+        destination_nodes = self._get_nodes(positions=destinations)
+        lengths = np.full(shape=(len(origin_nodes), len(destination_nodes)), fill_value=np.inf)
+        valid_destinations = destination_nodes >= 0
+        trees = self._get_trees(origin_nodes=origin_nodes)
+        for i, origin_node in enumerate(origin_nodes):
+            if origin_node < 0:
+                continue
+            lengths[i, valid_destinations] = trees[int(origin_node)][0][destination_nodes[valid_destinations]]
+        return lengths
+
+    def _get_graph(self) -> csr_matrix:
+        """
+        :return: A sparse adjacency matrix of the traversable cells. Each node is a flattened cell index.
+        """
+
+        width, length = self.traversable.shape
+        node_indices = np.arange(width * length).reshape(width, length)
+        rows: List[np.ndarray] = list()
+        columns: List[np.ndarray] = list()
+        weights: List[np.ndarray] = list()
+        for dx, dz in GridPathPlanner._OFFSETS:
+            # Slice the grid so that `a` and `b` are neighbors.
+            ax = slice(0, width - dx)
+            bx = slice(dx, width)
+            if dz >= 0:
+                az = slice(0, length - dz)
+                bz = slice(dz, length)
+            else:
+                az = slice(-dz, length)
+                bz = slice(0, length + dz)
+            mask = self.traversable[ax, az] & self.traversable[bx, bz]
+            # Don't cut corners.
+            if dx != 0 and dz != 0:
+                mask &= self.traversable[bx, az] & self.traversable[ax, bz]
+            rows.append(node_indices[ax, az][mask])
+            columns.append(node_indices[bx, bz][mask])
+            weights.append(np.full(shape=np.count_nonzero(mask), fill_value=self.cell_size * np.sqrt(dx * dx + dz * dz)))
+        return csr_matrix((np.concatenate(weights), (np.concatenate(rows), np.concatenate(columns))),
+                          shape=(width * length, width * length))
+
+    def _get_nodes(self, positions: np.ndarray) -> np.ndarray:
+        """
+        :param positions: A numpy array of worldspace positions with shape `(n, 2)` or `(n, 3)`.
+
+        :return: The node of each position, snapped to the nearest traversable cell. If no cells are traversable, the node is -1.
+        """
+
+        positions = np.asarray(positions, dtype=np.float64)
+        if self._nearest_traversable is None:
+            return np.full(shape=positions.shape[0], fill_value=-1, dtype=int)
+        cells = self.get_cells(positions=positions)
+        ix = self._nearest_traversable[0][cells[:, 0], cells[:, 1]]
+        iz = self._nearest_traversable[1][cells[:, 0], cells[:, 1]]
+        return ix * self.traversable.shape[1] + iz
+
+    def _get_trees(self, origin_nodes: np.ndarray) -> Dict[int, Tuple[np.ndarray, np.ndarray]]:
+        """
+        Get the shortest-path tree of each origin. Trees that aren't cached are calculated in a single batched call to Dijkstra's algorithm and then cached.
+
+        :param origin_nodes: The origin nodes. Nodes less than 0 are ignored.
+
+        :return: A dictionary of shortest-path trees. Key = The origin node. Value = Tuple: The distance from the origin to every node, and the predecessor of every node.
+        """
+
+        trees: Dict[int, Tuple[np.ndarray, np.ndarray]] = dict()
+        uncached: List[int] = list()
+        for origin_node in np.unique(origin_nodes[origin_nodes >= 0]):
+            origin_node = int(origin_node)
+            if origin_node in self._trees:
+                trees[origin_node] = self._trees[origin_node]
+            else:
+                uncached.append(origin_node)
+        if len(uncached) == 0:
+            return trees
+        distances, predecessors = dijkstra(self._graph, directed=False, indices=uncached, return_predecessors=True)
+        for i, origin_node in enumerate(uncached):
+            trees[origin_node] = (distances[i], predecessors[i])
+            # Remove the oldest tree.
+            if len(self._trees) >= GridPathPlanner.MAX_CACHED_TREES:
+                del self._trees[next(iter(self._trees))]
+            self._trees[origin_node] = trees[origin_node]
+        return trees
+
+    def _get_waypoints(self, predecessors: np.ndarray, destination_node: int) -> np.ndarray:
+        """
+        :param predecessors: The predecessors of a shortest-path tree.
+        :param destination_node: The destination node.
+
+        :return: The path from the origin of the tree to the destination as worldspace waypoints.
+        """
+
+        nodes = [int(destination_node)]
+        while predecessors[nodes[-1]] >= 0:
+            nodes.append(int(predecessors[nodes[-1]]))
+        nodes.reverse()
+        cells = np.column_stack(np.unravel_index(nodes, self.traversable.shape))
+        # Only keep waypoints where the path changes direction.
+        if len(cells) > 2:
+            steps = np.diff(cells, axis=0)
+            turns = np.any(steps[1:] != steps[:-1], axis=1)
+            cells = np.concatenate((cells[:1], cells[1:-1][turns], cells[-1:]))
+        xz = self.positions[cells[:, 0], cells[:, 1]]
+        return np.column_stack((xz[:, 0], np.zeros(len(xz)), xz[:, 1]))
+
+    @staticmethod
+    def _get_xz(position: Union[np.ndarray, Dict[str, float]]) -> np.ndarray:
+        """
+        :param position: A position as either a numpy array or an (x, y, z) dictionary.
+
+        :return: The (x, z) coordinates of the position.
+        """
+
+        if isinstance(position, dict):
+            return np.array([position["x"], position["z"]], dtype=np.float64)
+        position = np.asarray(position, dtype=np.float64)
+        if position.shape[0] == 3:
+            return position[[0, 2]]
+        return position
@@ -37,6 +37,8 @@ class Chain:
                 link.axis_length = self.links[index - 1].axis_length
         # Optional argument
         self._urdf_metadata = urdf_metadata
+        # The numeric version of this chain, used for batched forward kinematics. It is created when it is first needed.
+        self._numeric_chain = None
 
         # If the active_links_mask is not given, set it to True for every link
         if active_links_mask is not None:
@@ -90,6 +92,28 @@ class Chain:
         else:
             return frame_matrix
 
+    def forward_kinematics_batch(self, joints, full_kinematics=False):
+        """Returns the transformation matrices of the forward kinematics of many joint configurations
+
+        The constant part of each link matrix is precomputed, and the link matrices of all configurations are multiplied as stacked arrays.
+
+        Parameters
+        ----------
+        joints: numpy.array
+            Array of shape (N, len(links)): the positions of each joint per configuration. Note : Inactive joints must be in the array.
+        full_kinematics: bool
+            Return the transformation matrices of each joint
+
+        Returns
+        -------
+        frame_matrixes: numpy.array
+            Array of shape (N, 4, 4): the transformation matrix per configuration. If full_kinematics, the array has shape (N, len(links), 4, 4).
+        """
+        if self._numeric_chain is None:
+            from tdw.ikpy.numeric_chain import NumericChain
+            self._numeric_chain = NumericChain(chain=self)
+        return self._numeric_chain.forward_kinematics_batch(joints=joints, full_kinematics=full_kinematics)
+
     def inverse_kinematics(self, target_position=None, target_orientation=None, orientation_mode=None, **kwargs):
         """
 
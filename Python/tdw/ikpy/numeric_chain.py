@@ -0,0 +1,226 @@
+from typing import List, Tuple, Optional
+import numpy as np
+from scipy.optimize import minimize
+from ikpy.link import URDFLink, OriginLink
+from ikpy.utils.geometry import homogeneous_translation_matrix, cartesian_to_homogeneous, rpy_matrix
+from tdw.ikpy.chain import Chain
+
+
+class NumericChain:
+    """
+    A numeric version of an IK [`Chain`](chain.md).
+
+    `Chain.inverse_kinematics()` evaluates ikpy's symbolic link matrices for every link on every iteration of the optimizer, and estimates the gradient with finite differences. `NumericChain` precomputes the constant part of each link's transform (translation and orientation) and evaluates only the joint rotations per iteration. The optimizer uses an analytic Jacobian.
+
+    A `NumericChain` only contains numpy arrays, so it can be sent to worker processes.
+    """
+
+    def __init__(self, chain: Chain):
+        """
+        :param chain: The IK chain. Each link must be a `URDFLink` or an `OriginLink`.
+        """
+
+        num_links = len(chain.links)
+        """:field
+        The constant transform matrix of each link (translation and orientation). Shape: `(num_links, 4, 4)`
+        """
+        self.constant_matrices: np.ndarray = np.zeros(shape=(num_links, 4, 4))
+        """:field
+        The rotation axis of each link. If a link doesn't rotate, the axis is `[0, 0, 0]`. Shape: `(num_links, 3)`
+        """
+        self.rotation_axes: np.ndarray = np.zeros(shape=(num_links, 3))
+        """:field
+        If True, the corresponding link is a rotating joint that is optimized by the IK solver. Shape: `(num_links)`
+        """
+        self.active: np.ndarray = np.zeros(shape=num_links, dtype=bool)
+        # The lower and upper bounds of each active joint. None = no bound.
+        self._bounds: List[Tuple[Optional[float], Optional[float]]] = list()
+        for i, link in enumerate(chain.links):
+            if isinstance(link, OriginLink):
+                self.constant_matrices[i] = np.eye(4)
+            elif isinstance(link, URDFLink):
+                self.constant_matrices[i] = np.dot(homogeneous_translation_matrix(*link.translation_vector),
+                                                   cartesian_to_homogeneous(rpy_matrix(*link.orientation)))
+                if link.rotation is not None:
+                    self.rotation_axes[i] = link.rotation
+                    if chain.active_links_mask[i]:
+                        self.active[i] = True
+                        self._bounds.append((link.bounds[0], link.bounds[1]))
+            else:
+                raise Exception(f"Unsupported link type: {link}")
+        # The outer product of each rotation axis with itself.
+        self._axes_outer: np.ndarray = np.einsum("li,lj->lij", self.rotation_axes, self.rotation_axes)
+        # The skew-symmetric cross product matrix of each rotation axis.
+        self._axes_cross: np.ndarray = np.zeros(shape=(num_links, 3, 3))
+        self._axes_cross[:, 0, 1] = -self.rotation_axes[:, 2]
+        self._axes_cross[:, 0, 2] = self.rotation_axes[:, 1]
+        self._axes_cross[:, 1, 0] = self.rotation_axes[:, 2]
+        self._axes_cross[:, 1, 2] = -self.rotation_axes[:, 0]
+        self._axes_cross[:, 2, 0] = -self.rotation_axes[:, 1]
+        self._axes_cross[:, 2, 1] = self.rotation_axes[:, 0]
+
+    def forward_kinematics(self, joints: np.ndarray) -> np.ndarray:
+        """
+        :param joints: The angle of each link in radians, including inactive links. Shape: `(num_links)`
+
+        :return: The transformation matrix of the end of the chain. This is the same as `Chain.forward_kinematics(joints)`.
+        """
+
+        frame_matrix = np.eye(4)
+        for link_matrix in self._get_link_matrices(joints=joints):
+            frame_matrix = np.dot(frame_matrix, link_matrix)
+        return frame_matrix
+
+    def forward_kinematics_batch(self, joints: np.ndarray, full_kinematics: bool = False) -> np.ndarray:
+        """
+        Evaluate forward kinematics for many joint configurations at once.
+
+        :param joints: The angle of each link in radians per configuration, including inactive links. Shape: `(N, num_links)`
+        :param full_kinematics: If True, return the transformation matrix of each link. If False, return only the transformation matrix of the end of the chain.
+
+        :return: The transformation matrices. Shape: `(N, num_links, 4, 4)` if `full_kinematics == True`, otherwise `(N, 4, 4)`.
+        """
+
+        joints = np.asarray(joints, dtype=float)
+        if joints.ndim != 2 or joints.shape[1] != self.constant_matrices.shape[0]:
+            raise Exception(f"Expected joints of shape (N, {self.constant_matrices.shape[0]}) but got {joints.shape}")
+        link_matrices = self._get_link_matrices(joints=joints)
+        if not full_kinematics:
+            frame_matrices = link_matrices[:, 0]
+            for i in range(1, link_matrices.shape[1]):
+                frame_matrices = np.matmul(frame_matrices, link_matrices[:, i])
+            return frame_matrices
+        frame_matrices = np.zeros(shape=link_matrices.shape)
+        frame_matrices[:, 0] = link_matrices[:, 0]
+        for i in range(1, link_matrices.shape[1]):
+            frame_matrices[:, i] = np.matmul(frame_matrices[:, i - 1], link_matrices[:, i])
+        return frame_matrices
+
+    def get_position_jacobian(self, joints: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        :param joints: The angle of each link in radians, including inactive links. Shape: `(num_links)`
+
+        :return: Tuple: The position of the end of the chain, and the derivative of the position with respect to each link's angle. The columns of inactive links are zero. Shape: `(3)` and `(3, num_links)`.
+        """
+
+        link_matrices = self._get_link_matrices(joints=joints)
+        rotation_derivatives = self._get_rotation_derivatives(joints=joints)
+        num_links = link_matrices.shape[0]
+        # The position of the end of the chain relative to each link's rotated frame.
+        suffix_positions = np.zeros(shape=(num_links, 3))
+        for i in range(num_links - 1, 0, -1):
+            suffix_positions[i - 1] = np.dot(link_matrices[i, :3, :3], suffix_positions[i]) + link_matrices[i, :3, 3]
+        jacobian = np.zeros(shape=(3, num_links))
+        frame_matrix = np.eye(4)
+        for i in range(num_links):
+            if self.active[i]:
+                # The frame of this link before its joint rotation.
+                prefix = np.dot(frame_matrix[:3, :3], self.constant_matrices[i, :3, :3])
+                jacobian[:, i] = np.dot(prefix, np.dot(rotation_derivatives[i], suffix_positions[i]))
+            frame_matrix = np.dot(frame_matrix, link_matrices[i])
+        return frame_matrix[:3, 3], jacobian
+
+    def inverse_kinematics(self, target_position: np.ndarray, initial_position: np.ndarray,
+                           max_iter: int = None) -> Tuple[np.ndarray, float]:
+        """
+        :param target_position: The target position relative to the base of the chain.
+        :param initial_position: The initial angle of each link in radians, including inactive links. Shape: `(num_links)`
+        :param max_iter: The maximum number of optimizer iterations. If None, use the optimizer's default.
+
+        :return: Tuple: The angle of each link in radians, including inactive links; and the distance in meters between the end of the chain and the target position.
+        """
+
+        joints = np.array(initial_position, dtype=float)
+
+        def objective(x: np.ndarray) -> Tuple[float, np.ndarray]:
+            joints[self.active] = x
+            position, jacobian = self.get_position_jacobian(joints=joints)
+            error = position - target_position
+            distance = float(np.linalg.norm(error))
+            if distance == 0:
+                return 0, np.zeros(shape=x.shape)
+            # Minimize the distance to the target, as in `Chain.inverse_kinematics()`.
+            return distance, np.dot(error, jacobian[:, self.active]) / distance
+
+        options = dict()
+        if max_iter is not None:
+            options["maxiter"] = max_iter
+        result = minimize(objective, joints[self.active], jac=True, method="L-BFGS-B", bounds=self._bounds,
+                          options=options)
+        joints[self.active] = result.x
+        return joints, float(np.linalg.norm(self.forward_kinematics(joints=joints)[:3, 3] - target_position))
+
+    def inverse_kinematics_batch(self, target_positions: np.ndarray, initial_position: np.ndarray,
+                                 warm_starts: np.ndarray = None, tolerance: float = 0.001,
+                                 max_iter: int = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Solve IK for many targets.
+
+        Each target is warm-started from whichever is closest to the target: `initial_position`, the target's warm start, or the solution of the previous target. If the solution isn't within `tolerance` of the target, IK is solved again from `initial_position` and the better solution is kept.
+
+        :param target_positions: The target positions relative to the base of the chain. Shape: `(N, 3)`
+        :param initial_position: The default initial angle of each link in radians, including inactive links. Shape: `(num_links)`
+        :param warm_starts: Optional initial angles of each link per target in radians, for example from previous solutions to nearby targets. Shape: `(N, num_links)`. Can be None.
+        :param tolerance: If the distance between the end of the chain and a target is greater than this, retry from `initial_position`.
+        :param max_iter: The maximum number of optimizer iterations per target. If None, use the optimizer's default.
+
+        :return: Tuple: The angle of each link per target in radians, and the distance in meters between the end of the chain and each target. Shape: `(N, num_links)` and `(N)`.
+        """
+
+        num_targets = target_positions.shape[0]
+        solutions = np.zeros(shape=(num_targets, initial_position.shape[0]))
+        errors = np.zeros(shape=num_targets)
+        initial_end = self.forward_kinematics(joints=initial_position)[:3, 3]
+        if warm_starts is not None:
+            warm_start_distances = np.linalg.norm(self.forward_kinematics_batch(joints=warm_starts)[:, :3, 3] -
+                                                  target_positions, axis=1)
+        for i in range(num_targets):
+            target_position = target_positions[i]
+            start = initial_position
+            start_distance = np.linalg.norm(initial_end - target_position)
+            if warm_starts is not None and warm_start_distances[i] < start_distance:
+                start = warm_starts[i]
+                start_distance = warm_start_distances[i]
+            # The end of the chain at the previous solution is approximately the previous target.
+            if i > 0 and np.linalg.norm(target_positions[i - 1] - target_position) + errors[i - 1] < start_distance:
+                start = solutions[i - 1]
+            solutions[i], errors[i] = self.inverse_kinematics(target_position=target_position,
+                                                              initial_position=start,
+                                                              max_iter=max_iter)
+            # The warm start led to a local minimum. Try again from the default initial position.
+            if errors[i] > tolerance and start is not initial_position:
+                solution, error = self.inverse_kinematics(target_position=target_position,
+                                                          initial_position=initial_position,
+                                                          max_iter=max_iter)
+                if error < errors[i]:
+                    solutions[i] = solution
+                    errors[i] = error
+        return solutions, errors
+
+    def _get_link_matrices(self, joints: np.ndarray) -> np.ndarray:
+        """
+        :param joints: The angle of each link in radians, including inactive links. Shape: `(num_links)` or `(N, num_links)`
+
+        :return: The transform matrix of each link. Shape: `(num_links, 4, 4)` or `(N, num_links, 4, 4)`
+        """
+
+        rotations = np.zeros(shape=joints.shape + (4, 4))
+        rotations[..., 3, 3] = 1
+        cos = np.cos(joints)[..., np.newaxis, np.newaxis]
+        sin = np.sin(joints)[..., np.newaxis, np.newaxis]
+        # Rodrigues' rotation formula. This is the same as `ikpy.utils.geometry.axis_rotation_matrix()`.
+        rotations[..., :3, :3] = cos * np.eye(3) + sin * self._axes_cross + (1 - cos) * self._axes_outer
+        # Links without a rotation axis don't rotate.
+        rotations[..., ~self.rotation_axes.any(axis=1), :3, :3] = np.eye(3)
+        return np.matmul(self.constant_matrices, rotations)
+
+    def _get_rotation_derivatives(self, joints: np.ndarray) -> np.ndarray:
+        """
+        :param joints: The angle of each link in radians, including inactive links. Shape: `(num_links)`
+
+        :return: The derivative of each link's joint rotation matrix with respect to its angle. Shape: `(num_links, 3, 3)`
+        """
+
+        cos = np.cos(joints)[:, np.newaxis, np.newaxis]
+        sin = np.sin(joints)[:, np.newaxis, np.newaxis]
+        return -sin * np.eye(3) + cos * self._axes_cross + sin * self._axes_outer
@@ -93,6 +93,22 @@ class OutputData(object):
 
         return b[4:8].decode('utf-8')
 
+    @staticmethod
+    def _get_contacts(data) -> np.ndarray:
+        """
+        Returns the contact points of a collision as a numpy array of shape `(n, 2, 3)` where `[:, 0]` are the normals and `[:, 1]` are the points.
+        The array is a view of the contiguous vector of `ContactPoint` structs.
+
+        :param data: The collision FlatBuffers object. It must have `Contacts()` and `ContactsLength()` functions.
+        """
+
+        num_contacts = data.ContactsLength()
+        if num_contacts == 0:
+            return np.zeros(shape=(0, 2, 3), dtype=np.float32)
+        # Get the position of the first struct in the buffer.
+        start = data.Contacts(0).Normal(Vector3.Vector3())._tab.Pos
+        return np.frombuffer(data._tab.Bytes, dtype=np.float32, count=num_contacts * 6, offset=start).reshape(-1, 2, 3)
+
     @staticmethod
     def _get_vector3(constructor) -> Tuple[float, float, float]:
         """
@@ -196,6 +212,18 @@ class Transforms(OutputData):
     def get_rotation(self, index: int) -> np.ndarray:
         return self._rotations[index]
 
+    def get_ids(self) -> np.ndarray:
+        return self._ids
+
+    def get_positions(self) -> np.ndarray:
+        return self._positions
+
+    def get_rotations(self) -> np.ndarray:
+        return self._rotations
+
+    def get_forwards(self) -> np.ndarray:
+        return self._forwards
+
 
 class Rigidbodies(OutputData):
     def __init__(self, b):
@@ -223,6 +251,18 @@ class Rigidbodies(OutputData):
     def get_sleeping(self, index: int) -> bool:
         return bool(self._sleeping[index])
 
+    def get_ids(self) -> np.ndarray:
+        return self._ids
+
+    def get_velocities(self) -> np.ndarray:
+        return self._velocities
+
+    def get_angular_velocities(self) -> np.ndarray:
+        return self._angular_velocities
+
+    def get_sleepings(self) -> np.ndarray:
+        return self._sleeping
+
 
 class StaticRigidbodies(OutputData):
     def __init__(self, b):
@@ -255,6 +295,12 @@ class StaticRigidbodies(OutputData):
     def get_bounciness(self, index: int) -> float:
         return float(self._physics_values[index][3])
 
+    def get_ids(self) -> np.ndarray:
+        return self._ids
+
+    def get_kinematics(self) -> np.ndarray:
+        return self._kinematic
+
 
 class Bounds(OutputData):
     def __init__(self, b):
@@ -292,6 +338,16 @@ class Bounds(OutputData):
     def get_center(self, index: int) -> np.ndarray:
         return self._bounds_positions[index][6]
 
+    def get_ids(self) -> np.ndarray:
+        return self._ids
+
+    def get_bounds_positions(self) -> np.ndarray:
+        """
+        Returns the bounds of every object as a numpy array of shape `(n, 7, 3)`. The second axis is ordered: front, back, right, left, top, bottom, center.
+        """
+
+        return self._bounds_positions
+
 
 class Images(OutputData):
     PASS_MASKS = {PassMask.PassMask._img: "_img",
@@ -473,6 +529,9 @@ class Collision(OutputData):
     def get_contact_point(self, index: int) -> Tuple[float, float, float]:
         return OutputData._get_vector3(self.data.Contacts(index).Point)
 
+    def get_contacts(self) -> np.ndarray:
+        return OutputData._get_contacts(self.data)
+
 
 class ImageSensors(OutputData):
     def get_data(self) -> ImSe.ImageSensors:
@@ -750,6 +809,9 @@ class EnvironmentCollision(OutputData):
     def get_contact_point(self, index: int) -> Tuple[float, float, float]:
         return OutputData._get_vector3(self.data.Contacts(index).Point)
 
+    def get_contacts(self) -> np.ndarray:
+        return OutputData._get_contacts(self.data)
+
     def get_floor(self) -> bool:
         return self.data.Floor()
 
@@ -1614,6 +1676,27 @@ class Replicants(OutputData):
     def get_num_body_parts(self) -> int:
         return int(self.data.NumBodyParts())
 
+    def get_ids(self) -> np.ndarray:
+        return self._ids[:, 0]
+
+    def get_body_part_ids(self, index: int) -> np.ndarray:
+        return self._ids[index][1:]
+
+    def get_body_part_positions(self, index: int) -> np.ndarray:
+        return self._positions[index][1:]
+
+    def get_body_part_rotations(self, index: int) -> np.ndarray:
+        return self._rotations[index][1:]
+
+    def get_body_part_forwards(self, index: int) -> np.ndarray:
+        return self._forwards[index][1:]
+
+    def get_collision_ids(self, index: int) -> np.ndarray:
+        return self._collision_ids[index]
+
+    def get_is_collisions(self, index: int) -> np.ndarray:
+        return self._is_collisions[index]
+
 
 class LeapMotion(OutputData):
     _NUM_BONES_PER_HAND: int = 16
@@ -1756,6 +1839,9 @@ class Drones(OutputData):
     def get_motor_on(self, index: int) -> bool:
         return bool(self._motor_ons[index])
 
+    def get_ids(self) -> np.ndarray:
+        return self._ids
+
 
 class AlbedoColors(OutputData):
     def __init__(self, b):
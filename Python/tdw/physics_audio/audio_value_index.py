@@ -0,0 +1,110 @@
+from bisect import bisect_left
+from collections import Counter
+from typing import Dict, List, Tuple, Optional, TypeVar, Generic
+import numpy as np
+
+
+T = TypeVar("T")
+
+
+class AudioValueIndex(Generic[T]):
+    """
+    Derive audio values (amp, material, and resonance) for objects that don't have pre-calculated audio data. This is used by [`Clatter`](../add_ons/clatter.md) and [`PyImpact`](../add_ons/py_impact.md).
+
+    The derivation uses indexes that are built once per scene, so deriving values for every object in the scene is roughly linear in the number of objects:
+
+    - If the object has a category, the derived values are the averages (amp, resonance) and the most common material of all objects with known audio values, regardless of their categories. These are calculated only once. The object itself is counted as a member of its category, so this applies to every object with a category; this matches the behavior of previous versions of `Clatter` and `PyImpact`.
+    - Otherwise, i.e. if the object isn't in `categories`, the derived values are averaged from objects with known audio values whose mass is less than `MASS_RATIO` times the object's mass. These objects are found with a binary search over known objects sorted by mass.
+    """
+
+    """:class_var
+    When deriving values from objects of similar mass, use objects whose mass is less than this factor times the mass of the object.
+    """
+    MASS_RATIO: float = 1.5
+    """:class_var
+    The maximum number of scenes for which derived values are cached.
+    """
+    MAX_NUM_CACHED_SCENES: int = 16
+
+    def __init__(self, categories: Dict[int, str], masses: Dict[int, float], known: Dict[int, Tuple[float, T, float]]):
+        """
+        :param categories: The category of each object. Key = The object ID.
+        :param masses: The mass of each object. Key = The object ID.
+        :param known: Objects with known audio values. Key = The object ID. Value = A tuple: amp, material, resonance.
+        """
+
+        # Category index. Key = The category. Value = The number of objects in the category.
+        self._category_counts: Dict[str, int] = dict(Counter(categories.values()))
+        self._categories: Dict[int, str] = categories
+        self._masses: Dict[int, float] = masses
+        # Values derived from all known objects.
+        if len(known) == 0:
+            self._all_values: Optional[Tuple[float, T, float]] = None
+        else:
+            self._all_values = AudioValueIndex._get_averages(amps=[v[0] for v in known.values()],
+                                                             materials=[v[1] for v in known.values()],
+                                                             resonances=[v[2] for v in known.values()])
+        # Sorted-mass index of known objects.
+        known_masses = sorted([(masses[k], k) for k in known if k in masses])
+        self._sorted_masses: List[float] = [m[0] for m in known_masses]
+        self._cumulative_amps: np.ndarray = np.cumsum([known[m[1]][0] for m in known_masses])
+        self._cumulative_resonances: np.ndarray = np.cumsum([known[m[1]][2] for m in known_masses])
+        # The most common material in each prefix of the sorted-mass index.
+        self._prefix_materials: List[T] = list()
+        material_counts: Dict[T, int] = dict()
+        most_common: Optional[T] = None
+        for m in known_masses:
+            material = known[m[1]][1]
+            material_counts[material] = material_counts.get(material, 0) + 1
+            if most_common is None or material_counts[material] > material_counts[most_common]:
+                most_common = material
+            self._prefix_materials.append(most_common)
+
+    def get_values(self, object_id: int) -> Optional[Tuple[float, T, float]]:
+        """
+        :param object_id: The ID of an object that doesn't have known audio values.
+
+        :return: A tuple of derived values: amp, material, resonance. If there are no comparable objects, returns None, in which case default values should be used.
+        """
+
+        # Fallback option: comparable objects in the same category. This includes the object itself.
+        if object_id in self._categories and self._category_counts.get(self._categories[object_id], 0) > 0:
+            return self._all_values
+        # Fallback option: Find objects with similar mass.
+        mass = self._masses[object_id]
+        if mass <= 0:
+            return None
+        num = bisect_left(self._sorted_masses, mass * AudioValueIndex.MASS_RATIO)
+        if num == 0:
+            return None
+        return round(float(self._cumulative_amps[num - 1]) / num, 3), \
+            self._prefix_materials[num - 1], \
+            round(float(self._cumulative_resonances[num - 1]) / num, 3)
+
+    @staticmethod
+    def get_scene_key(categories: Dict[int, str], masses: Dict[int, float],
+                      known: Dict[int, Tuple[float, T, float]]) -> tuple:
+        """
+        :param categories: The category of each object. Key = The object ID.
+        :param masses: The mass of each object. Key = The object ID.
+        :param known: Objects with known audio values. Key = The object ID. Value = A tuple: amp, material, resonance.
+
+        :return: A hashable key that can be used to cache derived values across repeated scenes.
+        """
+
+        return tuple(sorted(categories.items())), tuple(sorted(masses.items())), \
+            tuple(sorted(known.items(), key=lambda kv: kv[0]))
+
+    @staticmethod
+    def _get_averages(amps: List[float], materials: List[T], resonances: List[float]) -> Tuple[float, T, float]:
+        """
+        :param amps: A list of amp values.
+        :param materials: A list of materials.
+        :param resonances: A list of resonance values.
+
+        :return: Tuple: The average amp, the most common material, the average resonance.
+        """
+
+        material_counts = Counter(materials)
+        return round(sum(amps) / len(amps), 3), max(set(materials), key=material_counts.get), \
+            round(sum(resonances) / len(resonances), 3)
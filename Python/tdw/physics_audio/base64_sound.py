@@ -1,8 +1,12 @@
 import base64
+import builtins
+from threading import local
 from pathlib import Path
 import wave
+from typing import Optional, Dict
 import numpy as np
 from tdw.audio_constants import SAMPLE_RATE, CHANNELS, SAMPLE_WIDTH
+from tdw.pre_serialized_command import PreSerializedCommand
 from tdw.type_aliases import PATH
 
 
@@ -11,25 +15,84 @@ class Base64Sound:
     This class is used only in PyImpact, which has been deprecated. See: [`Clatter`](../add_ons/clatter.md).
 
     A sound encoded as a base64 string.
+
+    The sound is clipped and quantized into a reusable 16-bit buffer and then base64-encoded directly to ASCII bytes (`wav_bytes`). Each thread has its own buffers, so sounds can be created in more than one thread at the same time. The raw bytes (`bytes`) and the base64 string (`wav_str`) are only created if they are needed.
     """
 
+    # Reusable buffers for clipping and quantization per thread: `float_buffer` and `int16_buffer`. These grow as needed.
+    _BUFFERS: local = local()
+
     def __init__(self, snd: np.ndarray):
         """
-        :param snd: The sound byte array.
+        :param snd: The sound as a float array. Values outside of the range [-1, 1] are clipped.
         """
 
+        snd = np.ravel(snd)
+        num_samples: int = snd.shape[0]
+        buffers = Base64Sound._BUFFERS
+        if not hasattr(buffers, "int16_buffer") or buffers.int16_buffer.shape[0] < num_samples:
+            buffers.float_buffer = np.zeros(shape=num_samples, dtype=np.float64)
+            buffers.int16_buffer = np.zeros(shape=num_samples, dtype=np.int16)
+        float_buffer = buffers.float_buffer[:num_samples]
+        int16_buffer = buffers.int16_buffer[:num_samples]
+        np.clip(snd, -1, 1, out=float_buffer)
+        np.multiply(float_buffer, 32767, out=int16_buffer, casting="unsafe")
         """:field
-        Byte data of the sound.
+        The sound as base64-encoded ASCII bytes.
         """
-        self.bytes: bytes = bytes(np.array(snd * 32767, dtype='int16'))
-        """:field
-        A base64 string of the sound. Send this to the build.
-        """
-        self.wav_str = base64.b64encode(self.bytes).decode('utf-8')
+        self.wav_bytes: bytes = base64.b64encode(int16_buffer)
         """:field
         The length of the byte array.
         """
-        self.length: int = len(self.bytes)
+        self.length: int = int16_buffer.nbytes
+        self._bytes: Optional[bytes] = None
+        self._wav_str: Optional[str] = None
+
+    @property
+    def bytes(self) -> bytes:
+        """
+        :return: Byte data of the sound.
+        """
+
+        if self._bytes is None:
+            self._bytes = base64.b64decode(self.wav_bytes)
+        return self._bytes
+
+    @bytes.setter
+    def bytes(self, value: builtins.bytes) -> None:
+        self._bytes = value
+
+    @property
+    def wav_str(self) -> str:
+        """
+        :return: A base64 string of the sound.
+        """
+
+        if self._wav_str is None:
+            self._wav_str = self.wav_bytes.decode("ascii")
+        return self._wav_str
+
+    @wav_str.setter
+    def wav_str(self, value: str) -> None:
+        self._wav_str = value
+        self.wav_bytes = value.encode("ascii")
+
+    def get_command(self, command_type: str, audio_source_id: int, position: Dict[str, float]) -> PreSerializedCommand:
+        """
+        :param command_type: The type of command, for example `"play_audio_data"` or `"play_point_source_data"`.
+        :param audio_source_id: The audio source ID.
+        :param position: The position of the audio source.
+
+        :return: A [`PreSerializedCommand`](../pre_serialized_command.md) to play the sound. The audio data is copied directly into the message sent to the build instead of being re-encoded as JSON.
+        """
+
+        return PreSerializedCommand(command={"$type": command_type,
+                                             "id": audio_source_id,
+                                             "position": position,
+                                             "num_frames": self.length,
+                                             "num_channels": CHANNELS,
+                                             "frame_rate": SAMPLE_RATE},
+                                    ascii_parameters={"wav_data": self.wav_bytes})
 
     def write(self, path: PATH) -> None:
         """
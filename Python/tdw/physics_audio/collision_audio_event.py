@@ -1,4 +1,4 @@
-from typing import Optional, Dict
+from typing import Optional, Dict, List
 import numpy as np
 from tdw.collision_data.collision_base import CollisionBase
 from tdw.collision_data.collision_obj_obj import CollisionObjObj
@@ -31,14 +31,15 @@ class CollisionAudioEvent:
 
     def __init__(self, collision: CollisionBase, object_0_static: ObjectAudioStatic, object_0_dynamic: Rigidbody,
                  previous_areas: Dict[int, float], object_1_static: ObjectAudioStatic = None,
-                 object_1_dynamic: Rigidbody = None):
+                 object_1_dynamic: Rigidbody = None, area: float = None):
         """
         :param collision: [The collision data.](../collision_data/collision_base.md)
         :param object_0_static: [Static data](object_audio_static.md) for the first object.
         :param object_0_dynamic: [Dynamic data](../object_data/rigidbody.md) for the first object.
-        :param previous_areas: Areas of collisions from the previous frame.
+        :param previous_areas: Areas of collisions from the previous frame. Key = The ID of the primary object of the most significant collision. Value = The area.
         :param object_1_static: [Static data](object_audio_static.md) for the second object. If this is an environment collision, the value of this parameter should be `None`.
         :param object_1_dynamic: [Dynamic data](../object_data/rigidbody.md) for the second object. If this is an environment collision, the value of this parameter should be `None`.
+        :param area: The area of the collision contact points. If None, the area is calculated. To calculate the areas of many collisions at once, see `CollisionAudioEvent.get_contact_areas(collisions)`.
         """
 
         """:field
@@ -91,7 +92,7 @@ class CollisionAudioEvent:
         # Initially set this as an impact so we can find the previous area.
         self._set_as_impact(obj_obj=obj_obj, object_0_static=object_0_static, object_1_static=object_1_static)
         # Set the area.
-        self.area = self._get_contact_area()
+        self.area = self._get_contact_area() if area is None else area
         # Get the previous area, if any.
         if self.primary_id in previous_areas:
             previous_area = previous_areas[self.primary_id]
@@ -133,6 +134,33 @@ class CollisionAudioEvent:
             else:
                 self.collision_type = CollisionAudioType.none
 
+    @staticmethod
+    def get_contact_areas(collisions: List[CollisionBase]) -> np.ndarray:
+        """
+        Calculate the areas of the contact points of many collisions at once.
+
+        :param collisions: [The collisions.](../collision_data/collision_base.md)
+
+        :return: A numpy array of contact areas, one per collision.
+        """
+
+        if len(collisions) == 0:
+            return np.zeros(shape=0)
+        max_num_contacts = max([c.contacts.shape[0] for c in collisions])
+        if max_num_contacts < 3:
+            return np.zeros(shape=len(collisions))
+        # Pad each set of points with its first point. Padded points don't add any area.
+        points = np.zeros(shape=(len(collisions), max_num_contacts, 3))
+        for i, collision in enumerate(collisions):
+            num_contacts = collision.contacts.shape[0]
+            if num_contacts == 0:
+                continue
+            points[i, :num_contacts] = collision.contacts[:, 1]
+            points[i, num_contacts:] = collision.contacts[0, 1]
+        # Source: https://stackoverflow.com/a/68115011
+        edges = points[:, 1:] - points[:, 0:1]
+        return np.sum(np.linalg.norm(np.cross(edges[:, :-1], edges[:, 1:], axis=2), axis=2), axis=1) / 2
+
     def _get_contact_area(self) -> float:
         """
         :return: The area of all of the contact points.
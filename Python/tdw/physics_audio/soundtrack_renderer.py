@@ -0,0 +1,223 @@
+from multiprocessing import Pool
+from pathlib import Path
+from typing import List, Dict, Tuple, Iterable, Optional
+import numpy as np
+from scipy.io import wavfile
+from tdw.tdw_utils import TDWUtils
+from tdw.output_data import OutputData, Transforms
+from tdw.add_ons.py_impact import PyImpact
+from tdw.add_ons.output_data_writer import OutputDataWriter
+from tdw.physics_audio.audio_material import AudioMaterial
+from tdw.physics_audio.base64_sound import Base64Sound
+from tdw.physics_audio.object_audio_static import ObjectAudioStatic
+from tdw.audio_constants import SAMPLE_RATE
+from tdw.type_aliases import PATH, TARGET
+
+
+class _OfflinePyImpact(PyImpact):
+    """
+    PyImpact with a simulated clock. Instead of only returning audio commands, this also stores the generated sounds.
+    """
+
+    def __init__(self, framerate: int, **kwargs):
+        """
+        :param framerate: The number of frames per second.
+        :param kwargs: PyImpact constructor parameters.
+        """
+
+        super().__init__(**kwargs)
+        self.frame: int = 0
+        # The sounds generated on this frame: The position and the float samples.
+        self.sounds: List[Tuple[np.ndarray, np.ndarray]] = list()
+        self._framerate: int = framerate
+
+    def _get_time(self) -> float:
+        return self.frame / self._framerate
+
+    def _get_audio_command(self, audio_source_id: int, contact_points: np.ndarray, sound: Base64Sound) -> dict:
+        self.sounds.append((np.mean(contact_points, axis=0),
+                            np.frombuffer(sound.bytes, dtype=np.int16).astype(np.float32) / 32767))
+        return super()._get_audio_command(audio_source_id=audio_source_id, contact_points=contact_points, sound=sound)
+
+
+class SoundtrackRenderer:
+    """
+    Render impact and scrape audio offline from recorded output data. This doesn't require a build or an audio capture device.
+
+    Each trial is replayed through [`PyImpact`](../add_ons/py_impact.md): collisions are classified and audio is synthesized exactly as it would be at runtime, but with a simulated clock. Each sound is attenuated by the distance between the collision and the listener and mixed into a single float32 track.
+
+    The recorded output data must include everything that PyImpact needs. The first frame must include `Bounds`, `SegmentationColors` and `StaticRigidbodies` output data. Every frame must include `Rigidbodies` and `Collision` and `EnvironmentCollision` output data (with `stay` collisions enabled). If the listener is an object, every frame must also include `Transforms` output data.
+
+    ```python
+    from tdw.physics_audio.soundtrack_renderer import SoundtrackRenderer
+
+    renderer = SoundtrackRenderer(listener={"x": 1, "y": 1.6, "z": -2}, random_seed=0)
+    # Each directory was written by an OutputDataWriter.
+    renderer.render_trials(trial_directories=["trials/0", "trials/1", "trials/2"], output_directory="audio", processes=3)
+    ```
+    """
+
+    def __init__(self, listener: TARGET = None, framerate: int = 30, min_distance: float = 1,
+                 initial_amp: float = 0.5, floor: AudioMaterial = AudioMaterial.wood_medium, scrape: bool = True,
+                 static_audio_data_overrides: Dict[int, ObjectAudioStatic] = None,
+                 min_time_between_impact_events: float = 0.25, random_seed: int = None):
+        """
+        :param listener: The listener. This can be an object ID (an integer), in which case the listener position is the recorded position of the object per frame, or a position as a dictionary or numpy array. If None, the listener is at the origin.
+        :param framerate: The number of recorded frames per second. This should match the `framerate` parameter of the audio initializer that was used when the trials were recorded.
+        :param min_distance: Sounds closer to the listener than this distance in meters are not attenuated. Beyond this distance, the amplitude falls off as `min_distance / distance`.
+        :param initial_amp: The initial amplitude, i.e. the "master volume". Must be > 0 and < 1.
+        :param floor: The floor material.
+        :param scrape: If True, generate scrape audio for scrape surfaces.
+        :param static_audio_data_overrides: If not None, a dictionary of audio data. Key = Object ID; Value = [`ObjectAudioStatic`](object_audio_static.md).
+        :param min_time_between_impact_events: The minimum time in seconds between two impact events that involve the same primary object.
+        :param random_seed: The random seed used per trial. If None, the seed is random.
+        """
+
+        assert framerate > 0, f"Invalid framerate: {framerate}"
+        assert min_distance > 0, f"Invalid minimum distance: {min_distance}"
+        self._listener_id: Optional[int] = None
+        if listener is None:
+            self._listener_position: np.ndarray = np.zeros(shape=3)
+        elif isinstance(listener, int):
+            self._listener_id = listener
+            self._listener_position = np.zeros(shape=3)
+        elif isinstance(listener, dict):
+            self._listener_position = TDWUtils.vector3_to_array(listener)
+        elif isinstance(listener, np.ndarray):
+            self._listener_position = listener
+        else:
+            raise Exception(f"Invalid listener: {listener}")
+        """:field
+        The number of recorded frames per second.
+        """
+        self.framerate: int = framerate
+        """:field
+        Sounds closer to the listener than this distance in meters are not attenuated.
+        """
+        self.min_distance: float = min_distance
+        """:field
+        The random seed used per trial. If None, the seed is random.
+        """
+        self.random_seed: Optional[int] = random_seed
+        self._initial_amp: float = initial_amp
+        self._floor: AudioMaterial = floor
+        self._scrape: bool = scrape
+        self._static_audio_data_overrides: Optional[Dict[int, ObjectAudioStatic]] = static_audio_data_overrides
+        self._min_time_between_impact_events: float = min_time_between_impact_events
+
+    def render(self, frames: Iterable[List[bytes]]) -> np.ndarray:
+        """
+        Render a single trial.
+
+        :param frames: The recorded frames. Each element is the response from the build for one frame, i.e. `resp`.
+
+        :return: The mixed audio track as a float32 numpy array. The length of the track is at least the duration of the trial.
+        """
+
+        py_impact = _OfflinePyImpact(framerate=self.framerate,
+                                     initial_amp=self._initial_amp,
+                                     static_audio_data_overrides=self._static_audio_data_overrides,
+                                     floor=self._floor,
+                                     rng=np.random.RandomState(self.random_seed),
+                                     scrape=self._scrape,
+                                     min_time_between_impact_events=self._min_time_between_impact_events)
+        listener_position = np.copy(self._listener_position)
+        # The start sample and attenuated samples of each sound.
+        sounds: List[Tuple[int, np.ndarray]] = list()
+        num_samples = 0
+        frame = 0
+        for resp in frames:
+            py_impact.frame = frame
+            py_impact.on_send(resp=resp)
+            # The commands are never sent anywhere.
+            py_impact.commands.clear()
+            if self._listener_id is not None:
+                listener_position = self._get_listener_position(resp=resp, previous=listener_position)
+            start = int(round(frame * SAMPLE_RATE / self.framerate))
+            for position, samples in py_impact.sounds:
+                distance = np.linalg.norm(position - listener_position)
+                gain = self.min_distance / max(distance, self.min_distance)
+                sounds.append((start, samples * np.float32(gain)))
+                num_samples = max(num_samples, start + samples.shape[0])
+            py_impact.sounds.clear()
+            frame += 1
+        # Mix the sounds.
+        track = np.zeros(shape=max(num_samples, int(round(frame * SAMPLE_RATE / self.framerate))), dtype=np.float32)
+        for start, samples in sounds:
+            track[start: start + samples.shape[0]] += samples
+        return track
+
+    def render_trial(self, trial_directory: PATH) -> np.ndarray:
+        """
+        Render a single trial recorded by an [`OutputDataWriter`](../add_ons/output_data_writer.md).
+
+        :param trial_directory: The output directory of the `OutputDataWriter`.
+
+        :return: The mixed audio track as a float32 numpy array.
+        """
+
+        writer = OutputDataWriter(output_directory=trial_directory)
+        paths = sorted(writer.output_directory.glob("*.txt"))
+        return self.render(frames=(writer.read(path) for path in paths))
+
+    def render_trials(self, trial_directories: List[PATH], output_directory: PATH, processes: int = None) -> List[Path]:
+        """
+        Render many trials recorded by [`OutputDataWriter`](../add_ons/output_data_writer.md) add-ons and write each of them to disk as a float32 .wav file. Trials are rendered in parallel.
+
+        :param trial_directories: The output directories of the `OutputDataWriter` add-ons, one per trial.
+        :param output_directory: The .wav files will be written to this directory. Each file is named after the name of its trial directory.
+        :param processes: The number of worker processes. If None, this is the number of CPUs.
+
+        :return: The paths to the .wav files.
+        """
+
+        if isinstance(output_directory, str):
+            output_directory = Path(output_directory)
+        if not output_directory.exists():
+            output_directory.mkdir(parents=True)
+        trial_paths = [Path(d) for d in trial_directories]
+        wav_paths = [output_directory.joinpath(d.name + ".wav") for d in trial_paths]
+        with Pool(processes=processes) as pool:
+            pool.starmap(self._render_trial_to_file, zip(trial_paths, wav_paths))
+        return wav_paths
+
+    @staticmethod
+    def write(track: np.ndarray, path: PATH) -> None:
+        """
+        Write a track to disk as a float32 .wav file.
+
+        :param track: The audio track.
+        :param path: The path to the .wav file.
+        """
+
+        if isinstance(path, str):
+            path = Path(path)
+        if not path.parent.exists():
+            path.parent.mkdir(parents=True)
+        wavfile.write(str(path.resolve()), SAMPLE_RATE, track.astype(np.float32))
+
+    def _render_trial_to_file(self, trial_directory: Path, path: Path) -> None:
+        """
+        Render a trial and write it to disk.
+
+        :param trial_directory: The output directory of the `OutputDataWriter`.
+        :param path: The path to the .wav file.
+        """
+
+        SoundtrackRenderer.write(track=self.render_trial(trial_directory=trial_directory), path=path)
+
+    def _get_listener_position(self, resp: List[bytes], previous: np.ndarray) -> np.ndarray:
+        """
+        :param resp: The response from the build.
+        :param previous: The listener position on the previous frame.
+
+        :return: The recorded position of the listener object, or `previous` if there is no data for it on this frame.
+        """
+
+        for i in range(len(resp) - 1):
+            if OutputData.get_data_type_id(resp[i]) == "tran":
+                transforms = Transforms(resp[i])
+                for j in range(transforms.get_num()):
+                    if transforms.get_id(j) == self._listener_id:
+                        return transforms.get_position(j)
+        return previous
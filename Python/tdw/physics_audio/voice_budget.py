@@ -0,0 +1,128 @@
+from typing import Dict, List, Set
+import numpy as np
+from tdw.tdw_utils import TDWUtils
+from tdw.physics_audio.collision_audio_event import CollisionAudioEvent
+from tdw.type_aliases import POSITION
+
+
+class VoiceBudget:
+    """
+    This class is used only in PyImpact, which has been deprecated. See: [`Clatter`](../add_ons/clatter.md).
+
+    Limit the number of concurrent PyImpact sounds ("voices"). Collision audio events are ranked by their perceived loudness (their magnitude, attenuated by the distance between the collision and the listener). Events that don't fit into the budget are dropped *before* audio is synthesized, which bounds both the Python-side synthesis cost and the size of the audio commands sent to the build.
+
+    ```python
+    from tdw.add_ons.py_impact import PyImpact
+    from tdw.physics_audio.voice_budget import VoiceBudget
+
+    py_impact = PyImpact(voice_budget=VoiceBudget(max_voices=8, listener={"x": 1, "y": 1.6, "z": -2}))
+    ```
+    """
+
+    def __init__(self, max_voices: int = 16, listener: POSITION = None, min_distance: float = 1):
+        """
+        :param max_voices: The maximum number of concurrent voices.
+        :param listener: The position of the listener. If None, the listener is at the origin. This can be updated later by setting `self.listener`.
+        :param min_distance: Collisions closer to the listener than this distance in meters are not attenuated. Beyond this distance, the loudness of an event falls off as `min_distance / distance`.
+        """
+
+        assert max_voices > 0, f"Invalid maximum number of voices: {max_voices}"
+        """:field
+        The maximum number of concurrent voices.
+        """
+        self.max_voices: int = max_voices
+        if listener is None:
+            """:field
+            The position of the listener as a numpy array.
+            """
+            self.listener: np.ndarray = np.zeros(shape=3)
+        elif isinstance(listener, dict):
+            self.listener = TDWUtils.vector3_to_array(listener)
+        else:
+            self.listener = listener
+        """:field
+        Collisions closer to the listener than this distance in meters are not attenuated.
+        """
+        self.min_distance: float = min_distance
+        # The time at which each ongoing voice ends. Key = The primary object ID.
+        self._voices: Dict[int, float] = dict()
+
+    def get_scheduled(self, events: Dict[int, CollisionAudioEvent], time: float) -> List[int]:
+        """
+        Select the collision audio events that should generate audio on this frame.
+
+        Events are evaluated from loudest to quietest. If an event shares an object with a louder event on this frame, it is merged into the louder event (i.e. it is dropped). If an event's primary object already has an ongoing voice, the new sound replaces it. Otherwise, the event needs a free voice and is dropped if there are none.
+
+        :param events: The collision audio events on this frame. Key = The primary object ID.
+        :param time: The current time in seconds.
+
+        :return: The primary object IDs of the scheduled events, from loudest to quietest.
+        """
+
+        # Free voices that have ended.
+        for object_id in [k for k, v in self._voices.items() if v <= time]:
+            del self._voices[object_id]
+        active: Set[int] = set(self._voices.keys())
+        claimed: Set[int] = set()
+        scheduled: List[int] = list()
+        for object_id in sorted(events, key=lambda k: self.get_loudness(events[k]), reverse=True):
+            event = events[object_id]
+            object_ids = {event.primary_id} if event.secondary_id is None else {event.primary_id, event.secondary_id}
+            # Merge this event into a louder event on the same object.
+            if len(claimed & object_ids) > 0:
+                continue
+            # There are no free voices.
+            if object_id not in active and len(active) >= self.max_voices:
+                continue
+            scheduled.append(object_id)
+            claimed.update(object_ids)
+            active.add(object_id)
+        return scheduled
+
+    def get_loudness(self, event: CollisionAudioEvent) -> float:
+        """
+        :param event: A collision audio event.
+
+        :return: The magnitude of the event, attenuated by its distance from the listener.
+        """
+
+        if len(event.collision.points) == 0:
+            return event.magnitude
+        distance = np.linalg.norm(np.mean(event.collision.points, axis=0) - self.listener)
+        return event.magnitude * self.min_distance / max(distance, self.min_distance)
+
+    def add_voice(self, object_id: int, end_time: float) -> None:
+        """
+        Register a new voice.
+
+        :param object_id: The primary object ID.
+        :param end_time: The time in seconds at which the sound ends.
+        """
+
+        self._voices[object_id] = end_time
+
+    def remove_voice(self, object_id: int) -> None:
+        """
+        Free a voice, for example because its audio source is done playing.
+
+        :param object_id: The primary object ID.
+        """
+
+        if object_id in self._voices:
+            del self._voices[object_id]
+
+    def get_num_voices(self, time: float) -> int:
+        """
+        :param time: The current time in seconds.
+
+        :return: The number of ongoing voices.
+        """
+
+        return len([v for v in self._voices.values() if v > time])
+
+    def reset(self) -> None:
+        """
+        Remove all ongoing voices.
+        """
+
+        self._voices.clear()
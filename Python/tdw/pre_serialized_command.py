@@ -0,0 +1,149 @@
+from json import dumps
+from typing import Dict, List, Iterator, Tuple, Any
+
+
+class PreSerializedCommand(dict):
+    """
+    A command with large string parameters (such as base64-encoded audio data) that have already been encoded as ASCII bytes.
+
+    This is a dictionary of the whole command, including the large string parameters, so it can be read, logged, or serialized with `json.dumps()` like any other command. Internally, the large string parameters are stored only as ASCII bytes; they are decoded to strings the first time they are read. When the controller serializes a list of commands with `PreSerializedCommand.serialize(commands)`, the ASCII bytes are copied directly into the message instead of being decoded and re-encoded by `json.dumps()`. If a large parameter is replaced after the command is created, the new value is serialized normally.
+
+    ```python
+    from base64 import b64encode
+    from tdw.pre_serialized_command import PreSerializedCommand
+
+    command = PreSerializedCommand(command={"$type": "play_audio_data", "id": 0, "num_frames": 4, "num_channels": 1, "frame_rate": 44100},
+                                   ascii_parameters={"wav_data": b64encode(b"\\x00\\x00\\x00\\x00")})
+    ```
+    """
+
+    def __init__(self, command: dict, ascii_parameters: Dict[str, bytes]):
+        """
+        :param command: The command's parameters, excluding the large string parameters. This must include `"$type"`.
+        :param ascii_parameters: The large string parameters. Key = The name of the parameter. Value = The value of the parameter as ASCII bytes. The value must not contain characters that need to be escaped in JSON, which is always the case for base64 data.
+        """
+
+        assert "$type" in command, f"Not a valid command: {command}"
+        super().__init__(command)
+        self._ascii_parameters: Dict[str, bytes] = ascii_parameters
+        # The large string parameters as strings. These are decoded when they are first read.
+        self._strings: Dict[str, str] = dict()
+        # Store the ASCII bytes. If a parameter is replaced, the stored value won't be these bytes anymore.
+        for key in self._ascii_parameters:
+            super().__setitem__(key, self._ascii_parameters[key])
+
+    def __getitem__(self, key: str) -> Any:
+        return self._get_value(key=key, value=super().__getitem__(key))
+
+    def __iter__(self) -> Iterator[str]:
+        # Overriding this makes `dict(command)` read values with `__getitem__()` instead of copying the stored values.
+        return super().__iter__()
+
+    def __eq__(self, other: Any) -> bool:
+        return self.to_dict() == other
+
+    def __ne__(self, other: Any) -> bool:
+        return not self.__eq__(other)
+
+    def __repr__(self) -> str:
+        return repr(self.to_dict())
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in self:
+            return self[key]
+        return default
+
+    def items(self) -> List[Tuple[str, Any]]:
+        return [(key, self[key]) for key in self]
+
+    def values(self) -> List[Any]:
+        return [self[key] for key in self]
+
+    def pop(self, key: str, *default: Any) -> Any:
+        if key not in self:
+            return super().pop(key, *default)
+        value = self[key]
+        super().pop(key)
+        return value
+
+    def copy(self) -> dict:
+        return self.to_dict()
+
+    def get_fragments(self) -> List[bytes]:
+        """
+        :return: The serialized command as a list of byte fragments. Joining the fragments yields valid JSON.
+        """
+
+        # Parameters that still have their original values are copied directly from the ASCII bytes.
+        ascii_keys: List[str] = [key for key in self._ascii_parameters if self._is_ascii(key=key)]
+        regular = {key: self[key] for key in self if key not in ascii_keys}
+        # The serialized regular parameters without the closing bracket.
+        fragments: List[bytes] = [dumps(regular).encode("utf-8")[:-1]]
+        for key in ascii_keys:
+            fragments.extend([b', "', key.encode("utf-8"), b'": "', self._ascii_parameters[key], b'"'])
+        fragments.append(b"}")
+        return fragments
+
+    def to_dict(self) -> dict:
+        """
+        :return: A regular dictionary of the command, including the large string parameters.
+        """
+
+        return dict(self)
+
+    def _is_ascii(self, key: str) -> bool:
+        """
+        :param key: The name of a parameter.
+
+        :return: True if this is a large string parameter that still has its original value.
+        """
+
+        return key in self._ascii_parameters and key in self and super().__getitem__(key) is self._ascii_parameters[key]
+
+    def _get_value(self, key: str, value: Any) -> Any:
+        """
+        :param key: The name of a parameter.
+        :param value: The stored value of the parameter.
+
+        :return: The value of the parameter. If this is a large string parameter that still has its original value, the value is decoded from the ASCII bytes.
+        """
+
+        if key in self._ascii_parameters and value is self._ascii_parameters[key]:
+            if key not in self._strings:
+                self._strings[key] = value.decode("ascii")
+            return self._strings[key]
+        return value
+
+    @staticmethod
+    def serialize(commands: List[dict]) -> bytes:
+        """
+        Serialize a list of commands, some of which might be `PreSerializedCommand`.
+
+        :param commands: The commands.
+
+        :return: The serialized list of commands as UTF-8 JSON bytes.
+        """
+
+        # This is by far the most common case.
+        if not any(isinstance(command, PreSerializedCommand) for command in commands):
+            return dumps(commands).encode("utf-8")
+        fragments: List[bytes] = [b"["]
+        # Serialize consecutive regular commands together.
+        regular: List[dict] = list()
+        for command in commands:
+            if isinstance(command, PreSerializedCommand):
+                if len(regular) > 0:
+                    fragments.append(dumps(regular).encode("utf-8")[1:-1])
+                    fragments.append(b", ")
+                    regular.clear()
+                fragments.extend(command.get_fragments())
+                fragments.append(b", ")
+            else:
+                regular.append(command)
+        if len(regular) > 0:
+            fragments.append(dumps(regular).encode("utf-8")[1:-1])
+        # Remove the trailing separator.
+        else:
+            fragments.pop()
+        fragments.append(b"]")
+        return b"".join(fragments)
@@ -1,13 +1,13 @@
 from json import loads
 from pathlib import Path
 from pkg_resources import resource_filename
-from typing import Dict, List, Tuple, Union
+from typing import Dict, List, Tuple, Union, Optional
 from abc import ABC, abstractmethod
 from overrides import final
 import numpy as np
-from tdw.tdw_utils import TDWUtils
 from tdw.controller import Controller
-from tdw.librarian import ModelLibrarian
+from tdw.librarian import ModelLibrarian, ModelRecord
+from tdw.proc_gen.arrangements.model_extents import ModelExtents
 
 
 class Arrangement(ABC):
@@ -23,6 +23,12 @@ class Arrangement(ABC):
     The default span used for arranging objects next to each other.
     """
     DEFAULT_CELL_SIZE: float = 0.6096
+    # Cached disc-shaped occupancy map stamps. Key = The radius in cells.
+    _DISC_STAMPS: Dict[int, np.ndarray] = dict()
+    # Cached model records. Key = The model library. Value = Tuple: The librarian, the number of records, and a dictionary of records (Key = The model name).
+    _RECORDS: Dict[str, Tuple[ModelLibrarian, int, Dict[str, ModelRecord]]] = dict()
+    # If not None, object IDs are drawn from this random number generator instead of `Controller.get_unique_id()`. See: `Arrangement.set_id_seed()`.
+    _ID_RNG: Optional[np.random.RandomState] = None
 
     def __init__(self, position: Dict[str, float], rng: Union[int, np.random.RandomState] = None):
         """
@@ -62,6 +68,16 @@ class Arrangement(ABC):
                                           "wnid": record.wnid}
         return categories
 
+    @staticmethod
+    def set_id_seed(seed: Optional[int]) -> None:
+        """
+        Set the random seed used to generate object IDs and container shape IDs. By default, these IDs are random and aren't affected by an arrangement's `rng`. If the seed is set, arrangements created afterwards, in the same order and with the same `rng`, will have the same IDs.
+
+        :param seed: The random seed. If None, object IDs are random.
+        """
+
+        Arrangement._ID_RNG = None if seed is None else np.random.RandomState(seed)
+
     @abstractmethod
     def get_commands(self) -> List[dict]:
         """
@@ -113,27 +129,22 @@ class Arrangement(ABC):
         occupancy_map: np.ndarray = np.zeros(shape=(len(xs), len(zs)), dtype=bool)
         # Get the semi-minor axis of the rectangle's size.
         semi_minor_axis = size[0] if size[0] < size[1] else size[1]
-        # Get valid objects.
-        model_sizes: Dict[str, float] = dict()
-        model_cell_sizes: List[int] = list()
-        models_and_categories: Dict[str, str] = dict()
-        for category in categories:
-            # Get objects small enough to fit within the rectangle.
-            for model_name in Arrangement.MODEL_CATEGORIES[category]:
-                record = Controller.MODEL_LIBRARIANS["models_core.json"].get_record(model_name)
-                model_size = TDWUtils.get_bounds_extents(bounds=record.bounds)
-                model_semi_major_axis = float(model_size[0] if model_size[0] > model_size[2] else model_size[2])
-                if model_semi_major_axis < semi_minor_axis:
-                    model_sizes[model_name] = model_semi_major_axis
-                    model_cell_sizes.append(int(model_semi_major_axis / cell_size) + 1)
-                    models_and_categories[model_name] = category
+        # Get objects small enough to fit within the rectangle.
+        model_indices = ModelExtents.get_indices(categories=categories)
+        model_indices = model_indices[ModelExtents.SEMI_MAJOR_AXES[model_indices] < semi_minor_axis]
         object_ids: List[int] = list()
         # Get all sizes in occupancy map space.
-        model_cell_sizes = list(set(model_cell_sizes))
+        model_cell_sizes: List[int] = list(set(((ModelExtents.SEMI_MAJOR_AXES[model_indices] / cell_size).astype(int) + 1).tolist()))
         model_cell_sizes.reverse()
-        for ix, iz in np.ndindex(occupancy_map.shape[0], occupancy_map.shape[1]):
+        # Remove duplicate models, preserving the order in which they first appear.
+        model_indices = model_indices[np.sort(np.unique(model_indices, return_index=True)[1])]
+        model_sizes: np.ndarray = (ModelExtents.SEMI_MAJOR_AXES[model_indices] / cell_size).astype(int)
+        num_rows, num_columns = occupancy_map.shape
+        # Cache the models that fit within each semi-major axis.
+        model_names_per_sma: Dict[int, List[str]] = dict()
+        for ix, iz in np.ndindex(num_rows, num_columns):
             # Exclude edges.
-            if ix == 0 or ix == occupancy_map.shape[0] - 1 or iz == 0 or iz == occupancy_map.shape[1] - 1:
+            if ix == 0 or ix == num_rows - 1 or iz == 0 or iz == num_columns - 1:
                 continue
             # This position is already occupied. Sometimes, skip a position.
             if occupancy_map[ix][iz] or self._rng.random() < density:
@@ -142,19 +153,17 @@ class Arrangement(ABC):
             sma = model_cell_sizes[0]
             for mcs in model_cell_sizes:
                 # Stop if the semi-major axis doesn't fit (it would fall off the edge).
-                if ix - mcs < 0 or ix + mcs >= occupancy_map.shape[0] or iz - mcs < 0 or iz + mcs >= occupancy_map.shape[1]:
+                if ix - mcs < 0 or ix + mcs >= num_rows or iz - mcs < 0 or iz + mcs >= num_columns:
+                    break
+                # There is overlap. Stop here. The circle fits, so we only need to check the window around it.
+                elif np.any(occupancy_map[ix - mcs: ix + mcs + 1, iz - mcs: iz + mcs + 1] & Arrangement._get_disc_stamp(radius=mcs)):
                     break
                 else:
-                    # Define the circle.
-                    circle_mask = TDWUtils.get_circle_mask(shape=(occupancy_map.shape[0], occupancy_map.shape[1]),
-                                                           row=ix, column=iz, radius=mcs)
-                    # There is overlap. Stop here.
-                    if np.count_nonzero((circle_mask == True) & (occupancy_map == True)) > 0:
-                        break
-                    else:
-                        sma = mcs
+                    sma = mcs
             # Get all objects that fit.
-            model_names = [m for m in model_sizes if int(model_sizes[m] / cell_size) <= sma]
+            if sma not in model_names_per_sma:
+                model_names_per_sma[sma] = [ModelExtents.MODEL_NAMES[i] for i in model_indices[model_sizes <= sma]]
+            model_names = model_names_per_sma[sma]
             if len(model_names) == 0:
                 continue
             # Choose a random model.
@@ -168,17 +177,95 @@ class Arrangement(ABC):
             x += position["x"] - size[0] / 2 + cell_size
             z += position["z"] - size[1] / 2 + cell_size
             # Cache the object ID.
-            object_id = Controller.get_unique_id()
+            object_id = self._get_unique_id()
             # Set the rotation.
             object_ids.append(object_id)
             self.object_ids.append(object_id)
             # Add the object.
-            commands.extend(Controller.get_add_physics_object(model_name=model_name,
-                                                              position={"x": x, "y": position["y"], "z": z},
-                                                              rotation={"x": 0, "y": self._rng.uniform(0, 360), "z": 0},
-                                                              object_id=object_id,
-                                                              library="models_core.json"))
+            commands.extend(self._get_add_physics_object(model_name=model_name,
+                                                         position={"x": x, "y": position["y"], "z": z},
+                                                         rotation={"x": 0, "y": self._rng.uniform(0, 360), "z": 0},
+                                                         object_id=object_id,
+                                                         library="models_core.json"))
             # Record the position on the occupancy map.
-            occupancy_map[TDWUtils.get_circle_mask(shape=(occupancy_map.shape[0], occupancy_map.shape[1]),
-                                                   row=ix, column=iz, radius=sma) == True] = True
+            # The circle might fall off the edge of the occupancy map, so clip the stamp.
+            x0 = max(ix - sma, 0)
+            x1 = min(ix + sma + 1, num_rows)
+            z0 = max(iz - sma, 0)
+            z1 = min(iz + sma + 1, num_columns)
+            stamp = Arrangement._get_disc_stamp(radius=sma)[x0 - ix + sma: x1 - ix + sma, z0 - iz + sma: z1 - iz + sma]
+            occupancy_map[x0: x1, z0: z1] |= stamp
         return commands, object_ids
+
+    @staticmethod
+    def _get_unique_id() -> int:
+        """
+        :return: A new object ID. See: `Arrangement.set_id_seed()`.
+        """
+
+        if Arrangement._ID_RNG is None:
+            return Controller.get_unique_id()
+        # The same range as `Controller.get_unique_id()`.
+        return int(Arrangement._ID_RNG.randint(0, 2 ** 24))
+
+    @staticmethod
+    def _get_add_physics_object(model_name: str, object_id: int, position: Dict[str, float],
+                                rotation: Dict[str, float] = None, library: str = "",
+                                kinematic: bool = False) -> List[dict]:
+        """
+        :param model_name: The name of the model.
+        :param object_id: The object ID.
+        :param position: The position of the object.
+        :param rotation: The rotation of the object in Euler angles. If None, defaults to `{"x": 0, "y": 0, "z": 0}`.
+        :param library: The model library. If empty, defaults to `models_core.json`.
+        :param kinematic: If True, the object is kinematic.
+
+        :return: A list of commands to add the object. This is the same as `Controller.get_add_physics_object()` except that the container shape IDs are from `Arrangement._get_unique_id()`.
+        """
+
+        commands = Controller.get_add_physics_object(model_name=model_name,
+                                                     object_id=object_id,
+                                                     position=position,
+                                                     rotation=rotation,
+                                                     library=library,
+                                                     kinematic=kinematic)
+        if Arrangement._ID_RNG is not None:
+            for command in commands:
+                if "container_id" in command:
+                    command["container_id"] = Arrangement._get_unique_id()
+        return commands
+
+    @staticmethod
+    def _get_disc_stamp(radius: int) -> np.ndarray:
+        """
+        :param radius: The radius of the disc in occupancy map cells.
+
+        :return: A boolean array with shape `(radius * 2 + 1, radius * 2 + 1)`. Elements that are True are within the disc. This is equivalent to a window of `TDWUtils.get_circle_mask()` centered on the disc.
+        """
+
+        if radius not in Arrangement._DISC_STAMPS:
+            oy, ox = np.ogrid[-radius: radius + 1, -radius: radius + 1]
+            Arrangement._DISC_STAMPS[radius] = ox * ox + oy * oy <= radius * radius
+        return Arrangement._DISC_STAMPS[radius]
+
+    @staticmethod
+    def _get_record(model_name: str, library: str = "models_core.json") -> Optional[ModelRecord]:
+        """
+        :param model_name: The name of the model.
+        :param library: The name of the model library.
+
+        :return: The model record, or None if the record doesn't exist. This is the same as `Controller.MODEL_LIBRARIANS[library].get_record(model_name)` but it doesn't iterate through every record in the library.
+        """
+
+        if library not in Controller.MODEL_LIBRARIANS:
+            Controller.MODEL_LIBRARIANS[library] = ModelLibrarian(library)
+        librarian = Controller.MODEL_LIBRARIANS[library]
+        # Rebuild the cache if the librarian or its records changed.
+        if library not in Arrangement._RECORDS or Arrangement._RECORDS[library][0] is not librarian or \
+                Arrangement._RECORDS[library][1] != len(librarian.records):
+            records: Dict[str, ModelRecord] = dict()
+            for record in librarian.records:
+                if record.name not in records:
+                    records[record.name] = record
+            Arrangement._RECORDS[library] = (librarian, len(librarian.records), records)
+        return Arrangement._RECORDS[library][2].get(model_name)
@@ -2,13 +2,12 @@ from typing import List, Dict, Union, Optional
 from abc import ABC, abstractmethod
 from overrides import final
 import numpy as np
-from tdw.controller import Controller
 from tdw.tdw_utils import TDWUtils
 from tdw.proc_gen.arrangements.arrangement_with_root_object import ArrangementWithRootObject
 from tdw.scene_data.interior_region import InteriorRegion
 from tdw.cardinal_direction import CardinalDirection
 from tdw.ordinal_direction import OrdinalDirection
-from tdw.librarian import ModelRecord, ModelLibrarian
+from tdw.librarian import ModelRecord
 
 
 class ArrangementAlongWall(ArrangementWithRootObject, ABC):
@@ -69,9 +68,7 @@ class ArrangementAlongWall(ArrangementWithRootObject, ABC):
         model_library = self._get_model_library()
         for model_name in self._get_model_names():
             # Set the record.
-            if model_library not in Controller.MODEL_LIBRARIANS:
-                Controller.MODEL_LIBRARIANS[model_library] = ModelLibrarian(model_library)
-            self._record = Controller.MODEL_LIBRARIANS[model_library].get_record(model_name)
+            self._record = ArrangementAlongWall._get_record(model_name=model_name, library=model_library)
             # This record fits.
             if distance + self.get_length() < self._wall_length:
                 possible_records.append(self._record)
@@ -6,8 +6,10 @@ from pkg_resources import resource_filename
 from overrides import final
 import numpy as np
 from tdw.librarian import ModelRecord, ModelLibrarian
+from tdw.tdw_utils import TDWUtils
 from tdw.controller import Controller
 from tdw.proc_gen.arrangements.arrangement import Arrangement
+from tdw.proc_gen.arrangements.model_extents import ModelExtents
 from tdw.container_data.container_shape import ContainerShape
 from tdw.container_data.box_container import BoxContainer
 from tdw.container_data.cylinder_container import CylinderContainer
@@ -55,10 +57,10 @@ class ArrangementWithRootObject(Arrangement, ABC):
             else:
                 model_names = Arrangement.MODEL_CATEGORIES[category]
                 model_name = model_names[rng.randint(0, len(model_names))]
-                self._record = Controller.MODEL_LIBRARIANS["models_core.json"].get_record(model_name)
+                self._record = Arrangement._get_record(model_name=model_name)
         # Get the record.
         elif isinstance(model, str):
-            self._record = Controller.MODEL_LIBRARIANS["models_core.json"].get_record(model)
+            self._record = Arrangement._get_record(model_name=model)
         # This is a record.
         elif isinstance(model, ModelRecord):
             self._record = model
@@ -67,7 +69,7 @@ class ArrangementWithRootObject(Arrangement, ABC):
         """:field
         The ID of the root object.
         """
-        self.root_object_id: int = Controller.get_unique_id()
+        self.root_object_id: int = self._get_unique_id()
         super().__init__(position=position, rng=rng)
         self.object_ids.append(self.root_object_id)
 
@@ -79,11 +81,11 @@ class ArrangementWithRootObject(Arrangement, ABC):
         :return: A list of commands to add the root object.
         """
 
-        return Controller.get_add_physics_object(model_name=self._record.name,
-                                                 object_id=self.root_object_id,
-                                                 position=self._position,
-                                                 library=self._get_model_library(),
-                                                 kinematic=kinematic)
+        return self._get_add_physics_object(model_name=self._record.name,
+                                            object_id=self.root_object_id,
+                                            position=self._position,
+                                            library=self._get_model_library(),
+                                            kinematic=kinematic)
 
     @final
     def _add_object_with_other_objects_on_top(self, density: float = 0.4, cell_size: float = 0.05,
@@ -115,6 +117,17 @@ class ArrangementWithRootObject(Arrangement, ABC):
 
         return "models_core.json"
 
+    def _get_root_object_extents(self) -> np.ndarray:
+        """
+        :return: The extents (width, height, length) of the root object's model as a numpy array. See: [`ModelExtents`](model_extents.md).
+        """
+
+        extents = ModelExtents.get_extents(model_name=self._record.name)
+        if extents is None:
+            return TDWUtils.get_bounds_extents(bounds=self._record.bounds)
+        else:
+            return extents
+
     def _add_enclosed_objects(self, density: float = 0.4, cell_size: float = 0.05, rotate: bool = True,
                               x_scale: float = 0.8, z_scale: float = 0.8) -> List[dict]:
         """
@@ -1,6 +1,5 @@
 from typing import List
 import numpy as np
-from tdw.controller import Controller
 from tdw.tdw_utils import TDWUtils
 from tdw.proc_gen.arrangements.arrangement_along_wall import ArrangementAlongWall
 
@@ -49,7 +48,7 @@ class Basket(ArrangementAlongWall):
     
     def get_commands(self) -> List[dict]:
         commands = self._add_root_object(kinematic=False)
-        extents = TDWUtils.get_bounds_extents(bounds=self._record.bounds)
+        extents = self._get_root_object_extents()
         d = float(extents[0] if extents[0] < extents[2] else extents[2])
         d *= 0.6
         r = d / 2
@@ -58,24 +57,25 @@ class Basket(ArrangementAlongWall):
             category = Basket.INSIDE_OF["basket"][self._rng.randint(0, len(Basket.INSIDE_OF["basket"]))]
             model_name = Basket.MODEL_CATEGORIES[category][self._rng.randint(0, len(Basket.MODEL_CATEGORIES[category]))]
             q = TDWUtils.get_random_point_in_circle(center=np.array([self._position["x"], y, self._position["z"]]),
-                                                    radius=r)
+                                                    radius=r,
+                                                    rng=self._rng)
             q[1] = y
-            commands.extend(Controller.get_add_physics_object(model_name=model_name,
-                                                              object_id=Controller.get_unique_id(),
-                                                              position=TDWUtils.array_to_vector3(q),
-                                                              rotation={"x": float(self._rng.uniform(0, 360)),
-                                                                        "y": float(self._rng.uniform(0, 360)),
-                                                                        "z": float(self._rng.uniform(0, 360))},
-                                                              library="models_core.json"))
+            commands.extend(self._get_add_physics_object(model_name=model_name,
+                                                         object_id=self._get_unique_id(),
+                                                         position=TDWUtils.array_to_vector3(q),
+                                                         rotation={"x": float(self._rng.uniform(0, 360)),
+                                                                   "y": float(self._rng.uniform(0, 360)),
+                                                                   "z": float(self._rng.uniform(0, 360))},
+                                                         library="models_core.json"))
             y += Basket.DELTA_Y
         commands.extend(self._get_rotation_commands())
         return commands
 
     def get_length(self) -> float:
-        return float(TDWUtils.get_bounds_extents(bounds=self._record.bounds)[0]) + Basket.LENGTH_OFFSET
+        return float(self._get_root_object_extents()[0]) + Basket.LENGTH_OFFSET
 
     def _get_depth(self) -> float:
-        return float(TDWUtils.get_bounds_extents(bounds=self._record.bounds)[2] * self._rng.uniform(Basket.MIN_DEPTH_OFFSET,
+        return float(self._get_root_object_extents()[2] * self._rng.uniform(Basket.MIN_DEPTH_OFFSET,
                                                                                                     Basket.MAX_DEPTH_OFFSET))
 
     def _get_rotation(self) -> float:
@@ -1,5 +1,4 @@
 from typing import List, Dict
-from tdw.controller import Controller
 from tdw.proc_gen.arrangements.arrangement import Arrangement
 
 
@@ -30,18 +29,18 @@ class CupAndCoaster(Arrangement):
         if self._rng.random() > 0.5:
             coaster_model_name: str = CupAndCoaster.MODEL_CATEGORIES["coaster"][
                 self._rng.randint(0, len(CupAndCoaster.MODEL_CATEGORIES["coaster"]))]
-            coaster_id = Controller.get_unique_id()
+            coaster_id = self._get_unique_id()
             self.object_ids.append(coaster_id)
-            commands.extend(Controller.get_add_physics_object(model_name=coaster_model_name,
-                                                              position=self._position,
-                                                              rotation={"x": 0,
-                                                                        "y": float(self._rng.uniform(
-                                                                            -CupAndCoaster.ROTATION,
-                                                                            CupAndCoaster.ROTATION)),
-                                                                        "z": 0},
-                                                              object_id=coaster_id,
-                                                              library="models_core.json"))
-            coaster_record = Controller.MODEL_LIBRARIANS["models_core.json"].get_record(coaster_model_name)
+            commands.extend(self._get_add_physics_object(model_name=coaster_model_name,
+                                                         position=self._position,
+                                                         rotation={"x": 0,
+                                                                   "y": float(self._rng.uniform(
+                                                                       -CupAndCoaster.ROTATION,
+                                                                       CupAndCoaster.ROTATION)),
+                                                                   "z": 0},
+                                                         object_id=coaster_id,
+                                                         library="models_core.json"))
+            coaster_record = CupAndCoaster._get_record(model_name=coaster_model_name)
             y = self._position["y"] + coaster_record.bounds["top"]["y"]
         else:
             y = self._position["y"]
@@ -49,17 +48,17 @@ class CupAndCoaster(Arrangement):
         cup_category = CupAndCoaster.CUP_CATEGORIES[self._rng.randint(0, len(CupAndCoaster.CUP_CATEGORIES))]
         cup_model_name = CupAndCoaster.MODEL_CATEGORIES[cup_category][self._rng.randint(0, len(CupAndCoaster.MODEL_CATEGORIES[cup_category]))]
         # Add the cup.
-        cup_id = Controller.get_unique_id()
+        cup_id = self._get_unique_id()
         self.object_ids.append(cup_id)
-        commands.extend(Controller.get_add_physics_object(model_name=cup_model_name,
-                                                          object_id=cup_id,
-                                                          position={"x": self._position["x"],
-                                                                    "y": y,
-                                                                    "z": self._position["z"]},
-                                                          rotation={"x": 0,
-                                                                    "y": float(self._rng.uniform(0, 360)),
-                                                                    "z": 0},
-                                                          library="models_core.json"))
+        commands.extend(self._get_add_physics_object(model_name=cup_model_name,
+                                                     object_id=cup_id,
+                                                     position={"x": self._position["x"],
+                                                               "y": y,
+                                                               "z": self._position["z"]},
+                                                     rotation={"x": 0,
+                                                               "y": float(self._rng.uniform(0, 360)),
+                                                               "z": 0},
+                                                     library="models_core.json"))
         return commands
 
     def _get_rotation(self) -> float:
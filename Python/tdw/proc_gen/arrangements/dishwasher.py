@@ -2,11 +2,9 @@ from pathlib import Path
 from json import loads
 from pkg_resources import resource_filename
 from typing import List, Dict, Tuple
-from tdw.tdw_utils import TDWUtils
 from tdw.cardinal_direction import CardinalDirection
+from tdw.proc_gen.arrangements.model_extents import ModelExtents
 from tdw.proc_gen.arrangements.arrangement_along_wall import ArrangementAlongWall
-from tdw.controller import Controller
-from tdw.librarian import ModelLibrarian
 
 
 class Dishwasher(ArrangementAlongWall):
@@ -55,17 +53,14 @@ class Dishwasher(ArrangementAlongWall):
         commands = self._add_root_object()
         # Add a counter top.
         if self._record.name in Dishwasher.COUNTER_TOPS:
-            if "models_special.json" not in Controller.MODEL_LIBRARIANS:
-                Controller.MODEL_LIBRARIANS["models_special.json"] = ModelLibrarian("models_special.json")
-            counter_top_record = Controller.MODEL_LIBRARIANS["models_special.json"].get_record(Dishwasher.COUNTER_TOPS[self._record.name])
-            counter_top_bounds = TDWUtils.get_bounds_extents(bounds=counter_top_record.bounds)
-            counter_top_id = Controller.get_unique_id()
-            commands.extend(Controller.get_add_physics_object(model_name=counter_top_record.name,
-                                                              position=self._position,
-                                                              rotation={"x": 0, "y": self._get_rotation(), "z": 0},
-                                                              library="models_special.json",
-                                                              object_id=counter_top_id,
-                                                              kinematic=True))
+            counter_top_bounds = ModelExtents.get_extents(model_name=Dishwasher.COUNTER_TOPS[self._record.name])
+            counter_top_id = self._get_unique_id()
+            commands.extend(self._get_add_physics_object(model_name=Dishwasher.COUNTER_TOPS[self._record.name],
+                                                         position=self._position,
+                                                         rotation={"x": 0, "y": self._get_rotation(), "z": 0},
+                                                         library="models_special.json",
+                                                         object_id=counter_top_id,
+                                                         kinematic=True))
             self.object_ids.append(counter_top_id)
             on_top_commands, object_ids = self._add_rectangular_arrangement(size=(float(counter_top_bounds[0] / 2) * Dishwasher.WIDTH_SCALE,
                                                                                   float(counter_top_bounds[1] / 2) * Dishwasher.DEPTH_SCALE),
@@ -95,7 +90,7 @@ class Dishwasher(ArrangementAlongWall):
         return pos
 
     def get_length(self) -> float:
-        return float(TDWUtils.get_bounds_extents(bounds=self._record.bounds)[0]) + Dishwasher.LENGTH_OFFSET * 2
+        return float(self._get_root_object_extents()[0]) + Dishwasher.LENGTH_OFFSET * 2
 
     def _get_rotation(self) -> float:
         if self._wall == CardinalDirection.north:
@@ -108,10 +103,10 @@ class Dishwasher(ArrangementAlongWall):
             return 90
 
     def _get_depth(self) -> float:
-        return float(TDWUtils.get_bounds_extents(bounds=self._record.bounds)[2])
+        return float(self._get_root_object_extents()[2])
 
     def _get_size(self) -> Tuple[float, float]:
-        extents: List[float] = TDWUtils.get_bounds_extents(bounds=self._record.bounds).tolist()
+        extents: List[float] = self._get_root_object_extents().tolist()
         return extents[2], extents[0] + Dishwasher.LENGTH_OFFSET * 2
 
     def _get_category(self) -> str:
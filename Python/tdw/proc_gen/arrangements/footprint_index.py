@@ -0,0 +1,152 @@
+from typing import Dict, List, Tuple
+import numpy as np
+from tdw.tdw_utils import TDWUtils
+from tdw.proc_gen.arrangements.arrangement import Arrangement
+from tdw.proc_gen.arrangements.model_extents import ModelExtents
+
+
+class FootprintIndex:
+    """
+    A 2D spatial index of the positions of objects in a procedurally-generated scene, used for proximity checks.
+
+    Each object is treated as a circle on the (x, z) plane centered at its position. The radius of the circle is the object's semi-major axis: the greater of the width and length of the model's bounds (see [`ModelExtents`](model_extents.md)). This is the same proximity test that `ProcGenKitchen` previously made by scanning all of the commands of the scene. Objects are stored in a uniform grid so that a query only tests objects in nearby cells rather than every object in the scene.
+
+    The index doesn't test rectangle overlaps, and arrangements don't register themselves into it. `ProcGenKitchen` adds the commands of each arrangement to its index; see `ProcGenKitchen.footprints`.
+
+    Objects can be added one at a time or parsed from a list of commands:
+
+    ```python
+    from tdw.proc_gen.arrangements.footprint_index import FootprintIndex
+    from tdw.proc_gen.arrangements.kitchen_table import KitchenTable
+
+    index = FootprintIndex()
+    index.add_commands(kitchen_table.get_commands())
+    if not index.is_near(x=0, z=1.5):
+        print("Nothing is nearby.")
+    ```
+    """
+
+    def __init__(self, cell_size: float = Arrangement.DEFAULT_CELL_SIZE):
+        """
+        :param cell_size: The size of each grid cell in meters.
+        """
+
+        """:field
+        The size of each grid cell in meters.
+        """
+        self.cell_size: float = cell_size
+        """:field
+        The ID of each object, in the order that they were added.
+        """
+        self.object_ids: List[int] = list()
+        # The (x, y, z) position of each footprint.
+        self._positions: List[Tuple[float, float, float]] = list()
+        # The (width, length) of each footprint.
+        self._sizes: List[Tuple[float, float]] = list()
+        # Key = A grid cell. Value = A list of footprint indices whose centers are in the cell.
+        self._cells: Dict[Tuple[int, int], List[int]] = dict()
+        # The largest half-diagonal of any footprint. This determines how many cells a query must search.
+        self._max_half_diagonal: float = 0
+
+    def add(self, object_id: int, model_name: str, position: Dict[str, float]) -> None:
+        """
+        Add an object's footprint to the index.
+
+        :param object_id: The object ID.
+        :param model_name: The name of the model.
+        :param position: The position of the object.
+        """
+
+        extents = ModelExtents.get_extents(model_name=model_name)
+        if extents is None:
+            if "counter_top" in model_name:
+                library = "models_special.json"
+            else:
+                library = "models_core.json"
+            extents = TDWUtils.get_bounds_extents(bounds=Arrangement._get_record(model_name=model_name, library=library).bounds)
+        index = len(self.object_ids)
+        self.object_ids.append(object_id)
+        self._positions.append((float(position["x"]), float(position["y"]), float(position["z"])))
+        self._sizes.append((float(extents[0]), float(extents[2])))
+        cell = self._get_cell(x=position["x"], z=position["z"])
+        if cell not in self._cells:
+            self._cells[cell] = list()
+        self._cells[cell].append(index)
+        half_diagonal = float(np.sqrt(extents[0] ** 2 + extents[2] ** 2)) / 2
+        if half_diagonal > self._max_half_diagonal:
+            self._max_half_diagonal = half_diagonal
+
+    def add_commands(self, commands: List[dict]) -> None:
+        """
+        Add the footprint of every object in a list of commands, for example the commands returned by `Arrangement.get_commands()`.
+
+        This parses `add_object` commands. Other commands are ignored.
+
+        :param commands: The commands.
+        """
+
+        for command in commands:
+            if command["$type"] == "add_object":
+                self.add(object_id=command["id"], model_name=command["name"], position=command["position"])
+
+    def is_near(self, x: float, z: float, scale: float = 1, max_y: float = None) -> bool:
+        """
+        Check whether a point is near any object. A point is near an object if its distance to the object's position is less than the object's semi-major axis (the greater of its width and length) multiplied by `scale`.
+
+        :param x: The x coordinate of the point.
+        :param z: The z coordinate of the point.
+        :param scale: The semi-major axis of each object is multiplied by this factor.
+        :param max_y: If not None, ignore objects whose y coordinate is greater than this, for example objects on top of other objects.
+
+        :return: True if the point is near any object.
+        """
+
+        p = np.array([x, z])
+        for i in self._get_candidates(x=x, z=z, distance=self._max_half_diagonal * 2 * scale):
+            if max_y is not None and self._positions[i][1] > max_y:
+                continue
+            width, length = self._sizes[i]
+            extent = (width if width > length else length) * scale
+            if np.linalg.norm(p - np.array([self._positions[i][0], self._positions[i][2]])) < extent:
+                return True
+        return False
+
+    def clear(self) -> None:
+        """
+        Remove all footprints from the index.
+        """
+
+        self.object_ids.clear()
+        self._positions.clear()
+        self._sizes.clear()
+        self._cells.clear()
+        self._max_half_diagonal = 0
+
+    def _get_cell(self, x: float, z: float) -> Tuple[int, int]:
+        """
+        :param x: The x coordinate.
+        :param z: The z coordinate.
+
+        :return: The grid cell that contains the point.
+        """
+
+        return int(np.floor(x / self.cell_size)), int(np.floor(z / self.cell_size))
+
+    def _get_candidates(self, x: float, z: float, distance: float) -> List[int]:
+        """
+        :param x: The x coordinate.
+        :param z: The z coordinate.
+        :param distance: The maximum distance from the point to the center of a footprint.
+
+        :return: The indices of every footprint whose center is in a cell within `distance` of the point, in the order that they were added.
+        """
+
+        x0, z0 = self._get_cell(x=x - distance, z=z - distance)
+        x1, z1 = self._get_cell(x=x + distance, z=z + distance)
+        candidates: List[int] = list()
+        for ix in range(x0, x1 + 1):
+            for iz in range(z0, z1 + 1):
+                if (ix, iz) in self._cells:
+                    candidates.extend(self._cells[(ix, iz)])
+        candidates.sort()
+        return candidates
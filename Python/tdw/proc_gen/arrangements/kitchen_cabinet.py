@@ -2,7 +2,6 @@ from abc import ABC
 from typing import Union
 import numpy as np
 from overrides import final
-from tdw.tdw_utils import TDWUtils
 from tdw.proc_gen.arrangements.arrangement_along_wall import ArrangementAlongWall
 from tdw.proc_gen.arrangements.cabinetry.cabinetry import Cabinetry
 from tdw.cardinal_direction import CardinalDirection
@@ -36,7 +35,7 @@ class KitchenCabinet(ArrangementAlongWall, ABC):
 
     @final
     def get_length(self) -> float:
-        return float(TDWUtils.get_bounds_extents(bounds=self._record.bounds)[0])
+        return float(self._get_root_object_extents()[0])
 
     def _get_rotation(self) -> float:
         if self._wall == CardinalDirection.north:
@@ -50,4 +49,4 @@ class KitchenCabinet(ArrangementAlongWall, ABC):
 
     @final
     def _get_depth(self) -> float:
-        return float(TDWUtils.get_bounds_extents(bounds=self._record.bounds)[2])
+        return float(self._get_root_object_extents()[2])
@@ -3,8 +3,6 @@ from pathlib import Path
 from pkg_resources import resource_filename
 from typing import Dict, List, Union, Optional
 import numpy as np
-from tdw.tdw_utils import TDWUtils
-from tdw.controller import Controller
 from tdw.proc_gen.arrangements.kitchen_cabinet import KitchenCabinet
 from tdw.proc_gen.arrangements.wall_cabinet import WallCabinet
 from tdw.proc_gen.arrangements.microwave import Microwave
@@ -103,7 +101,7 @@ class KitchenCounter(KitchenCabinet):
                          rng=rng, wall_length=wall_length)
 
     def get_commands(self) -> List[dict]:
-        extents = TDWUtils.get_bounds_extents(bounds=self._record.bounds)
+        extents = self._get_root_object_extents()
         # Place a microwave on top of the kitchen counter.
         if extents[0] > 0.7 and self._allow_microwave:
             commands = self._add_root_object()
@@ -151,8 +149,8 @@ class KitchenCounter(KitchenCabinet):
                                            distance=self._distance,
                                            region=self._region,
                                            wall_length=self._wall_length,
-                                           model=Controller.MODEL_LIBRARIANS["models_core.json"].get_record(
-                                               KitchenCounter.COUNTERS_AND_CABINETS[self._record.name]),
+                                           model=KitchenCounter._get_record(
+                                               model_name=KitchenCounter.COUNTERS_AND_CABINETS[self._record.name]),
                                            rng=self._rng)
                 wall_cabinet_commands = wall_cabinet.get_commands()
                 self.object_ids.extend(wall_cabinet.object_ids)
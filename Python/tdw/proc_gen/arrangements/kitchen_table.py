@@ -105,7 +105,7 @@ class KitchenTable(TableAndChairs):
             else:
                 model_names = TableAndChairs.MODEL_CATEGORIES[category]
                 model_name = model_names[rng.randint(0, len(model_names))]
-                self._record = Controller.MODEL_LIBRARIANS["models_core.json"].get_record(model_name)
+                self._record = KitchenTable._get_record(model_name=model_name)
         self._room: Room = room
         self._offset_distance: float = offset_distance
         super().__init__(used_walls=used_walls, region=room.main_region, model=model,
@@ -158,28 +158,28 @@ class KitchenTable(TableAndChairs):
                 commands.append({"$type": "unparent_object",
                                  "id": child_object_id})
         # Add a centerpiece.
-        table_extents = TDWUtils.get_bounds_extents(bounds=self._record.bounds)
+        table_extents = self._get_root_object_extents()
         area = table_extents[0] * table_extents[2]
         if area > KitchenTable.MIN_AREA_FOR_CENTERPIECE and self._rng.random() < KitchenTable.CENTERPIECE_PROBABILITY:
             centerpiece_category = KitchenTable.CENTERPIECE_CATEGORIES[
                 self._rng.randint(0, len(KitchenTable.CENTERPIECE_CATEGORIES))]
             centerpiece_model_name = KitchenTable.MODEL_CATEGORIES[centerpiece_category][
                 self._rng.randint(0, len(KitchenTable.MODEL_CATEGORIES[centerpiece_category]))]
-            object_id = Controller.get_unique_id()
+            object_id = self._get_unique_id()
             self.object_ids.append(object_id)
-            commands.extend(Controller.get_add_physics_object(model_name=centerpiece_model_name,
-                                                              object_id=object_id,
-                                                              position={"x": top["x"] + float(self._rng.uniform(
-                                                                  -KitchenTable.CENTERPIECE_POSITION_PERTURBATION,
-                                                                  KitchenTable.CENTERPIECE_POSITION_PERTURBATION)),
-                                                                        "y": top["y"],
-                                                                        "z": top["z"] + float(self._rng.uniform(
-                                                                            -KitchenTable.CENTERPIECE_POSITION_PERTURBATION,
-                                                                            KitchenTable.CENTERPIECE_POSITION_PERTURBATION))},
-                                                              rotation={"x": 0,
-                                                                        "y": float(self._rng.uniform(0, 360)),
-                                                                        "z": 0},
-                                                              library="models_core.json"))
+            commands.extend(self._get_add_physics_object(model_name=centerpiece_model_name,
+                                                         object_id=object_id,
+                                                         position={"x": top["x"] + float(self._rng.uniform(
+                                                             -KitchenTable.CENTERPIECE_POSITION_PERTURBATION,
+                                                             KitchenTable.CENTERPIECE_POSITION_PERTURBATION)),
+                                                                   "y": top["y"],
+                                                                   "z": top["z"] + float(self._rng.uniform(
+                                                                       -KitchenTable.CENTERPIECE_POSITION_PERTURBATION,
+                                                                       KitchenTable.CENTERPIECE_POSITION_PERTURBATION))},
+                                                         rotation={"x": 0,
+                                                                   "y": float(self._rng.uniform(0, 360)),
+                                                                   "z": 0},
+                                                         library="models_core.json"))
         return commands
 
     def _get_position(self, position: Dict[str, float]) -> Dict[str, float]:
@@ -0,0 +1,117 @@
+from json import loads, dumps
+from pathlib import Path
+from pkg_resources import resource_filename
+from typing import Dict, List, Optional
+import numpy as np
+from tdw.tdw_utils import TDWUtils
+from tdw.controller import Controller
+from tdw.librarian import ModelLibrarian
+from tdw.proc_gen.arrangements.cabinetry.cabinetry import CABINETRY
+
+
+# Key = The model library. Value = A dictionary: Key = The model name. Value = The extents.
+_TABLE: Dict[str, Dict[str, List[float]]] = loads(Path(resource_filename(__name__, "data/model_extents.json")).read_text())
+_MODEL_NAMES: List[str] = [model_name for library in _TABLE for model_name in _TABLE[library]]
+# Key = The model name. Value = The index in `_MODEL_NAMES`.
+_INDICES: Dict[str, int] = {model_name: i for i, model_name in enumerate(_MODEL_NAMES)}
+
+
+class ModelExtents:
+    """
+    A precomputed table of the extents of every model that can be used by procedural generation: every model in `Arrangement.MODEL_CATEGORIES`, every cabinetry model, and the counter top models in `models_special.json`.
+
+    The table is stored in `data/model_extents.json` so that arrangements don't need to look up records and calculate their bounds extents every time they are created. Arrangements can select candidate models by filtering the numpy arrays of a category instead of iterating through records.
+
+    ```python
+    from tdw.proc_gen.arrangements.model_extents import ModelExtents
+
+    # Get all cups with a semi-major axis less than 10 cm.
+    indices = ModelExtents.CATEGORIES["cup"]
+    model_names = [ModelExtents.MODEL_NAMES[i] for i in indices[ModelExtents.SEMI_MAJOR_AXES[indices] < 0.1]]
+    ```
+    """
+
+    """:class_var
+    The names of all of the models in the table. The other arrays are indexed by the position of the name in this list.
+    """
+    MODEL_NAMES: List[str] = _MODEL_NAMES
+    """:class_var
+    The extents (width, height, length) of each model as a numpy array with shape `(n, 3)`. See: `TDWUtils.get_bounds_extents()`.
+    """
+    EXTENTS: np.ndarray = np.array([_TABLE[library][model_name] for library in _TABLE for model_name in _TABLE[library]],
+                                   dtype=np.float64)
+    """:class_var
+    The semi-major axis (the greater of the width and the length) of each model.
+    """
+    SEMI_MAJOR_AXES: np.ndarray = np.maximum(EXTENTS[:, 0], EXTENTS[:, 2])
+    """:class_var
+    The models in each category. Key = The category (see `Arrangement.MODEL_CATEGORIES`). Value = A numpy array of indices in `MODEL_NAMES`, in the same order as the category's list of model names.
+    """
+    CATEGORIES: Dict[str, np.ndarray] = {category: np.array([_INDICES[model_name] for model_name in model_names], dtype=int)
+                                         for category, model_names in loads(Path(resource_filename(__name__, "data/models.json")).read_text()).items()}
+
+    @staticmethod
+    def get_index(model_name: str) -> Optional[int]:
+        """
+        :param model_name: The name of the model.
+
+        :return: The index of the model in `ModelExtents.MODEL_NAMES`, or None if the model isn't in the table.
+        """
+
+        if model_name in _INDICES:
+            return _INDICES[model_name]
+        else:
+            return None
+
+    @staticmethod
+    def get_extents(model_name: str) -> Optional[np.ndarray]:
+        """
+        :param model_name: The name of the model.
+
+        :return: The extents (width, height, length) of the model as a numpy array, or None if the model isn't in the table.
+        """
+
+        if model_name in _INDICES:
+            return np.copy(ModelExtents.EXTENTS[_INDICES[model_name]])
+        else:
+            return None
+
+    @staticmethod
+    def get_indices(categories: List[str]) -> np.ndarray:
+        """
+        :param categories: A list of categories.
+
+        :return: The indices in `ModelExtents.MODEL_NAMES` of every model in each category, concatenated in order. A model might appear more than once if it is in more than one category.
+        """
+
+        if len(categories) == 0:
+            return np.zeros(shape=0, dtype=int)
+        return np.concatenate([ModelExtents.CATEGORIES[category] for category in categories])
+
+    @staticmethod
+    def write() -> None:
+        """
+        Regenerate `data/model_extents.json` from `models_core.json`, `models_special.json`, `data/models.json`, and the cabinetry data. Call this whenever any of these change.
+        """
+
+        model_names: Dict[str, List[str]] = {"models_core.json": list(),
+                                             "models_special.json": list()}
+        for category_model_names in loads(Path(resource_filename(__name__, "data/models.json")).read_text()).values():
+            model_names["models_core.json"].extend(category_model_names)
+        for cabinetry in CABINETRY.values():
+            model_names["models_core.json"].extend(cabinetry.kitchen_counters)
+            model_names["models_core.json"].extend(cabinetry.wall_cabinets)
+            model_names["models_core.json"].extend(cabinetry.sinks)
+        model_names["models_special.json"].append("floating_counter_top_counter_top")
+        model_names["models_special.json"].extend(loads(Path(resource_filename(__name__, "data/dishwasher_counter_tops.json")).read_text()).values())
+        table: Dict[str, Dict[str, List[float]]] = dict()
+        for library in model_names:
+            if library not in Controller.MODEL_LIBRARIANS:
+                Controller.MODEL_LIBRARIANS[library] = ModelLibrarian(library)
+            table[library] = dict()
+            for model_name in model_names[library]:
+                if model_name in table[library]:
+                    continue
+                record = Controller.MODEL_LIBRARIANS[library].get_record(model_name)
+                table[library][model_name] = [float(e) for e in TDWUtils.get_bounds_extents(bounds=record.bounds)]
+        Path(resource_filename(__name__, "data/model_extents.json")).write_text(dumps(table, indent=2))
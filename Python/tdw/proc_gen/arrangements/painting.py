@@ -1,5 +1,4 @@
 from typing import List, Dict
-from tdw.tdw_utils import TDWUtils
 from tdw.cardinal_direction import CardinalDirection
 from tdw.proc_gen.arrangements.arrangement_along_wall import ArrangementAlongWall
 
@@ -27,16 +26,16 @@ class Painting(ArrangementAlongWall):
         return commands
 
     def get_length(self) -> float:
-        return float(TDWUtils.get_bounds_extents(bounds=self._record.bounds)[0]) * 2
+        return float(self._get_root_object_extents()[0]) * 2
 
     def _get_position(self, position: Dict[str, float]) -> Dict[str, float]:
         pos = super()._get_position(position=position)
-        extents = TDWUtils.get_bounds_extents(bounds=self._record.bounds)
+        extents = self._get_root_object_extents()
         pos["y"] = float(self._rng.uniform(Painting.MIN_Y, self._region.bounds[1] - extents[1]))
         return pos
     
     def _get_depth(self) -> float:
-        return float(TDWUtils.get_bounds_extents(bounds=self._record.bounds)[2]) * 4
+        return float(self._get_root_object_extents()[2]) * 4
     
     def _get_rotation(self) -> float:
         if self._wall == CardinalDirection.north:
@@ -1,7 +1,5 @@
 from typing import Dict, List
-from tdw.tdw_utils import TDWUtils
 from tdw.proc_gen.arrangements.arrangement_with_root_object import ArrangementWithRootObject
-from tdw.controller import Controller
 
 
 class Plate(ArrangementWithRootObject):
@@ -32,21 +30,21 @@ class Plate(ArrangementWithRootObject):
 
         commands = self._add_root_object()
         if self._rng.random() < Plate.FOOD_PROBABILITY:
-            extents = TDWUtils.get_bounds_extents(bounds=self._record.bounds)
+            extents = self._get_root_object_extents()
             food_category: str = Plate.FOOD_CATEGORIES[self._rng.randint(0, len(Plate.FOOD_CATEGORIES))]
             food = Plate.MODEL_CATEGORIES[food_category]
             food_model_name = food[self._rng.randint(0, len(food))]
-            food_id = Controller.get_unique_id()
+            food_id = self._get_unique_id()
             self.object_ids.append(food_id)
-            commands.extend(Controller.get_add_physics_object(model_name=food_model_name,
-                                                              object_id=food_id,
-                                                              position={"x": self._position["x"],
-                                                                        "y": self._position["y"] + extents[1],
-                                                                        "z": self._position["z"]},
-                                                              rotation={"x": 0,
-                                                                        "y": self._rng.uniform(0, 360),
-                                                                        "z": 0},
-                                                              library="models_core.json"))
+            commands.extend(self._get_add_physics_object(model_name=food_model_name,
+                                                         object_id=food_id,
+                                                         position={"x": self._position["x"],
+                                                                   "y": self._position["y"] + extents[1],
+                                                                   "z": self._position["z"]},
+                                                         rotation={"x": 0,
+                                                                   "y": self._rng.uniform(0, 360),
+                                                                   "z": 0},
+                                                         library="models_core.json"))
         return commands
 
     def _get_position(self, position: Dict[str, float]) -> Dict[str, float]:
@@ -2,7 +2,6 @@ from pathlib import Path
 from pkg_resources import resource_filename
 from json import loads
 from typing import List
-from tdw.tdw_utils import TDWUtils
 from tdw.proc_gen.arrangements.arrangement_along_wall import ArrangementAlongWall
 
 
@@ -30,10 +29,10 @@ class Radiator(ArrangementAlongWall):
         return commands
 
     def get_length(self) -> float:
-        return TDWUtils.get_bounds_extents(bounds=self._record.bounds)[Radiator._ROTATIONS[self._record.name]["length"]] * Radiator.LENGTH_FACTOR
+        return self._get_root_object_extents()[Radiator._ROTATIONS[self._record.name]["length"]] * Radiator.LENGTH_FACTOR
 
     def _get_depth(self) -> float:
-        depth = TDWUtils.get_bounds_extents(bounds=self._record.bounds)[Radiator._ROTATIONS[self._record.name]["depth"]]
+        depth = self._get_root_object_extents()[Radiator._ROTATIONS[self._record.name]["depth"]]
         return depth + Radiator._ROTATIONS[self._record.name]["depth_offset"]
 
     def _get_category(self) -> str:
@@ -2,7 +2,6 @@ from pathlib import Path
 from pkg_resources import resource_filename
 from json import loads
 from typing import List
-from tdw.tdw_utils import TDWUtils
 from tdw.proc_gen.arrangements.arrangement_along_wall import ArrangementAlongWall
 
 
@@ -25,10 +24,10 @@ class Refrigerator(ArrangementAlongWall):
         return commands
 
     def get_length(self) -> float:
-        return TDWUtils.get_bounds_extents(bounds=self._record.bounds)[Refrigerator._ROTATIONS[self._record.name]["length"]]
+        return self._get_root_object_extents()[Refrigerator._ROTATIONS[self._record.name]["length"]]
 
     def _get_depth(self) -> float:
-        return TDWUtils.get_bounds_extents(bounds=self._record.bounds)[Refrigerator._ROTATIONS[self._record.name]["depth"]]
+        return self._get_root_object_extents()[Refrigerator._ROTATIONS[self._record.name]["depth"]]
 
     def _get_category(self) -> str:
         return "refrigerator"
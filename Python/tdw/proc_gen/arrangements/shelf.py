@@ -1,5 +1,4 @@
 from typing import List
-from tdw.tdw_utils import TDWUtils
 from tdw.cardinal_direction import CardinalDirection
 from tdw.proc_gen.arrangements.arrangement_along_wall import ArrangementAlongWall
 
@@ -53,10 +52,10 @@ class Shelf(ArrangementAlongWall):
             return 0
 
     def get_length(self) -> float:
-        return float(TDWUtils.get_bounds_extents(bounds=self._record.bounds)[2])
+        return float(self._get_root_object_extents()[2])
 
     def _get_depth(self) -> float:
-        return float(TDWUtils.get_bounds_extents(bounds=self._record.bounds)[0])
+        return float(self._get_root_object_extents()[0])
 
     def _get_category(self) -> str:
         return "shelf"
@@ -1,5 +1,4 @@
 from typing import List
-from tdw.tdw_utils import TDWUtils
 from tdw.cardinal_direction import CardinalDirection
 from tdw.proc_gen.arrangements.arrangement_along_wall import ArrangementAlongWall
 
@@ -52,10 +51,10 @@ class SideTable(ArrangementAlongWall):
                                                           z_scale=SideTable.DEPTH_SCALE)
 
     def get_length(self) -> float:
-        return float(TDWUtils.get_bounds_extents(bounds=self._record.bounds)[2]) * SideTable.LENGTH_FACTOR
+        return float(self._get_root_object_extents()[2]) * SideTable.LENGTH_FACTOR
 
     def _get_depth(self) -> float:
-        return float(TDWUtils.get_bounds_extents(bounds=self._record.bounds)[0]) * SideTable.DEPTH_FACTOR
+        return float(self._get_root_object_extents()[0]) * SideTable.DEPTH_FACTOR
 
     def _get_rotation(self) -> float:
         if self._wall == CardinalDirection.north:
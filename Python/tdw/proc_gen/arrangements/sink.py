@@ -2,7 +2,6 @@ from typing import List
 from pathlib import Path
 from pkg_resources import resource_filename
 from json import loads
-from tdw.controller import Controller
 from tdw.proc_gen.arrangements.kitchen_cabinet import KitchenCabinet
 
 
@@ -105,14 +104,14 @@ class Sink(KitchenCabinet):
         # Add the faucet.
         faucet_keys = list(Sink._FAUCETS.keys())
         faucet_model_name = faucet_keys[self._rng.randint(0, len(faucet_keys))]
-        faucet_id = Controller.get_unique_id()
-        faucet_commands = Controller.get_add_physics_object(model_name=faucet_model_name,
-                                                            object_id=faucet_id,
-                                                            position={"x": self._position["x"] + Sink._FAUCETS[faucet_model_name]["position"]["x"],
-                                                                      "y": Sink._FAUCETS[faucet_model_name]["position"]["y"],
-                                                                      "z": self._position["z"] + Sink._FAUCETS[faucet_model_name]["position"]["z"]},
-                                                            rotation=Sink._FAUCETS[faucet_model_name]["rotation"],
-                                                            kinematic=True)
+        faucet_id = self._get_unique_id()
+        faucet_commands = self._get_add_physics_object(model_name=faucet_model_name,
+                                                       object_id=faucet_id,
+                                                       position={"x": self._position["x"] + Sink._FAUCETS[faucet_model_name]["position"]["x"],
+                                                                 "y": Sink._FAUCETS[faucet_model_name]["position"]["y"],
+                                                                 "z": self._position["z"] + Sink._FAUCETS[faucet_model_name]["position"]["z"]},
+                                                       rotation=Sink._FAUCETS[faucet_model_name]["rotation"],
+                                                       kinematic=True)
         self.object_ids.append(faucet_id)
         commands.extend(faucet_commands)
         commands.extend(self._get_rotation_commands())
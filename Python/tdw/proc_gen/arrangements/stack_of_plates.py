@@ -1,7 +1,6 @@
 from typing import Dict, List
-from tdw.tdw_utils import TDWUtils
+from tdw.proc_gen.arrangements.model_extents import ModelExtents
 from tdw.proc_gen.arrangements.arrangement import Arrangement
-from tdw.controller import Controller
 
 
 class StackOfPlates(Arrangement):
@@ -23,19 +22,18 @@ class StackOfPlates(Arrangement):
 
     def get_commands(self) -> List[dict]:
         model_name = Arrangement.MODEL_CATEGORIES["plate"][self._rng.randint(0, len(Arrangement.MODEL_CATEGORIES["plate"]))]
-        record = Controller.MODEL_LIBRARIANS["models_core.json"].get_record(model_name)
-        extents = TDWUtils.get_bounds_extents(bounds=record.bounds)
+        extents = ModelExtents.get_extents(model_name=model_name)
         y = self._position["y"]
         commands = []
         num_plates = self._rng.randint(StackOfPlates.MIN_NUM, StackOfPlates.MAX_NUM + 1)
         for i in range(num_plates):
-            object_id = Controller.get_unique_id()
+            object_id = self._get_unique_id()
             self.object_ids.append(object_id)
-            commands.extend(Controller.get_add_physics_object(model_name=model_name,
-                                                              object_id=object_id,
-                                                              position={"x": self._position["x"],
-                                                                        "y": y,
-                                                                        "z": self._position["z"]}))
+            commands.extend(self._get_add_physics_object(model_name=model_name,
+                                                         object_id=object_id,
+                                                         position={"x": self._position["x"],
+                                                                   "y": y,
+                                                                   "z": self._position["z"]}))
             y += extents[1]
         return commands
 
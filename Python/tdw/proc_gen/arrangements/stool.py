@@ -1,5 +1,4 @@
 from typing import List
-from tdw.tdw_utils import TDWUtils
 from tdw.proc_gen.arrangements.arrangement_along_wall import ArrangementAlongWall
 
 
@@ -27,10 +26,10 @@ class Stool(ArrangementAlongWall):
         return commands
 
     def get_length(self) -> float:
-        return float(TDWUtils.get_bounds_extents(bounds=self._record.bounds)[0]) * Stool.OFFSET_FACTOR
+        return float(self._get_root_object_extents()[0]) * Stool.OFFSET_FACTOR
 
     def _get_depth(self) -> float:
-        return float(TDWUtils.get_bounds_extents(bounds=self._record.bounds)[2]) * Stool.OFFSET_FACTOR
+        return float(self._get_root_object_extents()[2]) * Stool.OFFSET_FACTOR
 
     def _get_category(self) -> str:
         return "stool"
@@ -1,7 +1,6 @@
 from typing import List
-from tdw.tdw_utils import TDWUtils
-from tdw.controller import Controller
 from tdw.cardinal_direction import CardinalDirection
+from tdw.proc_gen.arrangements.model_extents import ModelExtents
 from tdw.proc_gen.arrangements.arrangement_along_wall import ArrangementAlongWall
 from tdw.container_data.container_tag import ContainerTag
 from tdw.container_data.box_container import BoxContainer
@@ -61,14 +60,8 @@ class Stove(ArrangementAlongWall):
                                                               x_scale=Stove.WIDTH_SCALE,
                                                               z_scale=Stove.DEPTH_SCALE)
         # Get all possible models that can be enclosed by the stove.
-        enclose_by_model_names = []
-        for category in Stove.ENCLOSED_BY["stove"]:
-            for model_name in Stove.MODEL_CATEGORIES[category]:
-                record = Controller.MODEL_LIBRARIANS["models_core.json"].get_record(model_name)
-                model_size = TDWUtils.get_bounds_extents(bounds=record.bounds)
-                model_semi_major_axis = model_size[0] if model_size[0] > model_size[2] else model_size[2]
-                if model_semi_major_axis < 0.3:
-                    enclose_by_model_names.append(model_name)
+        model_indices = ModelExtents.get_indices(categories=Stove.ENCLOSED_BY["stove"])
+        enclose_by_model_names = [ModelExtents.MODEL_NAMES[i] for i in model_indices[ModelExtents.SEMI_MAJOR_AXES[model_indices] < 0.3]]
         # Try to add a model in each shelf.
         for shape in self._record.container_shapes:
             # Use all of the "enclosed" shapes.
@@ -77,21 +70,21 @@ class Stove(ArrangementAlongWall):
                     position, size = self._get_container_shape_position_and_size(shape=shape)
                     position["x"] += self._rng.uniform(-Stove.INSIDE_POSITION_PERTURBATION, Stove.INSIDE_POSITION_PERTURBATION)
                     position["z"] += self._rng.uniform(-Stove.INSIDE_POSITION_PERTURBATION, Stove.INSIDE_POSITION_PERTURBATION)
-                    object_id = Controller.get_unique_id()
-                    commands.extend(Controller.get_add_physics_object(model_name=enclose_by_model_names[self._rng.randint(0, len(enclose_by_model_names))],
-                                                                      object_id=object_id,
-                                                                      position=position,
-                                                                      rotation={"x": 0, "y": self._rng.uniform(0, 360), "z": 0},
-                                                                      library="models_core.json"))
+                    object_id = self._get_unique_id()
+                    commands.extend(self._get_add_physics_object(model_name=enclose_by_model_names[self._rng.randint(0, len(enclose_by_model_names))],
+                                                                 object_id=object_id,
+                                                                 position=position,
+                                                                 rotation={"x": 0, "y": self._rng.uniform(0, 360), "z": 0},
+                                                                 library="models_core.json"))
                     self.object_ids.append(object_id)
         commands.extend(self._get_rotation_commands())
         return commands
 
     def get_length(self) -> float:
-        return float(TDWUtils.get_bounds_extents(bounds=self._record.bounds)[2])
+        return float(self._get_root_object_extents()[2])
 
     def _get_depth(self) -> float:
-        return float(TDWUtils.get_bounds_extents(bounds=self._record.bounds)[0]) + Stove.DEPTH_OFFSET
+        return float(self._get_root_object_extents()[0]) + Stove.DEPTH_OFFSET
 
     def _get_rotation(self) -> float:
         if self._wall == CardinalDirection.north:
@@ -2,7 +2,6 @@ from pathlib import Path
 from pkg_resources import resource_filename
 from json import loads
 from typing import List
-from tdw.tdw_utils import TDWUtils
 from tdw.cardinal_direction import CardinalDirection
 from tdw.proc_gen.arrangements.arrangement_along_wall import ArrangementAlongWall
 
@@ -25,10 +24,10 @@ class Suitcase(ArrangementAlongWall):
         return commands
 
     def get_length(self) -> float:
-        return float(TDWUtils.get_bounds_extents(bounds=self._record.bounds)[0]) + 0.1
+        return float(self._get_root_object_extents()[0]) + 0.1
 
     def _get_depth(self) -> float:
-        return float(TDWUtils.get_bounds_extents(bounds=self._record.bounds)[2]) + Suitcase._DEPTHS[self._record.name]["depth"]
+        return float(self._get_root_object_extents()[2]) + Suitcase._DEPTHS[self._record.name]["depth"]
 
     def _get_category(self) -> str:
         return "suitcase"
@@ -3,7 +3,6 @@ from typing import List, Dict, Union, Tuple
 import numpy as np
 from overrides import final
 from tdw.cardinal_direction import CardinalDirection
-from tdw.controller import Controller
 from tdw.tdw_utils import TDWUtils
 from tdw.librarian import ModelRecord
 from tdw.scene_data.interior_region import InteriorRegion
@@ -50,7 +49,7 @@ class TableAndChairs(ArrangementWithRootObject, ABC):
     def get_commands(self) -> List[dict]:
         commands = self._add_root_object()
         # Get positions for chairs.
-        extents = TDWUtils.get_bounds_extents(bounds=self._record.bounds)
+        extents = self._get_root_object_extents()
         area = extents[0] * extents[2]
         # Allow only two sides.
         if area < TableAndChairs.AREA_FOUR_CHAIRS:
@@ -64,7 +63,7 @@ class TableAndChairs(ArrangementWithRootObject, ABC):
         # Get a random chair model name.
         chairs = TableAndChairs.MODEL_CATEGORIES[self._get_chair_category()]
         chair_model_name: str = chairs[self._rng.randint(0, len(chairs))]
-        chair_record = Controller.MODEL_LIBRARIANS["models_core.json"].get_record(chair_model_name)
+        chair_record = TableAndChairs._get_record(model_name=chair_model_name)
         tc = np.array([self._position["x"], self._position["z"]])
         for chair_direction in chair_directions:
             # Check if we're too close to a used wall.
@@ -90,12 +89,12 @@ class TableAndChairs(ArrangementWithRootObject, ABC):
         for chair_bound_point in self._bound_point_positions:
             chair_position = self._get_chair_position(chair_record=chair_record,
                                                       table_bound_point=chair_bound_point[0])
-            object_id = Controller.get_unique_id()
+            object_id = self._get_unique_id()
             # Add the chair.
-            commands.extend(Controller.get_add_physics_object(model_name=chair_model_name,
-                                                              position=TDWUtils.array_to_vector3(chair_position),
-                                                              object_id=object_id,
-                                                              library="models_core.json"))
+            commands.extend(self._get_add_physics_object(model_name=chair_model_name,
+                                                         position=TDWUtils.array_to_vector3(chair_position),
+                                                         object_id=object_id,
+                                                         library="models_core.json"))
             self.object_ids.append(object_id)
             if rotation_range == 0:
                 rotation = 0
@@ -1,7 +1,5 @@
 from typing import List, Dict, Union
 import numpy as np
-from tdw.controller import Controller
-from tdw.tdw_utils import TDWUtils
 from tdw.proc_gen.arrangements.plate import Plate
 from tdw.proc_gen.arrangements.cup_and_coaster import CupAndCoaster
 
@@ -49,7 +47,7 @@ class TableSetting(Plate):
 
     def get_commands(self) -> List[dict]:
         commands = super().get_commands()
-        extents = TDWUtils.get_bounds_extents(bounds=self._record.bounds)
+        extents = self._get_root_object_extents()
         fork_x = self._position["x"] - (extents[0] / 2 + self._rng.uniform(TableSetting.CUTLERY_POSITION_PERTURBATION,
                                                                            TableSetting.CUTLERY_POSITION_PERTURBATION))
         knife_x = self._position["x"] + extents[0] / 2 + self._rng.uniform(TableSetting.CUTLERY_POSITION_PERTURBATION,
@@ -58,20 +56,20 @@ class TableSetting(Plate):
                                               TableSetting.CUTLERY_POSITION_PERTURBATION)
         for category, x in zip(["fork", "knife", "spoon"], [fork_x, knife_x, spoon_x]):
             model_name = TableSetting.MODEL_CATEGORIES[category][self._rng.randint(0, len(TableSetting.MODEL_CATEGORIES[category]))]
-            object_id = Controller.get_unique_id()
+            object_id = self._get_unique_id()
             self.object_ids.append(object_id)
-            commands.extend(Controller.get_add_physics_object(model_name=model_name,
-                                                              object_id=object_id,
-                                                              position={"x": x,
-                                                                        "y": self._position["y"],
-                                                                        "z": self._position["z"] + self._rng.uniform(TableSetting.CUTLERY_POSITION_PERTURBATION,
-                                                                                                                     TableSetting.CUTLERY_POSITION_PERTURBATION)},
-                                                              rotation={"x": 0,
-                                                                        "y": float(self._rng.uniform(
-                                                                            -TableSetting.CUTLERY_ROTATION_PERTURBATION,
-                                                                            TableSetting.CUTLERY_ROTATION_PERTURBATION)),
-                                                                        "z": 0},
-                                                              library="models_core.json"))
+            commands.extend(self._get_add_physics_object(model_name=model_name,
+                                                         object_id=object_id,
+                                                         position={"x": x,
+                                                                   "y": self._position["y"],
+                                                                   "z": self._position["z"] + self._rng.uniform(TableSetting.CUTLERY_POSITION_PERTURBATION,
+                                                                                                                TableSetting.CUTLERY_POSITION_PERTURBATION)},
+                                                         rotation={"x": 0,
+                                                                   "y": float(self._rng.uniform(
+                                                                       -TableSetting.CUTLERY_ROTATION_PERTURBATION,
+                                                                       TableSetting.CUTLERY_ROTATION_PERTURBATION)),
+                                                                   "z": 0},
+                                                         library="models_core.json"))
         # Add a cup.
         if self._rng.random() < TableSetting.PROBABILITY_CUP_AND_COASTER:
             cup_and_coaster = CupAndCoaster(position={"x": spoon_x + extents[0] * 0.45 + self._rng.uniform(
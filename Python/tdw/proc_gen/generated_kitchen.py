@@ -0,0 +1,108 @@
+import gzip
+from json import loads, dumps
+from pathlib import Path
+from typing import List, Dict, Optional
+from tdw.proc_gen.arrangements.cabinetry.cabinetry_type import CabinetryType
+from tdw.type_aliases import PATH
+
+
+class GeneratedKitchen:
+    """
+    A kitchen that was generated by [`ProcGenKitchen`](../add_ons/proc_gen_kitchen.md) ahead of time, for example by `ProcGenKitchen.generate_batch()`.
+
+    This stores the commands that will create the kitchen plus metadata for each object in the kitchen. It can be written to disk, read back, and loaded into a `ProcGenKitchen` add-on via `proc_gen_kitchen.load(kitchen)`.
+    """
+
+    def __init__(self, seed: int, scene_name: Optional[str], room_index: int, cabinetry_type: CabinetryType,
+                 commands: List[dict]):
+        """
+        :param seed: The random seed that was used to generate the kitchen.
+        :param scene_name: The name of the scene. Can be None if the kitchen was generated in an existing [`Room`](../scene_data/room.md).
+        :param room_index: The index of the room in `SceneRecord.rooms`.
+        :param cabinetry_type: The [`CabinetryType`](arrangements/cabinetry/cabinetry_type.md).
+        :param commands: The commands that will create the kitchen.
+        """
+
+        """:field
+        The random seed that was used to generate the kitchen.
+        """
+        self.seed: int = seed
+        """:field
+        The name of the scene. Can be None if the kitchen was generated in an existing [`Room`](../scene_data/room.md).
+        """
+        self.scene_name: Optional[str] = scene_name
+        """:field
+        The index of the room in `SceneRecord.rooms`.
+        """
+        self.room_index: int = room_index
+        """:field
+        The [`CabinetryType`](arrangements/cabinetry/cabinetry_type.md).
+        """
+        self.cabinetry_type: CabinetryType = cabinetry_type
+        """:field
+        The commands that will create the kitchen.
+        """
+        self.commands: List[dict] = commands
+        """:field
+        The IDs of each object in the kitchen, in the order that they are added.
+        """
+        self.object_ids: List[int] = list()
+        """:field
+        The model name of each object. Key = The object ID.
+        """
+        self.model_names: Dict[int, str] = dict()
+        """:field
+        The category of each object. Key = The object ID.
+        """
+        self.categories: Dict[int, str] = dict()
+        """:field
+        The initial position of each object. Key = The object ID.
+        """
+        self.positions: Dict[int, Dict[str, float]] = dict()
+        for command in self.commands:
+            if command["$type"] == "add_object":
+                object_id = command["id"]
+                self.object_ids.append(object_id)
+                self.model_names[object_id] = command["name"]
+                self.categories[object_id] = command["category"]
+                self.positions[object_id] = command["position"]
+
+    def write(self, path: PATH) -> None:
+        """
+        Write the kitchen to disk as a .json file.
+
+        :param path: The path to the .json file. If the suffix is `.gz`, the file will be gzip-compressed.
+        """
+
+        if isinstance(path, str):
+            path = Path(path)
+        if not path.parent.exists():
+            path.parent.mkdir(parents=True)
+        data = dumps({"seed": self.seed,
+                      "scene_name": self.scene_name,
+                      "room_index": self.room_index,
+                      "cabinetry_type": self.cabinetry_type.name,
+                      "commands": self.commands}).encode("utf-8")
+        if path.suffix == ".gz":
+            data = gzip.compress(data)
+        path.write_bytes(data)
+
+    @staticmethod
+    def read(path: PATH) -> "GeneratedKitchen":
+        """
+        :param path: The path to a .json file written by `GeneratedKitchen.write(path)`. If the suffix is `.gz`, the file is assumed to be gzip-compressed.
+
+        :return: The `GeneratedKitchen`.
+        """
+
+        if isinstance(path, str):
+            path = Path(path)
+        data = path.read_bytes()
+        if path.suffix == ".gz":
+            data = gzip.decompress(data)
+        data = loads(data)
+        return GeneratedKitchen(seed=data["seed"],
+                                scene_name=data["scene_name"],
+                                room_index=data["room_index"],
+                                cabinetry_type=CabinetryType[data["cabinetry_type"]],
+                                commands=data["commands"])
@@ -0,0 +1,228 @@
+from hashlib import sha256
+from os import utime
+from pathlib import Path
+from pkg_resources import resource_filename
+from typing import List, Union, Optional
+from tdw.version import __version__
+from tdw.controller import Controller
+from tdw.librarian import ModelLibrarian, SceneLibrarian, SceneRecord
+from tdw.scene_data.room import Room
+from tdw.proc_gen.arrangements.cabinetry.cabinetry_type import CabinetryType
+from tdw.proc_gen.generated_kitchen import GeneratedKitchen
+from tdw.type_aliases import PATH
+
+
+class KitchenCache:
+    """
+    An on-disk cache of kitchens generated by [`ProcGenKitchen`](../add_ons/proc_gen_kitchen.md).
+
+    `ProcGenKitchen.create()` is deterministic for a given random seed, so re-running an experiment regenerates identical kitchens. The cache stores each kitchen as a gzip-compressed file whose name is a hash of everything that determines the kitchen: the scene (its name and room geometry), the room index, the cabinetry type, the seed, the version of TDW, and the contents of the procedural generation data files and model libraries. If any of these change, the kitchen is regenerated.
+
+    When the total size of the cache exceeds `max_size`, the least recently used kitchens are deleted.
+
+    ```python
+    from tdw.controller import Controller
+    from tdw.add_ons.proc_gen_kitchen import ProcGenKitchen
+    from tdw.proc_gen.kitchen_cache import KitchenCache
+
+    c = Controller()
+    proc_gen_kitchen = ProcGenKitchen(cache=KitchenCache())
+    proc_gen_kitchen.create(scene="mm_kitchen_2a", rng=0)
+    c.add_ons.append(proc_gen_kitchen)
+    c.communicate([])
+    ```
+
+    To warm up the cache from the command line:
+
+    ```
+    python3 -m tdw.proc_gen.kitchen_cache --scene mm_kitchen_2a --start 0 --end 1000
+    ```
+    """
+
+    """:class_var
+    The default cache directory.
+    """
+    DEFAULT_DIRECTORY: Path = Path.home().joinpath("tdw_kitchen_cache")
+    # A hash of the version of TDW and the data files. This is set the first time a key is requested.
+    _DATA_HASH: Optional[str] = None
+
+    def __init__(self, directory: PATH = None, max_size: int = 1073741824):
+        """
+        :param directory: The cache directory. If None, defaults to `KitchenCache.DEFAULT_DIRECTORY`.
+        :param max_size: The maximum total size of the cache in bytes. If the cache is larger than this, the least recently used kitchens are deleted.
+        """
+
+        if directory is None:
+            """:field
+            The cache directory.
+            """
+            self.directory: Path = KitchenCache.DEFAULT_DIRECTORY
+        elif isinstance(directory, str):
+            self.directory = Path(directory)
+        else:
+            self.directory = directory
+        if not self.directory.exists():
+            self.directory.mkdir(parents=True)
+        """:field
+        The maximum total size of the cache in bytes.
+        """
+        self.max_size: int = max_size
+
+    def get(self, scene: Union[str, SceneRecord, Room, List[Union[str, SceneRecord]]], room_index: int,
+            cabinetry_type: Optional[CabinetryType], seed: int) -> Optional[GeneratedKitchen]:
+        """
+        :param scene: The `scene` parameter of `ProcGenKitchen.create()`.
+        :param room_index: The `room_index` parameter of `ProcGenKitchen.create()`.
+        :param cabinetry_type: The `cabinetry_type` parameter of `ProcGenKitchen.create()`.
+        :param seed: The random seed.
+
+        :return: The cached [`GeneratedKitchen`](generated_kitchen.md), or None if it isn't in the cache.
+        """
+
+        path = self._get_path(scene=scene, room_index=room_index, cabinetry_type=cabinetry_type, seed=seed)
+        if not path.exists():
+            return None
+        # Mark the kitchen as recently used.
+        utime(str(path.resolve()))
+        return GeneratedKitchen.read(path)
+
+    def put(self, scene: Union[str, SceneRecord, Room, List[Union[str, SceneRecord]]], room_index: int,
+            cabinetry_type: Optional[CabinetryType], kitchen: GeneratedKitchen) -> None:
+        """
+        Add a kitchen to the cache. Then, if the cache is too large, delete the least recently used kitchens.
+
+        :param scene: The `scene` parameter of `ProcGenKitchen.create()`.
+        :param room_index: The `room_index` parameter of `ProcGenKitchen.create()`.
+        :param cabinetry_type: The `cabinetry_type` parameter of `ProcGenKitchen.create()`.
+        :param kitchen: The [`GeneratedKitchen`](generated_kitchen.md). Its seed is part of the key.
+        """
+
+        path = self._get_path(scene=scene, room_index=room_index, cabinetry_type=cabinetry_type, seed=kitchen.seed)
+        kitchen.write(path=path)
+        self._evict()
+
+    def get_size(self) -> int:
+        """
+        :return: The total size of the cache in bytes.
+        """
+
+        return sum([p.stat().st_size for p in self.directory.glob("*.json.gz")])
+
+    def clear(self) -> None:
+        """
+        Delete every kitchen in the cache.
+        """
+
+        for path in self.directory.glob("*.json.gz"):
+            path.unlink()
+
+    def _evict(self) -> None:
+        """
+        Delete the least recently used kitchens until the cache is no larger than `self.max_size`.
+        """
+
+        paths = [(p.stat(), p) for p in self.directory.glob("*.json.gz")]
+        size = sum([p[0].st_size for p in paths])
+        if size <= self.max_size:
+            return
+        paths.sort(key=lambda p: p[0].st_mtime)
+        for stat, path in paths:
+            if size <= self.max_size:
+                break
+            path.unlink()
+            size -= stat.st_size
+
+    def _get_path(self, scene: Union[str, SceneRecord, Room, List[Union[str, SceneRecord]]], room_index: int,
+                  cabinetry_type: Optional[CabinetryType], seed: int) -> Path:
+        """
+        :param scene: The `scene` parameter of `ProcGenKitchen.create()`.
+        :param room_index: The `room_index` parameter of `ProcGenKitchen.create()`.
+        :param cabinetry_type: The `cabinetry_type` parameter of `ProcGenKitchen.create()`.
+        :param seed: The random seed.
+
+        :return: The path to the cached kitchen.
+        """
+
+        h = sha256()
+        h.update(KitchenCache._get_data_hash().encode("utf-8"))
+        h.update(KitchenCache._get_scene_key(scene=scene).encode("utf-8"))
+        h.update(f"{room_index};{cabinetry_type.name if cabinetry_type is not None else None};{seed}".encode("utf-8"))
+        return self.directory.joinpath(h.hexdigest() + ".json.gz")
+
+    @staticmethod
+    def _get_scene_key(scene: Union[str, SceneRecord, Room, List[Union[str, SceneRecord]], None]) -> str:
+        """
+        :param scene: The `scene` parameter of `ProcGenKitchen.create()`.
+
+        :return: A string that identifies the scene: the name of the scene and the geometry of its rooms.
+        """
+
+        if scene is None:
+            return "None"
+        elif isinstance(scene, str):
+            if "scenes.json" not in Controller.SCENE_LIBRARIANS:
+                Controller.SCENE_LIBRARIANS["scenes.json"] = SceneLibrarian()
+            return KitchenCache._get_scene_key(scene=Controller.SCENE_LIBRARIANS["scenes.json"].get_record(scene))
+        elif isinstance(scene, SceneRecord):
+            return scene.name + "[" + ",".join([KitchenCache._get_scene_key(room) for room in scene.rooms]) + "]"
+        elif isinstance(scene, Room):
+            return ",".join([f"{r.center}{r.bounds}{r.non_continuous_walls}{r.walls_with_windows}"
+                             for r in [scene.main_region] + scene.alcoves])
+        elif isinstance(scene, list):
+            return "[" + ";".join([KitchenCache._get_scene_key(s) for s in scene]) + "]"
+        else:
+            raise Exception(scene)
+
+    @staticmethod
+    def _get_data_hash() -> str:
+        """
+        :return: A hash of the version of TDW and the data files that determine procedural generation.
+        """
+
+        if KitchenCache._DATA_HASH is None:
+            h = sha256()
+            h.update(__version__.encode("utf-8"))
+            paths: List[Path] = list()
+            for directory in ["proc_gen/arrangements/data", "proc_gen/arrangements/cabinetry",
+                              "add_ons/proc_gen_kitchen_data"]:
+                paths.extend(sorted(Path(resource_filename("tdw", directory)).glob("*.json")))
+            for library in ["models_core.json", "models_special.json"]:
+                if library not in Controller.MODEL_LIBRARIANS:
+                    Controller.MODEL_LIBRARIANS[library] = ModelLibrarian(library)
+                paths.append(Path(Controller.MODEL_LIBRARIANS[library].library))
+            for path in paths:
+                h.update(path.name.encode("utf-8"))
+                h.update(path.read_bytes())
+            KitchenCache._DATA_HASH = h.hexdigest()
+        return KitchenCache._DATA_HASH
+
+
+if __name__ == "__main__":
+    from argparse import ArgumentParser
+    from tdw.add_ons.proc_gen_kitchen import ProcGenKitchen
+
+    parser = ArgumentParser(description="Warm up the kitchen cache for a range of seeds.")
+    parser.add_argument("--scene", type=str, nargs="+", default=None,
+                        help="The name of the scene. If there is more than one, a scene is randomly selected per seed. If not set, a random scene from ProcGenKitchen.SCENE_NAMES is selected per seed.")
+    parser.add_argument("--room_index", type=int, default=0, help="The index of the room.")
+    parser.add_argument("--cabinetry_type", type=str, default=None, choices=[c.name for c in CabinetryType],
+                        help="The cabinetry type. If not set, it is chosen randomly per seed.")
+    parser.add_argument("--start", type=int, default=0, help="The first seed.")
+    parser.add_argument("--end", type=int, default=100, help="The last seed (exclusive).")
+    parser.add_argument("--directory", type=str, default=None, help="The cache directory.")
+    parser.add_argument("--max_size", type=int, default=1073741824, help="The maximum size of the cache in bytes.")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="The number of worker processes. If not set, this is the number of CPUs.")
+    args = parser.parse_args()
+    if args.scene is None:
+        scenes = None
+    elif len(args.scene) == 1:
+        scenes = args.scene[0]
+    else:
+        scenes = args.scene
+    ProcGenKitchen.generate_batch(scenes=scenes,
+                                  seeds=list(range(args.start, args.end)),
+                                  room_index=args.room_index,
+                                  cabinetry_type=CabinetryType[args.cabinetry_type] if args.cabinetry_type is not None else None,
+                                  workers=args.workers,
+                                  cache=KitchenCache(directory=args.directory, max_size=args.max_size))
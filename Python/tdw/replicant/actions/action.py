@@ -6,6 +6,7 @@ from tdw.output_data import OutputData, Transforms, Framerate, Bounds
 from tdw.replicant.replicant_static import ReplicantStatic
 from tdw.replicant.replicant_dynamic import ReplicantDynamic
 from tdw.replicant.action_status import ActionStatus
+from tdw.replicant.actions.action_summary import ActionSummary
 from tdw.replicant.image_frequency import ImageFrequency
 
 
@@ -105,6 +106,13 @@ class Action(ABC):
                               "frequency": "once"}])
         return commands
 
+    def get_summary(self) -> ActionSummary:
+        """
+        :return: An [`ActionSummary`](action_summary.md) of this action: its type, status, target, and the parameters that determine whether the next action is the "same" action. This is much cheaper than copying the action.
+        """
+
+        return ActionSummary(action_type=type(self), status=self.status)
+
     @staticmethod
     def _get_object_position(object_id: int, resp: List[bytes]) -> np.ndarray:
         """
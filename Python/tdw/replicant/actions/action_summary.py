@@ -0,0 +1,62 @@
+from typing import Dict, Any
+import numpy as np
+from tdw.replicant.action_status import ActionStatus
+
+
+class ActionSummary:
+    """
+    A summary of an [`Action`](action.md) that ended: its type, its status, its target (if any), and the parameters that determine whether the next action is the "same" action (see `CollisionDetection.previous_was_same`).
+
+    Unlike the action itself, a summary doesn't reference output data, images, or IK plans, so it's cheap to create at the end of every action.
+    """
+
+    def __init__(self, action_type: type, status: ActionStatus, target: Any = None, parameters: Dict[str, Any] = None):
+        """
+        :param action_type: The type of the action.
+        :param status: The [`ActionStatus`](../action_status.md) of the action when it ended.
+        :param target: The target of the action, if any. This should be a copy of the action's target.
+        :param parameters: The parameters that determine whether the next action is the "same" action. Key = The name of the parameter.
+        """
+
+        """:field
+        The type of the action.
+        """
+        self.action_type: type = action_type
+        """:field
+        The [`ActionStatus`](../action_status.md) of the action when it ended.
+        """
+        self.status: ActionStatus = status
+        """:field
+        The target of the action, if any.
+        """
+        self.target: Any = target
+        """:field
+        The parameters that determine whether the next action is the "same" action. Key = The name of the parameter.
+        """
+        self.parameters: Dict[str, Any] = dict() if parameters is None else parameters
+
+    def is_type(self, action_type: type) -> bool:
+        """
+        :param action_type: A type of action.
+
+        :return: True if the action is of this type or a subclass of this type.
+        """
+
+        return issubclass(self.action_type, action_type)
+
+    @staticmethod
+    def copy_target(target: Any) -> Any:
+        """
+        :param target: A target: an object ID, a position as a dictionary or numpy array, or a list of targets.
+
+        :return: A copy of the target.
+        """
+
+        if isinstance(target, dict):
+            return dict(target)
+        elif isinstance(target, np.ndarray):
+            return np.copy(target)
+        elif isinstance(target, list):
+            return [ActionSummary.copy_target(t) for t in target]
+        else:
+            return target
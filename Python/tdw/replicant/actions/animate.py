@@ -1,5 +1,6 @@
 from typing import List, Optional
 from tdw.replicant.actions.action import Action
+from tdw.replicant.actions.action_summary import ActionSummary
 from tdw.replicant.action_status import ActionStatus
 from tdw.replicant.collision_detection import CollisionDetection
 from tdw.replicant.replicant_dynamic import ReplicantDynamic
@@ -22,13 +23,13 @@ class Animate(Action):
     """
 
     def __init__(self, animation: str, collision_detection: CollisionDetection, forward: bool, library: str,
-                 previous: Optional[Action], ik_body_parts: List[ReplicantBodyPart], loop: bool):
+                 previous: Optional[ActionSummary], ik_body_parts: List[ReplicantBodyPart], loop: bool):
         """
         :param animation: The name of the animation.
         :param collision_detection: The [`CollisionDetection`](../collision_detection.md) rules.
         :param forward: If True, play the animation forwards. If False, play the animation backwards.
         :param library: The name of the animation's library.
-        :param previous: The previous action. Can be None.
+        :param previous: The [`ActionSummary`](action_summary.md) of the previous action. Can be None.
         :param ik_body_parts: Maintain the IK positions of these body parts.
         :param loop: If True, the animation will continuously loop and the action will continue until interrupted.
         """
@@ -46,8 +47,8 @@ class Animate(Action):
         """
         self.collision_detection: CollisionDetection = collision_detection
         # Don't try to play the same animation twice if the first one ended in a collision.
-        if self.collision_detection.previous_was_same and previous is not None and isinstance(previous, Animate) and \
-                previous.status == ActionStatus.collision and previous.record.name == self.record.name:
+        if self.collision_detection.previous_was_same and previous is not None and previous.is_type(Animate) and \
+                previous.status == ActionStatus.collision and previous.parameters["animation"] == self.record.name:
             self.status = ActionStatus.collision
         """:field
         If True, play the animation forwards. If False, play the animation backwards.
@@ -60,6 +61,11 @@ class Animate(Action):
         # Maintain the IK positions of these body parts.
         self._ik_body_parts: List[str] = [b.name for b in ik_body_parts]
 
+    def get_summary(self) -> ActionSummary:
+        summary = super().get_summary()
+        summary.parameters["animation"] = self.record.name
+        return summary
+
     def get_initialization_commands(self, resp: List[bytes], static: ReplicantStatic, dynamic: ReplicantDynamic,
                                     image_frequency: ImageFrequency) -> List[dict]:
         commands = super().get_initialization_commands(resp=resp, static=static, dynamic=dynamic,
@@ -1,7 +1,7 @@
 from typing import List, Optional
 from abc import ABC
 from tdw.replicant.action_status import ActionStatus
-from tdw.replicant.actions.action import Action
+from tdw.replicant.actions.action_summary import ActionSummary
 from tdw.replicant.actions.ik_motion import IkMotion
 from tdw.replicant.replicant_static import ReplicantStatic
 from tdw.replicant.replicant_dynamic import ReplicantDynamic
@@ -21,12 +21,12 @@ class ArmMotion(IkMotion, ABC):
     """
 
     def __init__(self, arms: List[Arm], dynamic: ReplicantDynamic, collision_detection: CollisionDetection,
-                 previous: Optional[Action], duration: float, scale_duration: bool):
+                 previous: Optional[ActionSummary], duration: float, scale_duration: bool):
         """
         :param arms: A list of [`Arm`](../arm.md) values that will reach for the `target`. Example: `[Arm.left, Arm.right]`.
         :param dynamic: The [`ReplicantDynamic`](../replicant_dynamic.md) data that changes per `communicate()` call.
         :param collision_detection: The [`CollisionDetection`](../collision_detection.md) rules.
-        :param previous: The previous action. Can be None.
+        :param previous: The [`ActionSummary`](action_summary.md) of the previous action. Can be None.
         :param duration: The duration of the motion in seconds.
         :param scale_duration: If True, `duration` will be multiplied by `framerate / 60)`, ensuring smoother motions at faster-than-life simulation speeds.
         """
@@ -48,11 +48,16 @@ class ArmMotion(IkMotion, ABC):
         """
         self.collisions: List[Arm] = list()
         # Immediately end the action if the previous action was the same motion and it ended with a collision.
-        if self.collision_detection.previous_was_same and previous is not None and isinstance(previous, ArmMotion):
+        if self.collision_detection.previous_was_same and previous is not None and previous.is_type(ArmMotion):
             for arm in self.arms:
-                if arm in previous.collisions:
+                if arm in previous.parameters["collisions"]:
                     self.status = ActionStatus.collision
 
+    def get_summary(self) -> ActionSummary:
+        summary = super().get_summary()
+        summary.parameters["collisions"] = self.collisions[:]
+        return summary
+
     def get_ongoing_commands(self, resp: List[bytes], static: ReplicantStatic, dynamic: ReplicantDynamic) -> List[dict]:
         if len(dynamic.get_collision_enters(collision_detection=self.collision_detection)) > 0:
             self.status = ActionStatus.collision
@@ -1,5 +1,6 @@
 from typing import List, Optional
 from tdw.replicant.actions.action import Action
+from tdw.replicant.actions.action_summary import ActionSummary
 from tdw.replicant.action_status import ActionStatus
 from tdw.replicant.replicant_static import ReplicantStatic
 from tdw.replicant.replicant_dynamic import ReplicantDynamic
@@ -63,6 +64,11 @@ class Grasp(Action):
         if self.arm in dynamic.held_objects:
             self.status = ActionStatus.already_holding
 
+    def get_summary(self) -> ActionSummary:
+        summary = super().get_summary()
+        summary.target = self.target
+        return summary
+
     def get_initialization_commands(self, resp: List[bytes], static: ReplicantStatic, dynamic: ReplicantDynamic,
                                     image_frequency: ImageFrequency) -> List[dict]:
         commands = super().get_initialization_commands(resp=resp, static=static, dynamic=dynamic,
@@ -5,6 +5,7 @@ from tdw.type_aliases import TARGET
 from tdw.replicant.replicant_static import ReplicantStatic
 from tdw.replicant.replicant_dynamic import ReplicantDynamic
 from tdw.replicant.actions.head_motion import HeadMotion
+from tdw.replicant.actions.action_summary import ActionSummary
 from tdw.replicant.image_frequency import ImageFrequency
 
 
@@ -28,6 +29,11 @@ class LookAt(HeadMotion):
         """
         self.target: TARGET = target
 
+    def get_summary(self) -> ActionSummary:
+        summary = super().get_summary()
+        summary.target = ActionSummary.copy_target(self.target)
+        return summary
+
     def get_initialization_commands(self, resp: List[bytes], static: ReplicantStatic, dynamic: ReplicantDynamic,
                                     image_frequency: ImageFrequency) -> List[dict]:
         commands = super().get_initialization_commands(resp=resp, static=static, dynamic=dynamic,
@@ -3,6 +3,7 @@ import numpy as np
 from tdw.tdw_utils import TDWUtils
 from tdw.replicant.actions.animate import Animate
 from tdw.replicant.actions.action import Action
+from tdw.replicant.actions.action_summary import ActionSummary
 from tdw.replicant.action_status import ActionStatus
 from tdw.replicant.replicant_static import ReplicantStatic
 from tdw.replicant.replicant_dynamic import ReplicantDynamic
@@ -37,7 +38,7 @@ class MoveBy(Animate):
                                   ReplicantBodyPart.upperarm_l, ReplicantBodyPart.upperarm_r]
 
     def __init__(self, distance: float, dynamic: ReplicantDynamic, collision_detection: CollisionDetection,
-                 previous: Optional[Action], reset_arms: bool, reset_arms_duration: float,
+                 previous: Optional[ActionSummary], reset_arms: bool, reset_arms_duration: float,
                  scale_reset_arms_duration: bool, arrived_at: float, collision_avoidance_distance: float,
                  collision_avoidance_half_extents: Dict[str, float], collision_avoidance_y: float,
                  animation: str = "walking_2", library: str = "humanoid_animations.json"):
@@ -45,7 +46,7 @@ class MoveBy(Animate):
         :param distance: The target distance. If less than 0, the Replicant will walk backwards.
         :param dynamic: The [`ReplicantDynamic`](../replicant_dynamic.md) data that changes per `communicate()` call.
         :param collision_detection: The [`CollisionDetection`](../collision_detection.md) rules.
-        :param previous: The previous action, if any.
+        :param previous: The [`ActionSummary`](action_summary.md) of the previous action, if any.
         :param reset_arms: If True, reset the arms to their neutral positions while beginning the walk cycle.
         :param reset_arms_duration: The speed at which the arms are reset in seconds.
         :param scale_reset_arms_duration: If True, `reset_arms_duration` will be multiplied by `framerate / 60)`, ensuring smoother motions at faster-than-life simulation speeds.
@@ -98,8 +99,8 @@ class MoveBy(Animate):
                          loop=True)
         self._destination: np.ndarray = dynamic.transform.position + (dynamic.transform.forward * distance)
         # Don't try to walk in the same direction twice.
-        if self.collision_detection.previous_was_same and previous is not None and isinstance(previous, MoveBy) and \
-                previous.status == ActionStatus.collision and np.sign(previous.distance) == np.sign(self.distance):
+        if self.collision_detection.previous_was_same and previous is not None and previous.is_type(MoveBy) and \
+                previous.status == ActionStatus.collision and np.sign(previous.parameters["distance"]) == np.sign(self.distance):
             self.status = ActionStatus.collision
         # Ignore collision detection for held items.
         self.__held_objects: List[int] = [v for v in dynamic.held_objects.values() if v not in self.collision_detection.exclude_objects]
@@ -107,6 +108,11 @@ class MoveBy(Animate):
         # The initial position. This is used to determine the distance traversed. This is set in `get_initialization_commands()`.
         self._initial_position: np.ndarray = np.zeros(shape=3)
 
+    def get_summary(self) -> ActionSummary:
+        summary = super().get_summary()
+        summary.parameters["distance"] = self.distance
+        return summary
+
     def get_initialization_commands(self, resp: List[bytes], static: ReplicantStatic, dynamic: ReplicantDynamic,
                                     image_frequency: ImageFrequency) -> List[dict]:
         commands = super().get_initialization_commands(resp=resp, static=static, dynamic=dynamic,
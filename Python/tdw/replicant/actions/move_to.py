@@ -4,6 +4,7 @@ from tdw.tdw_utils import TDWUtils
 from tdw.type_aliases import TARGET
 from tdw.output_data import OutputData, Bounds
 from tdw.replicant.actions.action import Action
+from tdw.replicant.actions.action_summary import ActionSummary
 from tdw.replicant.actions.turn_to import TurnTo
 from tdw.replicant.actions.move_by import MoveBy
 from tdw.replicant.replicant_static import ReplicantStatic
@@ -30,7 +31,7 @@ class MoveTo(Action):
       - Otherwise, the action ends in failure.
     """
 
-    def __init__(self, target: TARGET, collision_detection: CollisionDetection, previous: Optional[Action],
+    def __init__(self, target: TARGET, collision_detection: CollisionDetection, previous: Optional[ActionSummary],
                  reset_arms: bool, reset_arms_duration: float, scale_reset_arms_duration: bool, arrived_at: float,
                  bounds_position: str, collision_avoidance_distance: float,
                  collision_avoidance_half_extents: Dict[str, float], collision_avoidance_y: float,
@@ -38,7 +39,7 @@ class MoveTo(Action):
         """
         :param target: The target. If int: An object ID. If dict: A position as an x, y, z dictionary. If numpy array: A position as an [x, y, z] numpy array.
         :param collision_detection: The [`CollisionDetection`](../collision_detection.md) rules.
-        :param previous: The previous action, if any.
+        :param previous: The [`ActionSummary`](action_summary.md) of the previous action, if any.
         :param reset_arms: If True, reset the arms to their neutral positions while beginning the walk cycle.
         :param reset_arms_duration: The speed at which the arms are reset in seconds.
         :param reset_arms_duration: The speed at which the arms are reset in seconds.
@@ -102,9 +103,14 @@ class MoveTo(Action):
         self._turning: bool = True
         self._image_frequency: ImageFrequency = ImageFrequency.once
         self._move_by: Optional[MoveBy] = None
-        self._previous_action: Optional[Action] = previous
+        self._previous_action: Optional[ActionSummary] = previous
         super().__init__()
 
+    def get_summary(self) -> ActionSummary:
+        summary = super().get_summary()
+        summary.target = ActionSummary.copy_target(self.target)
+        return summary
+
     def get_initialization_commands(self, resp: List[bytes], static: ReplicantStatic, dynamic: ReplicantDynamic,
                                     image_frequency: ImageFrequency) -> List[dict]:
         # Remember the image frequency for both the turn and move sub-actions.
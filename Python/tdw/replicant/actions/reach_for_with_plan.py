@@ -4,6 +4,7 @@ from tdw.replicant.replicant_static import ReplicantStatic
 from tdw.replicant.replicant_dynamic import ReplicantDynamic
 from tdw.replicant.image_frequency import ImageFrequency
 from tdw.replicant.actions.action import Action
+from tdw.replicant.actions.action_summary import ActionSummary
 from tdw.replicant.action_status import ActionStatus
 from tdw.replicant.actions.reach_for import ReachFor
 from tdw.replicant.collision_detection import CollisionDetection
@@ -43,7 +44,7 @@ class ReachForWithPlan(Action):
 
     def __init__(self, plan: IkPlanType, targets: List[TARGET], absolute: bool, arrived_at: float, max_distance: float,
                  arms: List[Arm], dynamic: ReplicantDynamic, collision_detection: CollisionDetection,
-                 previous: Optional[Action], duration: float, scale_duration: bool, from_held: bool, held_point: str):
+                 previous: Optional[ActionSummary], duration: float, scale_duration: bool, from_held: bool, held_point: str):
         """
         :param plan: An [`IkPlanType`](../ik_plans/ik_plan_type.md) that will define the [`IkPlan`](../ik_plans/ik_plan.md) this action will use.
         :param targets: The targets per arm. If int: An object ID. If dict: A position as an x, y, z dictionary. If numpy array: A position as an [x, y, z] numpy array.
@@ -53,7 +54,7 @@ class ReachForWithPlan(Action):
         :param arms: The [`Arm`](../arm.md)(s) that will reach for each target.
         :param dynamic: The [`ReplicantDynamic`](../replicant_dynamic.md) data that changes per `communicate()` call.
         :param collision_detection: The [`CollisionDetection`](../collision_detection.md) rules.
-        :param previous: The previous action. Can be None.
+        :param previous: The [`ActionSummary`](action_summary.md) of the previous action. Can be None.
         :param duration: The total duration of the motion in seconds. Each [`ReachFor`](../actions/reach_for.md) action is a fraction of this. For example, if there are 2 [`ReachFor`](../actions/reach_for.md) actions, then the duration of each of them is `duration / 2`.
         :param scale_duration: If True, `duration` will be multiplied by `framerate / 60)`, ensuring smoother motions at faster-than-life simulation speeds.
         :param from_held: If False, the Replicant will try to move its hand to the `target`. If True, the Replicant will try to move its held object to the `target`. This is ignored if the hand isn't holding an object.
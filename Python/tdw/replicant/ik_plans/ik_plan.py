@@ -6,6 +6,7 @@ from tdw.replicant.replicant_static import ReplicantStatic
 from tdw.replicant.replicant_dynamic import ReplicantDynamic
 from tdw.replicant.actions.arm_motion import ArmMotion
 from tdw.replicant.actions.action import Action
+from tdw.replicant.actions.action_summary import ActionSummary
 from tdw.replicant.action_status import ActionStatus
 from tdw.replicant.actions.reach_for import ReachFor
 from tdw.replicant.collision_detection import CollisionDetection
@@ -24,7 +25,7 @@ class IkPlan(ABC):
     """
 
     def __init__(self, targets: List[TARGET], absolute: bool, arrived_at: float, max_distance: float, arms: List[Arm],
-                 dynamic: ReplicantDynamic, collision_detection: CollisionDetection, previous: Optional[Action],
+                 dynamic: ReplicantDynamic, collision_detection: CollisionDetection, previous: Optional[ActionSummary],
                  duration: float, scale_duration: bool, from_held: bool, held_point: str):
         """
         :param targets: The targets per arm. If int: An object ID. If dict: A position as an x, y, z dictionary. If numpy array: A position as an [x, y, z] numpy array.
@@ -34,7 +35,7 @@ class IkPlan(ABC):
         :param arms: The [`Arm`](../arm.md)(s) that will reach for each target.
         :param dynamic: The [`ReplicantDynamic`](../replicant_dynamic.md) data that changes per `communicate()` call.
         :param collision_detection: The [`CollisionDetection`](../collision_detection.md) rules.
-        :param previous: The previous action. Can be None.
+        :param previous: The [`ActionSummary`](../actions/action_summary.md) of the previous action. Can be None.
         :param duration: The total duration of the motion in seconds. Each [`ReachFor`](../actions/reach_for.md) action is a fraction of this. For example, if there are 2 [`ReachFor`](../actions/reach_for.md) actions, then the duration of each of them is `duration / 2`.
         :param scale_duration: If True, `duration` will be multiplied by `framerate / 60`, ensuring smoother motions at faster-than-life simulation speeds.
         :param from_held: If False, the Replicant will try to move its hand to the `target`. If True, the Replicant will try to move its held object to the `target`. This is ignored if the hand isn't holding an object.
@@ -61,13 +62,13 @@ class IkPlan(ABC):
         self.__held_objects: List[int] = [v for v in dynamic.held_objects.values() if v not in self.collision_detection.exclude_objects]
         self.collision_detection.exclude_objects.extend(self.__held_objects)
         """:field
-        The previous action. Can be None.
+        The [`ActionSummary`](../actions/action_summary.md) of the previous action. Can be None.
         """
-        self.previous: Optional[Action] = previous
+        self.previous: Optional[ActionSummary] = previous
         # Immediately end the action if the previous action was the same motion and it ended with a collision.
-        if self.collision_detection.previous_was_same and previous is not None and isinstance(previous, ArmMotion):
+        if self.collision_detection.previous_was_same and previous is not None and previous.is_type(ArmMotion):
             for arm in arms:
-                if arm in previous.collisions:
+                if arm in previous.parameters["collisions"]:
                     self.status = ActionStatus.collision
         """:field
          The targets per arm. If int: An object ID. If dict: A position as an x, y, z dictionary. If numpy array: A position as an [x, y, z] numpy array.
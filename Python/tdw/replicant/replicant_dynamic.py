@@ -1,5 +1,6 @@
-from typing import List, Dict
-from tdw.output_data import OutputData, Replicants
+from typing import List, Dict, Optional
+import numpy as np
+from tdw.agent_data.agent_frame import AgentFrame
 from tdw.object_data.transform import Transform
 from tdw.replicant.collision_detection import CollisionDetection
 from tdw.replicant.action_status import ActionStatus
@@ -28,55 +29,91 @@ class ReplicantDynamic(AgentDynamic):
         # File extensions per pass.
         self.__image_extensions: Dict[str, str] = dict()
         """:field
-        Transform data for each body part. Key = Body part ID. Value = [`Transform`](../object_data/transform.md).
+        The ID of each body part as a numpy array with shape `(n,)`. Each row of the other body part arrays is a body part in this order.
         """
-        self.body_parts: Dict[int, Transform] = dict()
+        self.body_part_ids: np.ndarray = np.zeros(shape=0, dtype=np.int32)
         """:field
-        Collision data per body part. Key = Body part ID. Value = A list of object IDs that the body part collided with.
+        The position of each body part as a numpy array with shape `(n, 3)`.
         """
-        self.collisions: Dict[int, List[int]] = dict()
+        self.body_part_positions: np.ndarray = np.zeros(shape=(0, 3), dtype=np.float32)
+        """:field
+        The rotation of each body part as a numpy array of quaternions with shape `(n, 4)`.
+        """
+        self.body_part_rotations: np.ndarray = np.zeros(shape=(0, 4), dtype=np.float32)
+        """:field
+        The forward directional vector of each body part as a numpy array with shape `(n, 3)`.
+        """
+        self.body_part_forwards: np.ndarray = np.zeros(shape=(0, 3), dtype=np.float32)
+        """:field
+        The IDs of the objects that each body part collided with as a numpy array with shape `(n, 10)`. Only elements that are True in `self.collision_mask` are valid.
+        """
+        self.collision_ids: np.ndarray = np.zeros(shape=(0, 10), dtype=np.int32)
+        """:field
+        A boolean numpy array with shape `(n, 10)`. True if the corresponding element of `self.collision_ids` is a collision.
+        """
+        self.collision_mask: np.ndarray = np.zeros(shape=(0, 10), dtype=bool)
         """:field
         This is meant for internal use only. For certain actions, the build will update the Replicant's `ActionStatus`. *Do not use this field to check the Replicant's status.* Always check `replicant.action.status` instead. 
         """
         self.output_data_status: ActionStatus = ActionStatus.ongoing
         self._frame_count: int = frame_count
-        got_data = False
-        for i in range(len(resp) - 1):
-            r_id = OutputData.get_data_type_id(resp[i])
-            # Get replicant's data.
-            if r_id == "repl":
-                replicants = Replicants(resp[i])
-                for j in range(replicants.get_num()):
-                    object_id = replicants.get_id(j)
-                    # We found the ID of this replicant.
-                    if object_id == replicant_id:
-                        # Get the held objects.
-                        if replicants.get_is_holding_left(j):
-                            self.held_objects[Arm.left] = replicants.get_held_left(j)
-                        if replicants.get_is_holding_right(j):
-                            self.held_objects[Arm.right] = replicants.get_held_right(j)
-                        # Get the body part transforms.
-                        num_body_parts = replicants.get_num_body_parts()
-                        for k in range(num_body_parts - 1):
-                            # Cache the transform.
-                            body_part_id = replicants.get_body_part_id(j, k)
-                            self.body_parts[body_part_id] = Transform(position=replicants.get_body_part_position(j, k),
-                                                                      forward=replicants.get_body_part_forward(j, k),
-                                                                      rotation=replicants.get_body_part_rotation(j, k))
-                            # Get collisions.
-                            self.collisions[body_part_id] = list()
-                            for m in range(10):
-                                if replicants.get_is_collision(j, k, m):
-                                    self.collisions[body_part_id].append(replicants.get_collision_id(j, k, m))
-                        self.transform = Transform(position=replicants.get_position(j),
-                                                   rotation=replicants.get_rotation(j),
-                                                   forward=replicants.get_forward(j))
-                        self.output_data_status = replicants.get_status(j)
-                        # Get collision data.
-                        got_data = True
-                        break
-            if got_data:
-                break
+        # These are created from the arrays when they are first accessed.
+        self._body_parts: Optional[Dict[int, Transform]] = None
+        self._collisions: Optional[Dict[int, List[int]]] = None
+        # Get replicant's data.
+        replicant = AgentFrame.get(resp).get_replicant(replicant_id=replicant_id)
+        if replicant is not None:
+            replicants, j = replicant
+            # Get the held objects.
+            if replicants.get_is_holding_left(j):
+                self.held_objects[Arm.left] = replicants.get_held_left(j)
+            if replicants.get_is_holding_right(j):
+                self.held_objects[Arm.right] = replicants.get_held_right(j)
+            # Get the body part data. These are views of the output data arrays.
+            self.body_part_ids = replicants.get_body_part_ids(j)
+            self.body_part_positions = replicants.get_body_part_positions(j)
+            self.body_part_rotations = replicants.get_body_part_rotations(j)
+            self.body_part_forwards = replicants.get_body_part_forwards(j)
+            # Get collision data.
+            self.collision_ids = replicants.get_collision_ids(j)
+            self.collision_mask = replicants.get_is_collisions(j).astype(bool)
+            self.transform = Transform(position=replicants.get_position(j),
+                                       rotation=replicants.get_rotation(j),
+                                       forward=replicants.get_forward(j))
+            self.output_data_status = replicants.get_status(j)
+
+    @property
+    def body_parts(self) -> Dict[int, Transform]:
+        """
+        :return: Transform data for each body part. Key = Body part ID. Value = [`Transform`](../object_data/transform.md). This is created from the body part arrays the first time it is accessed.
+        """
+
+        if self._body_parts is None:
+            self._body_parts = {int(body_part_id): Transform(position=position, rotation=rotation, forward=forward)
+                                for body_part_id, position, rotation, forward in zip(self.body_part_ids,
+                                                                                     self.body_part_positions,
+                                                                                     self.body_part_rotations,
+                                                                                     self.body_part_forwards)}
+        return self._body_parts
+
+    @body_parts.setter
+    def body_parts(self, value: Dict[int, Transform]) -> None:
+        self._body_parts = value
+
+    @property
+    def collisions(self) -> Dict[int, List[int]]:
+        """
+        :return: Collision data per body part. Key = Body part ID. Value = A list of object IDs that the body part collided with. This is created from `self.collision_ids` and `self.collision_mask` the first time it is accessed.
+        """
+
+        if self._collisions is None:
+            self._collisions = {int(body_part_id): ids[mask].tolist() for body_part_id, ids, mask in
+                                zip(self.body_part_ids, self.collision_ids, self.collision_mask)}
+        return self._collisions
+
+    @collisions.setter
+    def collisions(self, value: Dict[int, List[int]]) -> None:
+        self._collisions = value
 
     def get_collision_enters(self, collision_detection: CollisionDetection) -> List[int]:
         """
@@ -87,18 +124,10 @@ class ReplicantDynamic(AgentDynamic):
 
         if not collision_detection.objects:
             return []
-        enters: List[int] = list()
-        for body_part_id in self.collisions:
-            if body_part_id not in self.body_parts:
-                continue
-            for object_id in self.collisions[body_part_id]:
-                if object_id in collision_detection.exclude_objects or object_id in self.body_parts:
-                    continue
-                # Ignore held objects.
-                if collision_detection.held and (
-                        (Arm.left in self.held_objects and self.held_objects[Arm.left] == object_id) or
-                        (Arm.right in self.held_objects and self.held_objects[Arm.right] == object_id)):
-                    continue
-                enters.append(object_id)
-        return enters
-
+        # Ignore excluded objects and the Replicant's own body parts.
+        ignore: List[int] = list(collision_detection.exclude_objects) + self.body_part_ids.tolist()
+        # Ignore held objects.
+        if collision_detection.held:
+            ignore.extend(self.held_objects.values())
+        mask = self.collision_mask & ~np.isin(self.collision_ids, ignore)
+        return self.collision_ids[mask].tolist()
@@ -1,6 +1,6 @@
 from typing import List, Dict, Tuple
 import numpy as np
-from tdw.output_data import OutputData, Collision, EnvironmentCollision, DynamicRobots
+from tdw.agent_data.agent_frame import AgentFrame
 from tdw.object_data.transform import Transform
 from tdw.robot_data.robot_static import RobotStatic
 from tdw.robot_data.joint_dynamic import JointDynamic
@@ -56,53 +56,50 @@ class RobotDynamic:
         Value = A list of [environment collision data.](../collision_data/collision_obj_env.md)
         """
         self.collisions_with_environment: Dict[int, List[CollisionObjEnv]] = dict()
-        for i in range(len(resp) - 1):
-            r_id = OutputData.get_data_type_id(resp[i])
-            # Record collisions between myself and my joints or with another object.
-            if r_id == "drob":
-                dynamic_robots = DynamicRobots(resp[i])
-                self.immovable = dynamic_robots.get_immovable(static.robot_index)
-                self.transform = Transform(position=dynamic_robots.get_robot_position(static.robot_index),
-                                           rotation=dynamic_robots.get_robot_rotation(static.robot_index),
-                                           forward=dynamic_robots.get_robot_forward(static.robot_index))
-                for joint_id in static.joints:
-                    joint_index = static.joints[joint_id].dynamic_index
-                    self.joints[joint_id] = JointDynamic(joint_id=joint_id,
-                                                         position=dynamic_robots.get_joint_position(index=joint_index),
-                                                         angles=dynamic_robots.get_joint_angles(index=joint_index)[:static.joints[joint_id].num_dof],
-                                                         moving=False)
-            elif r_id == "coll":
-                collision = Collision(resp[i])
-                collider_id: int = collision.get_collider_id()
-                collidee_id: int = collision.get_collidee_id()
-                # Record collisions between one of my body parts and another of my body parts.
-                if collider_id in static.body_parts and collidee_id in static.body_parts:
+        # Get the data from the shared decode of this response.
+        frame = AgentFrame.get(resp)
+        for dynamic_robots in frame.get_output_data(r_id="drob"):
+            self.immovable = dynamic_robots.get_immovable(static.robot_index)
+            self.transform = Transform(position=dynamic_robots.get_robot_position(static.robot_index),
+                                       rotation=dynamic_robots.get_robot_rotation(static.robot_index),
+                                       forward=dynamic_robots.get_robot_forward(static.robot_index))
+            for joint_id in static.joints:
+                joint_index = static.joints[joint_id].dynamic_index
+                self.joints[joint_id] = JointDynamic(joint_id=joint_id,
+                                                     position=dynamic_robots.get_joint_position(index=joint_index),
+                                                     angles=dynamic_robots.get_joint_angles(index=joint_index)[:static.joints[joint_id].num_dof],
+                                                     moving=False)
+        # Record collisions between myself and my joints or with another object.
+        for collision in frame.get_output_data(r_id="coll"):
+            collider_id: int = collision.get_collider_id()
+            collidee_id: int = collision.get_collidee_id()
+            # Record collisions between one of my body parts and another of my body parts.
+            if collider_id in static.body_parts and collidee_id in static.body_parts:
+                key: Tuple[int, int] = (collider_id, collidee_id)
+                c = CollisionObjObj(collision)
+                # Record this collision.
+                if key not in self.collisions_with_self:
+                    self.collisions_with_self[key] = [c]
+                else:
+                    self.collisions_with_self[key].append(c)
+            # Record collisions between one of my body parts and another object.
+            elif collider_id in static.body_parts or collidee_id in static.body_parts:
+                # The body part is the first element in the tuple.
+                if collider_id in static.body_parts:
                     key: Tuple[int, int] = (collider_id, collidee_id)
-                    c = CollisionObjObj(collision)
-                    # Record this collision.
-                    if key not in self.collisions_with_self:
-                        self.collisions_with_self[key] = [c]
-                    else:
-                        self.collisions_with_self[key].append(c)
-                # Record collisions between one of my body parts and another object.
-                elif collider_id in static.body_parts or collidee_id in static.body_parts:
-                    # The body part is the first element in the tuple.
-                    if collider_id in static.body_parts:
-                        key: Tuple[int, int] = (collider_id, collidee_id)
-                    else:
-                        key: Tuple[int, int] = (collidee_id, collider_id)
-                    # Record this collision.
-                    c = CollisionObjObj(collision)
-                    if key not in self.collisions_with_self:
-                        self.collisions_with_objects[key] = [c]
-                    else:
-                        self.collisions_with_objects[key].append(c)
-            elif r_id == "enco":
-                collision = EnvironmentCollision(resp[i])
-                object_id = collision.get_object_id()
-                if object_id in static.body_parts:
-                    c = CollisionObjEnv(collision)
-                    if object_id not in self.collisions_with_environment:
-                        self.collisions_with_environment[object_id] = [c]
-                    else:
-                        self.collisions_with_environment[object_id].append(c)
+                else:
+                    key: Tuple[int, int] = (collidee_id, collider_id)
+                # Record this collision.
+                c = CollisionObjObj(collision)
+                if key not in self.collisions_with_self:
+                    self.collisions_with_objects[key] = [c]
+                else:
+                    self.collisions_with_objects[key].append(c)
+        for collision in frame.get_output_data(r_id="enco"):
+            object_id = collision.get_object_id()
+            if object_id in static.body_parts:
+                c = CollisionObjEnv(collision)
+                if object_id not in self.collisions_with_environment:
+                    self.collisions_with_environment[object_id] = [c]
+                else:
+                    self.collisions_with_environment[object_id].append(c)
@@ -0,0 +1,180 @@
+from typing import List, Dict, Tuple
+import numpy as np
+from tdw.cardinal_direction import CardinalDirection
+from tdw.librarian import SceneRecord
+from tdw.scene_data.room import Room
+from tdw.scene_data.interior_region import InteriorRegion
+
+
+class RegionIndex:
+    """
+    An index of the [`InteriorRegion`](interior_region.md) bounds of each [`Room`](room.md) in a scene. Each query accepts a numpy array of positions and tests every position against every region at once.
+
+    ```python
+    import numpy as np
+    from tdw.librarian import SceneLibrarian
+    from tdw.scene_data.region_index import RegionIndex
+
+    record = SceneLibrarian().get_record("floorplan_1a")
+    region_index = RegionIndex.get(record)
+    positions = np.array([[0, 0, 0], [3.5, 0, -1.2]])
+    rooms = region_index.get_rooms(positions)
+    ```
+    """
+
+    """:class_var
+    The order of the walls in `get_wall_distances()`.
+    """
+    WALLS: List[CardinalDirection] = [CardinalDirection.north, CardinalDirection.east, CardinalDirection.south,
+                                      CardinalDirection.west]
+    # Cached region indices. Key = The name of the scene.
+    _INDICES: Dict[str, "RegionIndex"] = dict()
+
+    def __init__(self, rooms: List[Room]):
+        """
+        :param rooms: A list of [`Room`](room.md). See: `SceneRecord.rooms`.
+        """
+
+        """:field
+        A flat list of every region. The main region of each room is listed before its alcoves. The other arrays in this index are indexed by the position of a region in this list.
+        """
+        self.regions: List[InteriorRegion] = list()
+        room_indices: List[int] = list()
+        alcoves: List[bool] = list()
+        for i, room in enumerate(rooms):
+            for j, region in enumerate([room.main_region] + room.alcoves):
+                self.regions.append(region)
+                room_indices.append(i)
+                alcoves.append(j > 0)
+        """:field
+        The index in `SceneRecord.rooms` of each region's room.
+        """
+        self.room_indices: np.ndarray = np.array(room_indices, dtype=int)
+        """:field
+        True if the region is an alcove.
+        """
+        self.alcoves: np.ndarray = np.array(alcoves, dtype=bool)
+        """:field
+        The (x_min, z_min) of each region as a numpy array with shape `(n, 2)`.
+        """
+        self.mins: np.ndarray = np.array([[r.x_min, r.z_min] for r in self.regions], dtype=np.float64).reshape(-1, 2)
+        """:field
+        The (x_max, z_max) of each region as a numpy array with shape `(n, 2)`.
+        """
+        self.maxs: np.ndarray = np.array([[r.x_max, r.z_max] for r in self.regions], dtype=np.float64).reshape(-1, 2)
+
+    @staticmethod
+    def get(scene_record: SceneRecord) -> "RegionIndex":
+        """
+        :param scene_record: The scene record.
+
+        :return: A cached `RegionIndex` of the rooms in the scene.
+        """
+
+        if scene_record.name not in RegionIndex._INDICES:
+            RegionIndex._INDICES[scene_record.name] = RegionIndex(rooms=scene_record.rooms)
+        return RegionIndex._INDICES[scene_record.name]
+
+    def get_regions(self, positions: np.ndarray) -> np.ndarray:
+        """
+        :param positions: A numpy array of positions with shape `(m, 2)` (x, z) or `(m, 3)` (x, y, z).
+
+        :return: The index in `self.regions` of the region that contains each position, or -1 if the position isn't in any region. If more than one region contains a position, this is the first region.
+        """
+
+        return RegionIndex._get_first(self._get_inside(positions=positions))
+
+    def get_rooms(self, positions: np.ndarray) -> np.ndarray:
+        """
+        :param positions: A numpy array of positions with shape `(m, 2)` (x, z) or `(m, 3)` (x, y, z).
+
+        :return: The index in `SceneRecord.rooms` of the room that contains each position, or -1 if the position isn't in any room.
+        """
+
+        regions = self.get_regions(positions=positions)
+        return np.where(regions >= 0, self.room_indices[np.maximum(regions, 0)], -1) if len(self.regions) > 0 else regions
+
+    def get_regions_containing_rectangles(self, mins: np.ndarray, maxs: np.ndarray) -> np.ndarray:
+        """
+        :param mins: The (x_min, z_min) of each rectangle as a numpy array with shape `(m, 2)`.
+        :param maxs: The (x_max, z_max) of each rectangle as a numpy array with shape `(m, 2)`.
+
+        :return: The index in `self.regions` of the region that entirely contains each rectangle, or -1 if no single region contains the rectangle.
+        """
+
+        mins = np.asarray(mins, dtype=np.float64).reshape(-1, 2)
+        maxs = np.asarray(maxs, dtype=np.float64).reshape(-1, 2)
+        inside = np.all((mins[:, np.newaxis, :] >= self.mins[np.newaxis, :, :]) &
+                        (maxs[:, np.newaxis, :] <= self.maxs[np.newaxis, :, :]), axis=2)
+        return RegionIndex._get_first(inside)
+
+    def get_wall_distances(self, positions: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        :param positions: A numpy array of positions with shape `(m, 2)` (x, z) or `(m, 3)` (x, y, z).
+
+        :return: Tuple: The distance from each position to each wall of the region that contains it as a numpy array with shape `(m, 4)` (see `RegionIndex.WALLS` for the order of the walls), and the region index of each position (see `get_regions()`). If a position isn't in a region, its distances are `inf`.
+        """
+
+        xz = RegionIndex._get_xz(positions=positions)
+        regions = self.get_regions(positions=xz)
+        distances = np.full(shape=(xz.shape[0], 4), fill_value=np.inf)
+        inside = regions >= 0
+        mins = self.mins[regions[inside]]
+        maxs = self.maxs[regions[inside]]
+        p = xz[inside]
+        distances[inside] = np.column_stack((maxs[:, 1] - p[:, 1],
+                                             maxs[:, 0] - p[:, 0],
+                                             p[:, 1] - mins[:, 1],
+                                             p[:, 0] - mins[:, 0]))
+        return distances, regions
+
+    def get_nearest_walls(self, positions: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        :param positions: A numpy array of positions with shape `(m, 2)` (x, z) or `(m, 3)` (x, y, z).
+
+        :return: Tuple: The `CardinalDirection` value of the nearest wall of the region that contains each position (or 0 if the position isn't in a region), and the distance to the wall (or `inf`).
+        """
+
+        distances, regions = self.get_wall_distances(positions=positions)
+        nearest = np.argmin(distances, axis=1)
+        walls = np.array([w.value for w in RegionIndex.WALLS], dtype=int)[nearest]
+        walls[regions < 0] = 0
+        return walls, distances[np.arange(distances.shape[0]), nearest]
+
+    def _get_inside(self, positions: np.ndarray) -> np.ndarray:
+        """
+        :param positions: A numpy array of positions with shape `(m, 2)` (x, z) or `(m, 3)` (x, y, z).
+
+        :return: A boolean numpy array with shape `(m, n)` where `n` is the number of regions. True if the position is in the region.
+        """
+
+        xz = RegionIndex._get_xz(positions=positions)
+        return np.all((xz[:, np.newaxis, :] >= self.mins[np.newaxis, :, :]) &
+                      (xz[:, np.newaxis, :] <= self.maxs[np.newaxis, :, :]), axis=2)
+
+    @staticmethod
+    def _get_first(inside: np.ndarray) -> np.ndarray:
+        """
+        :param inside: A boolean numpy array with shape `(m, n)`.
+
+        :return: The index of the first True value in each row, or -1 if there are none.
+        """
+
+        if inside.shape[1] == 0:
+            return np.full(shape=inside.shape[0], fill_value=-1, dtype=int)
+        return np.where(np.any(inside, axis=1), np.argmax(inside, axis=1), -1)
+
+    @staticmethod
+    def _get_xz(positions: np.ndarray) -> np.ndarray:
+        """
+        :param positions: A numpy array of positions with shape `(m, 2)` (x, z) or `(m, 3)` (x, y, z).
+
+        :return: The (x, z) coordinates of each position as a numpy array with shape `(m, 2)`.
+        """
+
+        positions = np.asarray(positions, dtype=np.float64)
+        if positions.ndim == 1:
+            positions = positions.reshape(1, -1)
+        if positions.shape[1] == 3:
+            return positions[:, [0, 2]]
+        return positions
@@ -1,8 +1,8 @@
 from typing import List
 import numpy as np
 from tdw.agent_data.agent_dynamic import AgentDynamic
+from tdw.agent_data.agent_frame import AgentFrame
 from tdw.object_data.rigidbody import Rigidbody
-from tdw.output_data import OutputData, Rigidbodies
 
 
 class VehicleDynamic(AgentDynamic):
@@ -18,12 +18,9 @@ class VehicleDynamic(AgentDynamic):
         self.rigidbody: Rigidbody = Rigidbody(velocity=np.zeros(shape=3),
                                               angular_velocity=np.zeros(shape=3),
                                               sleeping=False)
-        for i in range(len(resp) - 1):
-            r_id = OutputData.get_data_type_id(resp[i])
-            if r_id == "rigi":
-                rigidbodies = Rigidbodies(resp[i])
-                for j in range(rigidbodies.get_num()):
-                    if rigidbodies.get_id(j) == agent_id:
-                        self.rigidbody.velocity = rigidbodies.get_velocity(j)
-                        self.rigidbody.angular_velocity = rigidbodies.get_angular_velocity(j)
-                        self.rigidbody.sleeping = rigidbodies.get_sleeping(j)
+        rigidbody = AgentFrame.get(resp).get_rigidbody(object_id=agent_id)
+        if rigidbody is not None:
+            rigidbodies, j = rigidbody
+            self.rigidbody.velocity = rigidbodies.get_velocity(j)
+            self.rigidbody.angular_velocity = rigidbodies.get_angular_velocity(j)
+            self.rigidbody.sleeping = rigidbodies.get_sleeping(j)
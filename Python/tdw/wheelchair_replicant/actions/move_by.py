@@ -5,7 +5,7 @@ from tdw.replicant.collision_detection import CollisionDetection
 from tdw.replicant.image_frequency import ImageFrequency
 from tdw.replicant.replicant_dynamic import ReplicantDynamic
 from tdw.replicant.replicant_static import ReplicantStatic
-from tdw.replicant.actions.action import Action
+from tdw.replicant.actions.action_summary import ActionSummary
 from tdw.wheelchair_replicant.wheel_values import WheelValues
 from tdw.wheelchair_replicant.actions.wheelchair_motion import WheelchairMotion
 
@@ -29,7 +29,7 @@ class MoveBy(WheelchairMotion):
     """
 
     def __init__(self, distance: float, wheel_values: WheelValues, dynamic: ReplicantDynamic,
-                 collision_detection: CollisionDetection, previous: Optional[Action], reset_arms: bool,
+                 collision_detection: CollisionDetection, previous: Optional[ActionSummary], reset_arms: bool,
                  reset_arms_duration: float, scale_reset_arms_duration: bool, arrived_at: float,
                  collision_avoidance_distance: float, collision_avoidance_half_extents: Dict[str, float]):
         """
@@ -37,7 +37,7 @@ class MoveBy(WheelchairMotion):
         :param wheel_values: The [`WheelValues`](../wheel_values.md) that will be applied to the wheelchair's wheels.
         :param dynamic: The [`ReplicantDynamic`](../../replicant/replicant_dynamic.md) data that changes per `communicate()` call.
         :param collision_detection: The [`CollisionDetection`](../../replicant/collision_detection.md) rules.
-        :param previous: The previous action, if any.
+        :param previous: The [`ActionSummary`](../../replicant/actions/action_summary.md) of the previous action, if any.
         :param reset_arms: If True, reset the arms to their neutral positions while beginning to move.
         :param reset_arms_duration: The speed at which the arms are reset in seconds.
         :param scale_reset_arms_duration: If True, `reset_arms_duration` will be multiplied by `framerate / 60)`, ensuring smoother motions at faster-than-life simulation speeds.
@@ -61,6 +61,11 @@ class MoveBy(WheelchairMotion):
         # This will be updated per-frame.
         self._position: np.ndarray = np.zeros(shape=3)
 
+    def get_summary(self) -> ActionSummary:
+        summary = super().get_summary()
+        summary.parameters["distance"] = self.distance
+        return summary
+
     def get_initialization_commands(self, resp: List[bytes], static: ReplicantStatic, dynamic: ReplicantDynamic,
                                     image_frequency: ImageFrequency) -> List[dict]:
         self._initial_position = dynamic.transform.position
@@ -82,9 +87,9 @@ class MoveBy(WheelchairMotion):
     def _get_fail_status(self) -> ActionStatus:
         return ActionStatus.failed_to_move
 
-    def _previous_was_collision(self, previous: Optional[Action]) -> bool:
-        return self.collision_detection.previous_was_same and previous is not None and isinstance(previous, MoveBy) and \
-               previous.status == ActionStatus.collision and np.sign(previous.distance) == np.sign(self.distance)
+    def _previous_was_collision(self, previous: Optional[ActionSummary]) -> bool:
+        return self.collision_detection.previous_was_same and previous is not None and previous.is_type(MoveBy) and \
+               previous.status == ActionStatus.collision and np.sign(previous.parameters["distance"]) == np.sign(self.distance)
 
     def _is_success(self, resp: List[bytes], static: ReplicantStatic, dynamic: ReplicantDynamic) -> bool:
         distance_to_target, distance_traversed = self._get_distance(dynamic=dynamic)
@@ -7,6 +7,7 @@ from tdw.replicant.replicant_static import ReplicantStatic
 from tdw.replicant.collision_detection import CollisionDetection
 from tdw.replicant.image_frequency import ImageFrequency
 from tdw.replicant.actions.action import Action
+from tdw.replicant.actions.action_summary import ActionSummary
 from tdw.wheelchair_replicant.wheel_values import WheelValues, get_move_values
 from tdw.wheelchair_replicant.actions.turn_to import TurnTo
 from tdw.wheelchair_replicant.actions.move_by import MoveBy
@@ -30,7 +31,7 @@ class MoveTo(Action):
 
     def __init__(self, target: TARGET, turn_wheel_values: Optional[WheelValues],
                  move_wheel_values: Optional[WheelValues], dynamic: ReplicantDynamic,
-                 collision_detection: CollisionDetection, previous: Optional[Action], reset_arms: bool,
+                 collision_detection: CollisionDetection, previous: Optional[ActionSummary], reset_arms: bool,
                  reset_arms_duration: float, scale_reset_arms_duration: bool, aligned_at: float, arrived_at: float,
                  collision_avoidance_distance: float, collision_avoidance_half_extents: Dict[str, float]):
         """
@@ -39,7 +40,7 @@ class MoveTo(Action):
         :param move_wheel_values: The [`WheelValues`](../wheel_values.md) that will be applied to the wheelchair's wheels while it's moving. If None, values will be derived from the distance.
         :param dynamic: The [`ReplicantDynamic`](../../replicant/replicant_dynamic.md) data that changes per `communicate()` call.
         :param collision_detection: The [`CollisionDetection`](../../replicant/collision_detection.md) rules.
-        :param previous: The previous action, if any.
+        :param previous: The [`ActionSummary`](../../replicant/actions/action_summary.md) of the previous action, if any.
         :param reset_arms: If True, reset the arms to their neutral positions while beginning to move.
         :param reset_arms_duration: The speed at which the arms are reset in seconds.
         :param scale_reset_arms_duration: If True, `reset_arms_duration` will be multiplied by `framerate / 60)`, ensuring smoother motions at faster-than-life simulation speeds.
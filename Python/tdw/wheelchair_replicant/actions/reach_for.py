@@ -5,7 +5,7 @@ from tdw.tdw_utils import TDWUtils
 from tdw.replicant.replicant_static import ReplicantStatic
 from tdw.replicant.replicant_dynamic import ReplicantDynamic
 from tdw.replicant.actions.arm_motion import ArmMotion
-from tdw.replicant.actions.action import Action
+from tdw.replicant.actions.action_summary import ActionSummary
 from tdw.replicant.collision_detection import CollisionDetection
 from tdw.replicant.arm import Arm
 from tdw.replicant.image_frequency import ImageFrequency
@@ -29,7 +29,7 @@ class ReachFor(ArmMotion):
 
     def __init__(self, targets: List[TARGET], absolute: bool, offhand_follows: bool, arrived_at: float,
                  max_distance: float, arms: List[Arm], dynamic: ReplicantDynamic,
-                 collision_detection: CollisionDetection, previous: Optional[Action], duration: float,
+                 collision_detection: CollisionDetection, previous: Optional[ActionSummary], duration: float,
                  scale_duration: bool, from_held: bool, held_point: str):
         """
         :param targets: The target per arm. If int: An object ID. If dict: A position as an x, y, z dictionary. If numpy array: A position as an [x, y, z] numpy array.
@@ -40,7 +40,7 @@ class ReachFor(ArmMotion):
         :param arms: A list of [`Arm`](../../replicant/arm.md) values that will reach for the `target`. Example: `[Arm.left, Arm.right]`.
         :param dynamic: The [`ReplicantDynamic`](../../replicant/replicant_dynamic.md) data that changes per `communicate()` call.
         :param collision_detection: The [`CollisionDetection`](../../replicant/collision_detection.md) rules.
-        :param previous: The previous action. Can be None.
+        :param previous: The [`ActionSummary`](../../replicant/actions/action_summary.md) of the previous action. Can be None.
         :param duration: The duration of the motion in seconds.
         :param scale_duration: If True, `duration` will be multiplied by `framerate / 60)`, ensuring smoother motions at faster-than-life simulation speeds.
         :param from_held: If False, the Replicant will try to move its hand to the `target`. If True, the Replicant will try to move its held object to the `target`. This is ignored if the hand isn't holding an object.
@@ -83,6 +83,11 @@ class ReachFor(ArmMotion):
                 self._excluding_targets = True
                 self.collision_detection.exclude_objects.append(target)
 
+    def get_summary(self) -> ActionSummary:
+        summary = super().get_summary()
+        summary.target = ActionSummary.copy_target(self.targets)
+        return summary
+
     def get_initialization_commands(self, resp: List[bytes], static: ReplicantStatic, dynamic: ReplicantDynamic,
                                     image_frequency: ImageFrequency) -> List[dict]:
         commands = super().get_initialization_commands(resp=resp, static=static, dynamic=dynamic,
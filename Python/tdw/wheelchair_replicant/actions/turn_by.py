@@ -3,7 +3,7 @@ import numpy as np
 from tdw.quaternion_utils import QuaternionUtils
 from tdw.replicant.replicant_static import ReplicantStatic
 from tdw.replicant.replicant_dynamic import ReplicantDynamic
-from tdw.replicant.actions.action import Action
+from tdw.replicant.actions.action_summary import ActionSummary
 from tdw.replicant.action_status import ActionStatus
 from tdw.replicant.collision_detection import CollisionDetection
 from tdw.replicant.image_frequency import ImageFrequency
@@ -32,7 +32,7 @@ class TurnBy(WheelchairMotion):
     """
 
     def __init__(self, angle: float, wheel_values: WheelValues, dynamic: ReplicantDynamic,
-                 collision_detection: CollisionDetection, previous: Optional[Action], reset_arms: bool,
+                 collision_detection: CollisionDetection, previous: Optional[ActionSummary], reset_arms: bool,
                  reset_arms_duration: float, scale_reset_arms_duration: bool, arrived_at: float,
                  collision_avoidance_distance: float, collision_avoidance_half_extents: Dict[str, float]):
         """
@@ -40,7 +40,7 @@ class TurnBy(WheelchairMotion):
         :param wheel_values: The [`WheelValues`](../wheel_values.md) that will be applied to the wheelchair's wheels.
         :param dynamic: The [`ReplicantDynamic`](../../replicant/replicant_dynamic.md) data that changes per `communicate()` call.
         :param collision_detection: The [`CollisionDetection`](../collision_detection.md) rules.
-        :param previous: The previous action, if any.
+        :param previous: The [`ActionSummary`](../../replicant/actions/action_summary.md) of the previous action, if any.
         :param reset_arms: If True, reset the arms to their neutral positions while beginning to move.
         :param reset_arms_duration: The speed at which the arms are reset in seconds.
         :param scale_reset_arms_duration: If True, `reset_arms_duration` will be multiplied by `framerate / 60)`, ensuring smoother motions at faster-than-life simulation speeds.
@@ -65,6 +65,11 @@ class TurnBy(WheelchairMotion):
                          collision_avoidance_distance=collision_avoidance_distance,
                          collision_avoidance_half_extents=collision_avoidance_half_extents)
 
+    def get_summary(self) -> ActionSummary:
+        summary = super().get_summary()
+        summary.parameters["angle"] = self.angle
+        return summary
+
     def get_initialization_commands(self, resp: List[bytes], static: ReplicantStatic, dynamic: ReplicantDynamic,
                                     image_frequency: ImageFrequency) -> List[dict]:
         self._initial_forward_vector = dynamic.transform.forward.copy()
@@ -88,9 +93,9 @@ class TurnBy(WheelchairMotion):
     def _get_fail_status(self) -> ActionStatus:
         return ActionStatus.failed_to_turn
 
-    def _previous_was_collision(self, previous: Optional[Action]) -> bool:
-        return self.collision_detection.previous_was_same and previous is not None and isinstance(previous, TurnBy) and \
-               previous.status == ActionStatus.collision and np.sign(previous.angle) == np.sign(self.angle)
+    def _previous_was_collision(self, previous: Optional[ActionSummary]) -> bool:
+        return self.collision_detection.previous_was_same and previous is not None and previous.is_type(TurnBy) and \
+               previous.status == ActionStatus.collision and np.sign(previous.parameters["angle"]) == np.sign(self.angle)
 
     def _is_success(self, resp: List[bytes], static: ReplicantStatic, dynamic: ReplicantDynamic) -> bool:
         delta_rotation: float = self._get_delta_rotation(dynamic=dynamic)
@@ -2,7 +2,7 @@ from typing import Optional, List, Dict
 import numpy as np
 from tdw.type_aliases import TARGET
 from tdw.tdw_utils import TDWUtils
-from tdw.replicant.actions.action import Action
+from tdw.replicant.actions.action_summary import ActionSummary
 from tdw.replicant.replicant_static import ReplicantStatic
 from tdw.replicant.replicant_dynamic import ReplicantDynamic
 from tdw.replicant.collision_detection import CollisionDetection
@@ -32,7 +32,7 @@ class TurnTo(TurnBy):
     """
 
     def __init__(self, target: TARGET, wheel_values: Optional[WheelValues], dynamic: ReplicantDynamic,
-                 collision_detection: CollisionDetection, previous: Optional[Action], reset_arms: bool,
+                 collision_detection: CollisionDetection, previous: Optional[ActionSummary], reset_arms: bool,
                  reset_arms_duration: float, scale_reset_arms_duration: bool, arrived_at: float,
                  collision_avoidance_distance: float, collision_avoidance_half_extents: Dict[str, float]):
         """
@@ -40,7 +40,7 @@ class TurnTo(TurnBy):
         :param wheel_values: The [`WheelValues`](../wheel_values.md) that will be applied to the wheelchair's wheels. If None, values will be derived from `angle`.
         :param dynamic: The [`ReplicantDynamic`](../../replicant/replicant_dynamic.md) data that changes per `communicate()` call.
         :param collision_detection: The [`CollisionDetection`](../../replicant/collision_detection.md) rules.
-        :param previous: The previous action, if any.
+        :param previous: The [`ActionSummary`](../../replicant/actions/action_summary.md) of the previous action, if any.
         :param reset_arms: If True, reset the arms to their neutral positions while beginning to move.
         :param reset_arms_duration: The speed at which the arms are reset in seconds.
         :param scale_reset_arms_duration: If True, `reset_arms_duration` will be multiplied by `framerate / 60)`, ensuring smoother motions at faster-than-life simulation speeds.
@@ -9,6 +9,7 @@ from tdw.replicant.replicant_dynamic import ReplicantDynamic
 from tdw.replicant.replicant_static import ReplicantStatic
 from tdw.replicant.action_status import ActionStatus
 from tdw.replicant.actions.action import Action
+from tdw.replicant.actions.action_summary import ActionSummary
 from tdw.replicant.collision_detection import CollisionDetection
 from tdw.replicant.image_frequency import ImageFrequency
 from tdw.wheelchair_replicant.wheel_values import WheelValues
@@ -20,14 +21,14 @@ class WheelchairMotion(Action, ABC):
     """
 
     def __init__(self, wheel_values: WheelValues, dynamic: ReplicantDynamic, collision_detection: CollisionDetection,
-                 previous: Optional[Action], reset_arms: bool, reset_arms_duration: float,
+                 previous: Optional[ActionSummary], reset_arms: bool, reset_arms_duration: float,
                  scale_reset_arms_duration: bool, arrived_at: float, collision_avoidance_distance: float,
                  collision_avoidance_half_extents: Dict[str, float]):
         """
         :param wheel_values: The [`WheelValues`](../wheel_values.md) that will be applied to the wheelchair's wheels.
         :param dynamic: The [`ReplicantDynamic`](../../replicant/replicant_dynamic.md) data that changes per `communicate()` call.
         :param collision_detection: The [`CollisionDetection`](../../replicant/collision_detection.md) rules.
-        :param previous: The previous action, if any.
+        :param previous: The [`ActionSummary`](../../replicant/actions/action_summary.md) of the previous action, if any.
         :param reset_arms: If True, reset the arms to their neutral positions while beginning to move.
         :param reset_arms_duration: The speed at which the arms are reset in seconds.
         :param scale_reset_arms_duration: If True, `reset_arms_duration` will be multiplied by `framerate / 60)`, ensuring smoother motions at faster-than-life simulation speeds.
@@ -262,9 +263,9 @@ class WheelchairMotion(Action, ABC):
         raise Exception()
 
     @abstractmethod
-    def _previous_was_collision(self, previous: Optional[Action]) -> bool:
+    def _previous_was_collision(self, previous: Optional[ActionSummary]) -> bool:
         """
-        :param previous: The previous action.
+        :param previous: The [`ActionSummary`](../../replicant/actions/action_summary.md) of the previous action.
 
         :return: True if we should immediately set the status to collision.
         """